@@ -17,14 +17,16 @@ import io
 
 from .options import options  # example: ezdxf.options.template_dir = 'c:\templates'
 from .tags import dxf_info
-from .tags import TagIterator
+from .tags import TagIterator, BufferedTagIterator
+from .decoding import DecodingStream
 from .importer import Importer
 from .const import DXFStructureError, DXFVersionError
 from .zipmanager import ctxZipReader
 from .rgb import int2rgb, rgb2int
 from .modern.graphics import transparency2float, float2transparency  # convert transparency integer values to floats 0..1
 
-from .std import PATTERN
+from .lazy import LazyMapping
+PATTERN = LazyMapping('ezdxf.std', 'PATTERN')  # loaded at first access
 
 def new(dxfversion='AC1009'):
     """Create a new DXF drawing.
@@ -44,8 +46,25 @@ def new(dxfversion='AC1009'):
     return Drawing.new(dxfversion)
 
 
+def streamwriter(filename, dxfversion='AC1009'):
+    """Create a new DXF drawing, which writes new model space entities straight to the file *filename*.
+
+    Returns a DXFStreamWriter() object, setup layers, styles and blocks by DXFStreamWriter.drawing before
+    opening the writer, use the writer as context manager to get the model space::
+
+        writer = ezdxf.streamwriter('big.dxf', 'AC1015')
+        with writer as msp:
+            msp.add_line((0, 0), (1, 0))
+
+    """
+    from .drawing import Drawing
+    from .dxfstreamwriter import DXFStreamWriter
+    return DXFStreamWriter(filename, Drawing.new(dxfversion))
+
+
 def read(stream):
-    """Read DXF drawing from a *stream*, which only needs a readline() method.
+    """Read DXF drawing from a *stream*, which only needs a readline() method, but streams with a read() method
+    are read faster in large blocks.
 
     read() can open drawings of following DXF versions:
     - 'AC1009': AutoCAD R12 (DXF12)
@@ -60,15 +79,63 @@ def read(stream):
     return Drawing.read(stream)
 
 
-def readfile(filename):
+def readfile(filename, lazy=False, workers=1, cache_dir=None):
     """Read DXF drawing from file *filename*.
+
+    The file is read once as byte stream, the encoding is detected from the header bytes and lines which can not
+    be decoded by the detected encoding are decoded as 'utf-8', invalid bytes are ignored.
+
+    :param filename: DXF file name
+    :param lazy: *True* for memory mapping the DXF file and parsing the entities of the ENTITIES section at first
+        access, all other sections are loaded at opening
+    :param workers: count of worker processes for parsing the entities of the ENTITIES section in parallel, ignored
+        for *lazy* loading
+    :param cache_dir: directory of the on-disk parse cache, the DXF tags of the file are stored in the cache
+        directory and loaded from there at the next opening of the unchanged file, ignored for *lazy* loading,
+        *workers* are ignored if a cache directory is given, see ParseCache()
     """
-    if not is_dxf_file(filename):
-        raise IOError("File '{}' is not a DXF file.".format(filename))
-    try:  # is it ascii code-page encoded?
-        return readfile_as_asc(filename)
-    except UnicodeDecodeError:  # try unicode and ignore errors
-        return readfile_as_utf8(filename, errors='ignore')
+    if cache_dir is not None and not lazy:
+        from .drawing import Drawing
+        from .parsecache import ParseCache
+        dwg = Drawing(iter(ParseCache(cache_dir).read_tags(filename)))
+        dwg.filename = filename
+        return dwg
+
+    with io.open(filename, mode='rb') as fp:
+        stream = DecodingStream(fp)
+        if not stream.is_dxf:
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+        if workers > 1:
+            import multiprocessing  # just for cpu_count(), single process loading does not import it
+            workers = min(workers, multiprocessing.cpu_count())
+        if not lazy and workers < 2:
+            if options.debug:
+                options.logger.debug("reading DXF file: '{}', encoding='{}'".format(filename, stream.encoding))
+            dwg = read(stream)
+            dwg.filename = filename
+            return dwg
+    dwg = readfile_lazy(filename, stream.encoding)
+    if not lazy:
+        dwg.entitydb.load_all(workers)
+    return dwg
+
+
+def iterentities(filename, types=None):
+    """Iterate over the entities of the ENTITIES section of the DXF file *filename*, without building a drawing.
+
+    :param filename: DXF file name
+    :param types: iterable of DXF types to yield, like ['INSERT', 'TEXT'], *None* for all types
+
+    Yields wrapped DXF entities, with constant memory usage. An entity is only valid until the next iteration
+    step, linked entities (ATTRIB, VERTEX) are available by Insert.attribs() and Polyline.vertices().
+    """
+    from .entityiterator import iter_entities
+    with io.open(filename, mode='rb') as fp:
+        stream = DecodingStream(fp)
+        if not stream.is_dxf:
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+        for entity in iter_entities(stream, types):
+            yield entity
 
 
 def readzip(zipfile, filename=None):
@@ -96,6 +163,21 @@ def readfile_as_asc(filename):
     return _read_encoded_file(filename, encoding=get_encoding())
 
 
+def readfile_lazy(filename, encoding=None):
+    """Read DXF drawing from file *filename*, entities of the ENTITIES section are parsed at first access.
+
+    :param filename: DXF file name
+    :param encoding: encoding of the DXF file, *None* for auto-detection
+    """
+    from .drawing import Drawing
+    if encoding is None:
+        with io.open(filename, mode='rb') as fp:
+            encoding = DecodingStream(fp).encoding
+    dwg = Drawing.read_lazy(filename, encoding)
+    dwg.filename = filename
+    return dwg
+
+
 # noinspection PyArgumentList
 def _read_encoded_file(filename, encoding='utf-8', errors='strict'):
     if options.debug:
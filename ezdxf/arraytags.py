@@ -0,0 +1,308 @@
+# Purpose: columnar tags container
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from array import array
+
+from .dxftag import DXFTag, is_point_code
+from .tags import StringIterator
+
+CODE_TYPECODE = str('h')
+POINT_TYPECODE = str('d')
+# group code marker for objects which are not DXFTag(), like CompressedTags() or temporary place holders
+FOREIGN_OBJECT = -32768
+
+
+def _pack(tag):
+    """ Returns (code, value) tuple for storage in ArrayTags(), points are stored as array('d').
+    """
+    if isinstance(tag, tuple) and len(tag) == 2:
+        code, value = tag
+        if isinstance(code, int):
+            if isinstance(value, tuple) and is_point_code(code):
+                try:
+                    value = array(POINT_TYPECODE, value)
+                except TypeError:  # keep invalid points unchanged
+                    pass
+            return code, value
+    return FOREIGN_OBJECT, tag
+
+
+def _unpack(code, value):
+    if code == FOREIGN_OBJECT:
+        return value
+    if type(value) is array:
+        value = tuple(value)
+    return DXFTag(code, value)
+
+
+class ArrayTags(object):
+    """ DXFTag() chunk with the API of Tags(), group codes are stored in an array('h'), values in a parallel list and
+    point coordinates as array('d').
+
+    Requires less memory than Tags() and searching for group codes is done by the array methods. Tags are created at
+    access, therefore the identity of returned tags is not preserved, except for foreign objects like
+    CompressedTags().
+
+    All mutations set *modified* to *True*, like Tags().
+    """
+    __slots__ = ('_codes', '_values', 'modified')
+
+    def __init__(self, iterable=None):
+        self._codes = array(CODE_TYPECODE)
+        self._values = []
+        if iterable is not None:
+            self.extend(iterable)
+        self.modified = False
+
+    def __getstate__(self):
+        return self._codes, self._values, self.modified
+
+    def __setstate__(self, state):
+        self._codes, self._values, self.modified = state
+
+    # list interface
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        for code, value in zip(self._codes, self._values):
+            yield _unpack(code, value)
+
+    def __reversed__(self):
+        for index in range(len(self._codes) - 1, -1, -1):
+            yield _unpack(self._codes[index], self._values[index])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            tags = self.__class__()
+            tags._codes = self._codes[index]
+            tags._values = self._values[index]
+            return tags
+        return _unpack(self._codes[index], self._values[index])
+
+    def __setitem__(self, index, tag):
+        self.modified = True
+        if isinstance(index, slice):
+            packed = [_pack(t) for t in tag]
+            self._codes[index] = array(CODE_TYPECODE, (code for code, value in packed))
+            self._values[index] = [value for code, value in packed]
+        else:
+            self._codes[index], self._values[index] = _pack(tag)
+
+    def __delitem__(self, index):
+        self.modified = True
+        del self._codes[index]
+        del self._values[index]
+
+    def __contains__(self, tag):
+        try:
+            self.index(tag)
+        except ValueError:
+            return False
+        return True
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "ArrayTags({!r})".format(list(self))
+
+    def append(self, tag):
+        self.modified = True
+        code, value = _pack(tag)
+        self._codes.append(code)
+        self._values.append(value)
+
+    def extend(self, tags):
+        if isinstance(tags, ArrayTags):
+            self.modified = True
+            self._codes.extend(tags._codes)
+            self._values.extend(tags._values)
+        else:
+            for tag in tags:
+                self.append(tag)
+
+    def insert(self, index, tag):
+        self.modified = True
+        code, value = _pack(tag)
+        self._codes.insert(index, code)
+        self._values.insert(index, value)
+
+    def pop(self, index=-1):
+        tag = self[index]
+        del self[index]
+        return tag
+
+    def index(self, tag):
+        code, value = _pack(tag)
+        codes = self._codes
+        values = self._values
+        for index in range(len(codes)):
+            if codes[index] == code and values[index] == value:
+                return index
+        raise ValueError(tag)
+
+    def remove(self, tag):
+        del self[self.index(tag)]
+
+    def count(self, tag):
+        return sum(1 for t in self if t == tag)
+
+    def reverse(self):
+        self.modified = True
+        self._codes.reverse()
+        self._values.reverse()
+
+    # Tags() interface
+
+    def write(self, stream):
+        write = stream.write
+        fmt = DXFTag.STRING_FORMAT
+        for code, value in zip(self._codes, self._values):
+            if code == FOREIGN_OBJECT:
+                value.write(stream)
+            elif type(value) is array:
+                for index, coord in enumerate(value):
+                    write(fmt % (code + 10 * index, coord))
+            else:
+                write(fmt % (code, value))
+
+    def get_handle(self):
+        """ Search handle of a DXFTag() chunk. Raises ValueError if handle
+        not exists.
+
+        :returns: handle as hex-string like 'FF'
+        """
+        handle = ''
+        for code, value in zip(self._codes, self._values):
+            if code in (5, 105):
+                handle = value
+                break
+        int(handle, 16)  # check for valid handle
+        return handle
+
+    def replace_handle(self, new_handle):
+        """Replace existing handle of a DXFTag() chunk.
+        """
+        for index, code in enumerate(self._codes):
+            if code in (5, 105):
+                self._values[index] = new_handle
+                return
+
+    def dxftype(self):
+        return self._values[0]
+
+    def find_first(self, code, default=ValueError):
+        """ Returns value of first DXFTag(code, ...) or default if default != ValueError, else raises ValueError.
+        """
+        try:
+            return self.get_value(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
+
+    def get_first_tag(self, code, default=ValueError):
+        """ Returns first DXFTag(code, ...) or default if default != ValueError, else raises ValueError.
+        """
+        try:
+            index = self.tag_index(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
+        return self[index]
+
+    def find_all(self, code):
+        """ Returns a list of DXFTag(code, ...).
+        """
+        return [_unpack(c, value) for c, value in zip(self._codes, self._values) if c == code]
+
+    def tag_index(self, code, start=0, end=None):
+        """ Return first index of DXFTag(code, ...).
+        """
+        codes = self._codes
+        if start == 0 and end is None:
+            try:
+                return codes.index(code)
+            except ValueError:
+                raise ValueError(code)
+        if end is None:
+            end = len(codes)
+        for index in range(start, min(end, len(codes))):
+            if codes[index] == code:
+                return index
+        raise ValueError(code)
+
+    def has_tag(self, code):
+        return code in self._codes
+
+    def update(self, code, value):
+        """ Update first existing tag, raises ValueError if tag not exists. Setting the same value is not a
+        modification.
+        """
+        index = self.tag_index(code)
+        if self[index].value != value:
+            self[index] = DXFTag(code, value)
+
+    def set_first(self, code, value):
+        """ Update first existing DXFTag(code, ...) or append a new
+        DXFTag(code, value).
+
+        """
+        try:
+            self.update(code, value)
+        except ValueError:
+            self.append(DXFTag(code, value))
+
+    def get_value(self, code):
+        index = self.tag_index(code)
+        value = self._values[index]
+        if type(value) is array:
+            value = tuple(value)
+        return value
+
+    @staticmethod
+    def from_text(text):
+        return ArrayTags(StringIterator(text))
+
+    def __copy__(self):
+        clone = self.__class__()
+        clone._codes = array(CODE_TYPECODE, self._codes)
+        clone._values = [array(POINT_TYPECODE, value) if type(value) is array else value for value in self._values]
+        return clone
+
+    def clone(self):
+        return self.__copy__()
+
+    def remove_tags(self, codes):
+        self.modified = True
+        codes = frozenset(codes)
+        values = self._values
+        keep = [index for index, code in enumerate(self._codes) if code not in codes]
+        self._codes = array(CODE_TYPECODE, (self._codes[index] for index in keep))
+        self._values = [values[index] for index in keep]
+
+    def collect_consecutive_tags(self, codes, start=0, end=None):
+        """Collect all consecutive tags with code in codes, start and end delimits the search range. A tag code not
+        in codes ends the process.
+
+        Returns the collected tags in a collection of type ArrayTags().
+        """
+        codes = frozenset(codes)
+        if end is None:
+            end = len(self)
+        index = start
+        while index < end and self._codes[index] in codes:
+            index += 1
+        return self[start:index]
@@ -49,7 +49,7 @@ class BlocksSection(object):
             for entity in entities_iterator:
                 handle = add_tags(entity)
                 if not linked_tags(entity, handle):  # also creates the link structure as side effect
-                    block.add_handle(handle)
+                    block.add_handle(handle, entity.dxftype())
             return block
 
         if tags[0] != (0, 'SECTION') or \
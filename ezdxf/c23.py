@@ -8,9 +8,14 @@ import functools
 
 PY3 = sys.version_info.major > 2
 if sys.version_info[:2] > (3, 2):
-    from collections.abc import Sequence
+    from collections.abc import Sequence, Mapping, MutableMapping
 else:
-    from collections import Sequence
+    from collections import Sequence, Mapping, MutableMapping
+
+if sys.version_info[:2] >= (3, 7):
+    ordered_dict = dict  # dicts preserve the insertion order since Python 3.7 and need less memory than OrderedDict()
+else:
+    from collections import OrderedDict as ordered_dict
 
 if PY3:
     import html
@@ -18,12 +23,14 @@ if PY3:
     basestring = str
     ustr = str
     unicode2bytes = lambda s: bytes(s, encoding='utf-8')
+    intern = sys.intern
 
 else:
     import cgi
     escape = functools.partial(cgi.escape, quote=True)
     ustr = unicode
     unicode2bytes = lambda s: s.encode('utf-8')
+    intern = lambda s: s  # Python 2.7 can not intern unicode strings
 
 
 def isstring(s):
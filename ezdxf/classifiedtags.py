@@ -5,7 +5,12 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
-from .tags import Tags, StringIterator, DXFStructureError, DXFTag, write_tags
+from itertools import chain
+
+from .tags import Tags, StringIterator, DXFStructureError, DXFTag, StructureTag, write_tags
+from .arraytags import ArrayTags
+from .options import options
+from .handle import handle_key
 
 APP_DATA_MARKER = 102
 SUBCLASS_MARKER = 100
@@ -16,15 +21,39 @@ NoneTag = DXFTag(None, None)
 
 class ClassifiedTags(object):
     """ Manage Subclasses, AppData and Extended Data """
-    __slots__ = ('subclasses', 'appdata', 'xdata', 'link')
+    __slots__ = ('subclasses', 'appdata', 'xdata', 'link', '_raw')
 
     def __init__(self, iterable=None):
         self.appdata = list()  # code == 102, keys are "{<arbitrary name>", values are Tags()
         self.subclasses = list()  # code == 100, keys are "subclassname", values are Tags()
         self.xdata = list()  # code >= 1000, keys are "APPNAME", values are Tags()
         self.link = None  # link to following entities like INSERT -> ATTRIB and POLYLINE -> VERTEX
+        self._raw = None  # (DXF text, tag lists) of unmodified entities, see set_raw_text()
         if iterable is not None:
-            self._setup(iterable)
+            if options.verbatim_passthrough:
+                self._setup_verbatim(iterable)
+            else:
+                self._setup(iterable)
+
+    def _setup_verbatim(self, iterable):
+        # the BufferedTagIterator() yields a StructureTag() as first tag, which gets the source text of the entity,
+        # after the entity has been read
+        tagstream = iter(iterable)
+        first_tag = next(tagstream, None)
+        if type(first_tag) is StructureTag:
+            self._setup(chain((DXFTag(first_tag.code, first_tag.value), ), tagstream))
+            if first_tag.source_text is not None:
+                self.set_raw_text(first_tag.source_text)
+        elif first_tag is not None:
+            self._setup(chain((first_tag, ), tagstream))
+        else:
+            self._setup(tagstream)
+
+    def __getstate__(self):
+        return self.subclasses, self.appdata, self.xdata, self.link, self._raw
+
+    def __setstate__(self, state):
+        self.subclasses, self.appdata, self.xdata, self.link, self._raw = state
 
     def __copy__(self):
         def copy(tag_lists):
@@ -49,6 +78,12 @@ class ClassifiedTags(object):
 
     def _setup(self, iterable):
         tagstream = iter(iterable)
+        use_array_tags = options.use_array_tags
+        new_tags = list if use_array_tags else Tags  # Tags() are collected without copying
+        append = list.append  # bypasses the code index and modification tracking of Tags.append()
+
+        def finish_tags(data):
+            return ArrayTags(data) if use_array_tags else data
 
         def isappdata(tag):
             return tag.code == APP_DATA_MARKER and tag.value.startswith('{')
@@ -57,53 +92,53 @@ class ClassifiedTags(object):
             """ a subclass can contain appdata, but not xdata, ends with
             SUBCLASSMARKER or XDATACODE.
             """
-            data = Tags() if starttag is None else Tags([starttag])
+            data = new_tags() if starttag is None else new_tags([starttag])
             try:
                 while True:
                     tag = next(tagstream)
                     if isappdata(tag):
                         appdatapos = len(self.appdata)
-                        data.append(DXFTag(tag.code, appdatapos))
+                        append(data, DXFTag(tag.code, appdatapos))
                         collect_appdata(tag)
                     elif tag.code in (SUBCLASS_MARKER, XDATA_MARKER):
-                        self.subclasses.append(data)
+                        self.subclasses.append(finish_tags(data))
                         return tag
                     else:
-                        data.append(tag)
+                        append(data, tag)
             except StopIteration:
                 pass
-            self.subclasses.append(data)
+            self.subclasses.append(finish_tags(data))
             return NoneTag
 
         def collect_appdata(starttag):
             """ appdata, cannot contain xdata or subclasses """
-            data = Tags([starttag])
+            data = new_tags([starttag])
             while True:
                 try:
                     tag = next(tagstream)
                 except StopIteration:
                     raise DXFStructureError("Missing closing DXFTag(102, '}') for appdata structure.")
-                data.append(tag)
+                append(data, tag)
                 if tag.code == APP_DATA_MARKER:
                     break
-            self.appdata.append(data)
+            self.appdata.append(finish_tags(data))
 
         def collect_xdata(starttag):
             """ xdata are always at the end of the entity and can not contain
             appdata or subclasses
             """
-            data = Tags([starttag])
+            data = new_tags([starttag])
             try:
                 while True:
                     tag = next(tagstream)
                     if tag.code == XDATA_MARKER:
-                        self.xdata.append(data)
+                        self.xdata.append(finish_tags(data))
                         return tag
                     else:
-                        data.append(tag)
+                        append(data, tag)
             except StopIteration:
                 pass
-            self.xdata.append(data)
+            self.xdata.append(finish_tags(data))
             return NoneTag
 
         tag = collect_subclass(None)  # preceding tags without a subclass
@@ -148,8 +183,39 @@ class ClassifiedTags(object):
                 return appdata
         raise ValueError("Application defined group '%s' does not exist." % name)
 
+    def _tag_lists(self):
+        return tuple(chain(self.subclasses, self.appdata, self.xdata))
+
+    def set_raw_text(self, text):
+        """ Store the DXF *text* of the entity, which is written by write() as long as the entity is unmodified.
+        """
+        tag_lists = self._tag_lists()
+        for tags in tag_lists:
+            if tags.modified:  # Tags() stores the flag in the instance __dict__ just after a modification
+                tags.modified = False
+        self._raw = (text, tag_lists)
+
+    def is_modified(self):
+        """ Returns *False* if the stored DXF text still represents the entity, else *True*.
+
+        An entity is modified if a tag list was mutated, see Tags.modified, or tag lists were added, removed or
+        replaced.
+        """
+        if self._raw is None:
+            return True
+        tag_lists = self._raw[1]
+        current = self._tag_lists()
+        if len(current) != len(tag_lists) or \
+                any(tags is not stored or tags.modified for tags, stored in zip(current, tag_lists)):
+            self._raw = None  # free memory, the stored DXF text is no longer valid
+            return True
+        return False
+
     def write(self, stream):
-        write_tags(stream, self)
+        if self.is_modified():
+            write_tags(stream, self)
+        else:
+            stream.write(self._raw[0])
 
     def dxftype(self):
         return self.noclass[0].value
@@ -161,6 +227,21 @@ class ClassifiedTags(object):
     def from_text(text):
         return ClassifiedTags(StringIterator(text))
 
+
+class LazyTemplate(object):
+    """ Class attribute descriptor for entity templates, the template text is parsed at first access, which is usually
+    the first call of DXFEntity.new(), and not at import time.
+    """
+    def __init__(self, text):
+        self.text = text
+        self.tags = None
+
+    def __get__(self, instance, owner):
+        if self.tags is None:
+            self.tags = ClassifiedTags.from_text(self.text)
+        return self.tags
+
+
 LINKED_ENTITIES = {
     'INSERT': 'ATTRIB',
     'POLYLINE': 'VERTEX'
@@ -179,21 +260,20 @@ def get_tags_linker():
         def attribs_follow():
             try:
                 ref_tags = tags.get_subclass('AcDbBlockReference')
-            except KeyError:
-                return False
-            else:
-                return bool(ref_tags.find_first(66, 0))
+            except KeyError:  # DXF R12 has no subclasses
+                ref_tags = tags.noclass
+            return bool(ref_tags.find_first(66, 0))
 
         dxftype = tags.dxftype()
         are_linked_tags = False  # INSERT & POLYLINE are not linked tags, they are stored in the entity space
         if vars.prev is not None:
             are_linked_tags = True  # VERTEX, ATTRIB & SEQEND are linked tags, they are NOT stored in the entity space
             if dxftype == 'SEQEND':
-                vars.prev.link = handle
+                vars.prev.link = handle_key(handle)
                 vars.prev = None
             # check for valid DXF structure just VERTEX follows POLYLINE and just ATTRIB follows INSERT
             elif dxftype == vars.expected:
-                vars.prev.link = handle
+                vars.prev.link = handle_key(handle)
                 vars.prev = tags
             else:
                 raise DXFStructureError("expected DXF entity %s or SEQEND" % dxftype)
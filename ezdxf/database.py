@@ -8,12 +8,13 @@ __author__ = "mozman <mozman@gmx.at>"
 from collections import OrderedDict
 
 from .binarydata import compress_binary_data
+from .lazyloader import EntityPlaceholder, load_placeholders
 
 
 def factory(debug=False):
     return DebugDB() if debug else EntityDB()
 
-from .handle import HandleGenerator
+from .handle import HandleGenerator, handle_key, hex_handle
 
 
 class EntityDB(object):
@@ -31,29 +32,36 @@ class EntityDB(object):
     separated classes, which are generated by the dxffactory-object.
     The dxffactory-object generates DXF-Version specific wrapper classes.
 
+    The database stores the handles as integer keys, all methods accept hex
+    strings and integer keys as handle and return hex strings.
+
     """
     def __init__(self):
         self._database = {}
         self.handles = HandleGenerator()
+        self.wrapper_cache = None  # WrapperCache() of the DXF factory, invalidated for deleted handles
 
-    def __delitem__(self, key):
-        del self._database[key]
+    def __delitem__(self, handle):
+        self.delete_handle(handle)
 
     def __getitem__(self, handle):
-        return self._database[handle]
+        return self._database[handle_key(handle)]
 
     def get(self, handle, default=None):
         try:
             return self.__getitem__(handle)
-        except KeyError:
+        except KeyError:  # also raised for invalid handles
             return default
 
     def __setitem__(self, handle, entity):
-        self._database[handle] = entity
+        self._database[handle_key(handle)] = entity
 
     def __contains__(self, handle):
         """ Database contains handle? """
-        return handle in self._database
+        try:
+            return handle_key(handle) in self._database
+        except KeyError:  # invalid handle
+            return False
 
     def __len__(self):
         """ Count of database items. """
@@ -61,11 +69,11 @@ class EntityDB(object):
 
     def __iter__(self):
         """ Iterate over all handles. """
-        return iter(self._database.keys())
+        return (hex_handle(key) for key in self._database)
 
     def keys(self):
         """ Iterate over all handles. """
-        return self._database.keys()
+        return self.__iter__()
 
     def values(self):
         """ Iterate over all entities. """
@@ -73,7 +81,7 @@ class EntityDB(object):
 
     def items(self):
         """ Iterate over all (handle, entities) pairs. """
-        return self._database.items()
+        return ((hex_handle(key), tags) for key, tags in self._database.items())
 
     def add_tags(self, tags):
         try:
@@ -88,13 +96,66 @@ class EntityDB(object):
         self.delete_handle(entity.dxf.handle)
 
     def delete_handle(self, handle):
-        del self._database[handle]
+        key = handle_key(handle)
+        del self._database[key]
+        if self.wrapper_cache is not None:
+            self.wrapper_cache.discard(key)
+
+    def modified_handles(self):
+        """ Iterate over handles of new and modified entities, which are serialized by the next save.
+        """
+        return (hex_handle(key) for key, tags in self._database.items() if tags.is_modified())
 
     def compress_binary_data(self):
         for tags in self.values():
             compress_binary_data(tags)
 
 
+class LazyEntityDB(EntityDB):
+    """ Entity database for lazy loaded drawings, stores EntityPlaceholder() objects for unparsed entities, which are
+    replaced by ClassifiedTags() at the first access by __getitem__().
+
+    The memory mapped DXF file of the *entity_index* is closed by load_all().
+    """
+    def __init__(self, entity_index=None):
+        super(LazyEntityDB, self).__init__()
+        self.entity_index = entity_index
+
+    def __getitem__(self, handle):
+        key = handle_key(handle)
+        tags = self._database[key]
+        if type(tags) is EntityPlaceholder:
+            tags = tags.load()
+            self._database[key] = tags
+        return tags
+
+    def values(self):
+        """ Iterate over all entities, loads all entities. """
+        return (self.__getitem__(key) for key in list(self._database.keys()))
+
+    def items(self):
+        """ Iterate over all (handle, entities) pairs, loads all entities. """
+        return ((hex_handle(key), self.__getitem__(key)) for key in list(self._database.keys()))
+
+    def load_all(self, workers=1):
+        """ Parse all unloaded entities, by a pool of *workers* processes if *workers* > 1, and close the memory
+        mapped DXF file.
+        """
+        placeholders = [tags for tags in self._database.values() if type(tags) is EntityPlaceholder]
+        for placeholder, tags in zip(placeholders, load_placeholders(placeholders, workers)):
+            self._database[handle_key(placeholder.handle)] = tags
+        if self.entity_index is not None:
+            self.entity_index.close()
+            self.entity_index = None
+
+    def is_loaded(self, handle):
+        return type(self._database[handle_key(handle)]) is not EntityPlaceholder
+
+    def modified_handles(self):
+        return (hex_handle(key) for key, tags in self._database.items()
+                if type(tags) is not EntityPlaceholder and tags.is_modified())
+
+
 class DebugDB(EntityDB):
     TAGFMT = "(%d, %s)"
 
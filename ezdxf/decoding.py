@@ -0,0 +1,108 @@
+# Purpose: decode binary DXF streams
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from .tags import DXFInfo
+
+BLOCK_SIZE = 1 << 20  # bytes
+FALLBACK_ENCODING = 'utf-8'
+
+
+def binary_dxf_info(data):
+    """ Returns (is_dxf, DXFInfo()) for the first bytes *data* of a DXF file.
+
+    *is_dxf* is *True* if the first tag is DXFTag(0, 'SECTION'), DXFInfo() is filled from the HEADER section as far
+    as *data* reaches.
+    """
+    info = DXFInfo()
+    lines = data.splitlines()  # '\n', '\r\n' and '\r' line endings
+    count = len(lines) - 1  # last line maybe incomplete
+    index = 0
+    while index + 1 < count and lines[index].strip() == b'999':  # skip comments
+        index += 2
+    if index + 1 >= count or lines[index].strip() != b'0' or lines[index + 1].strip() != b'SECTION':
+        return False, info
+    index += 2
+    while index + 3 < count:
+        code = lines[index].strip()
+        value = lines[index + 1].strip()
+        if code == b'0' and value == b'ENDSEC':
+            break
+        if code == b'9':
+            method = getattr(info, value[1:].decode('ascii', 'ignore'), None)
+            if method is not None:
+                method(lines[index + 3].strip().decode('ascii', 'ignore'))
+                index += 2
+        index += 2
+    return True, info
+
+
+def decode(data, encoding):
+    """ Returns the decoded text of the DXF bytes *data* and the count of lines decoded by the fallback encoding.
+
+    If *data* can not be decoded by *encoding*, just the invalid lines are decoded as 'utf-8' and invalid bytes are
+    ignored. All line endings are converted to '\n'.
+    """
+    fallback_lines = 0
+    try:
+        text = data.decode(encoding)
+    except UnicodeDecodeError:
+        lines = []
+        for line in data.splitlines(True):
+            try:
+                lines.append(line.decode(encoding))
+            except UnicodeDecodeError:
+                fallback_lines += 1
+                lines.append(line.decode(FALLBACK_ENCODING, 'ignore'))
+        text = "".join(lines)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, fallback_lines
+
+
+class DecodingStream(object):
+    """ Text stream interface for the BufferedTagIterator() on top of a binary DXF stream.
+
+    The encoding is detected from the header bytes, since DXF R2007 (AC1021) the encoding is always 'utf-8'. The
+    binary stream is decoded in blocks of complete lines, if a block can not be decoded, just the invalid lines of this
+    block are decoded as 'utf-8' and invalid bytes are ignored, so the stream is read only once.
+    """
+    def __init__(self, binary_stream, blocksize=BLOCK_SIZE):
+        self.binary_stream = binary_stream
+        self.blocksize = blocksize
+        self.fallback_lines = 0  # count of lines decoded by the fallback encoding
+        self._buffer = binary_stream.read(blocksize)
+        self.is_dxf, self.info = binary_dxf_info(self._buffer)
+        self.encoding = FALLBACK_ENCODING if self.info.version >= 'AC1021' else self.info.encoding
+
+    def read(self, size=-1):
+        """ Returns decoded text of complete lines (universal newlines), except for the last line of the stream.
+
+        A '\r' at the end of a block is kept for the next read(), it could be the first part of a '\r\n' line
+        ending.
+        """
+        if size is None or size < 0:
+            data = self._buffer + self.binary_stream.read()
+            self._buffer = b''
+            return self._decode(data)
+
+        data = self._buffer
+        while True:
+            end = max(data.rfind(b'\n'), data.rfind(b'\r', 0, len(data) - 1)) + 1
+            if end > 0 and len(data) >= size:
+                break
+            block = self.binary_stream.read(max(size, self.blocksize))
+            if not block:  # EOF
+                end = len(data)
+                break
+            data += block
+        self._buffer = data[end:]
+        return self._decode(data[:end])
+
+    def _decode(self, data):
+        text, fallback_lines = decode(data, self.encoding)
+        self.fallback_lines += fallback_lines
+        return text
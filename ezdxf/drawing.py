@@ -9,20 +9,28 @@ from datetime import datetime
 import io
 
 from . import database
-from .tags import TagIterator, DXFTag
+from .tags import BufferedTagIterator, DXFTag
 from .dxffactory import dxffactory
 from .templatefinder import TemplateFinder
+from .templatecache import template_cache
 from .options import options
 from .codepage import tocodepage, toencoding
 from .sections import Sections
 from .juliandate import juliandate
+from .lazyloader import EntityIndex
+from .extents import ExtentsEngine
 
 
 class Drawing(object):
     """ The Central Data Object
     """
-    def __init__(self, tagreader):
-        """ Create a new drawing. """
+    def __init__(self, tagreader, entity_index=None):
+        """ Create a new drawing.
+
+        :param tagreader: tag iterator
+        :param entity_index: EntityIndex() of a lazy loaded DXF file, the ENTITIES section of *tagreader* has to be
+            empty
+        """
 
         def get_rootdict():
             roothandle = self.sections.objects.roothandle()
@@ -32,14 +40,20 @@ class Drawing(object):
         self.dxfversion = 'AC1009'  # readonly
         self.encoding = 'cp1252'  # read/write
         self.filename = None  # read/write
-        self.entitydb = database.factory(debug=options.debug)
+        if entity_index is None:
+            self.entitydb = database.factory(debug=options.debug)
+        else:
+            self.entitydb = database.LazyEntityDB(entity_index)
         self.sections = Sections(tagreader, self)
         self._groups = None
+        self.vertex_arrays = {}  # POLYLINE handle -> loaded VertexArray(), see Polyline.vertex_array()
         if self.dxfversion > 'AC1009':
             self.rootdict = get_rootdict()
             self._groups = self.dxffactory.get_groups()
         else:
             self._enable_handles()
+        if entity_index is not None:
+            self.entities.load_index(entity_index)
         self.layouts = self.dxffactory.get_layouts()
 
         if self.dxfversion > 'AC1009':
@@ -175,12 +189,16 @@ class Drawing(object):
 
     @staticmethod
     def new(dxfversion='AC1009'):
-        finder = TemplateFinder(options.template_dir)
-        stream = finder.getstream(dxfversion.upper())
-        try:
-            dwg = Drawing.read(stream)
-        finally:
-            stream.close()
+        dxfversion = dxfversion.upper()
+        if options.cache_templates:
+            dwg = Drawing(iter(template_cache.get(dxfversion, options.template_dir)))
+        else:
+            finder = TemplateFinder(options.template_dir)
+            stream = finder.getstream(dxfversion)
+            try:
+                dwg = Drawing.read(stream)
+            finally:
+                stream.close()
         dwg._setup_metadata()
         return dwg
 
@@ -190,14 +208,28 @@ class Drawing(object):
     @staticmethod
     def read(stream):
         """ Open an existing drawing. """
-        tagreader = TagIterator(stream)
+        tagreader = BufferedTagIterator(stream)
         return Drawing(tagreader)
 
+    @staticmethod
+    def read_lazy(filename, encoding='cp1252'):
+        """ Open an existing drawing, entities of the ENTITIES section are parsed at first access.
+
+        The DXF file is memory mapped and stays open until all entities are loaded by entitydb.load_all(), which
+        is also done by save().
+        """
+        entity_index = EntityIndex(filename, encoding)
+        tagreader = BufferedTagIterator(entity_index.stream_without_entities())
+        return Drawing(tagreader, entity_index)
+
     def saveas(self, filename):
         self.filename = filename
         self.save()
 
     def save(self):
+        if isinstance(self.entitydb, database.LazyEntityDB):
+            # the memory mapped source file has to be closed, before it is overwritten
+            self.entitydb.load_all()
         # noinspection PyArgumentList
         with io.open(self.filename, mode='wt', encoding=self.encoding) as fp:
             self.write(fp)
@@ -207,9 +239,28 @@ class Drawing(object):
         self.sections.write(stream)
 
     def _update_metadata(self):
+        self._flush_vertex_arrays()  # creates new VERTEX entities, has to be done before setting $HANDSEED
         self.header['$TDUPDATE'] = juliandate(datetime.now())
         self.header['$HANDSEED'] = str(self._handles)
         self.header['$DWGCODEPAGE'] = tocodepage(self.encoding)
+        if options.update_extents_on_save:
+            self.update_extents()
+
+    def update_extents(self):
+        """ Set the header variables $EXTMIN and $EXTMAX to the extents of the model space, returns the extents as
+        (minx, miny, minz, maxx, maxy, maxz) tuple or *None* for an empty model space, which does not change the
+        header variables.
+        """
+        self._flush_vertex_arrays()
+        extents = ExtentsEngine(self).layout_extents(self.modelspace())
+        if extents is not None:
+            self.header['$EXTMIN'] = extents[:3]
+            self.header['$EXTMAX'] = extents[3:]
+        return extents
+
+    def _flush_vertex_arrays(self):
+        for vertex_array in list(self.vertex_arrays.values()):
+            vertex_array.flush()
 
     def _enable_handles(self):
         """ Enable 'handles' for DXF R12 to be consistent with later DXF versions.
@@ -11,7 +11,7 @@ import os
 import io
 
 from ezdxf import readfile, options
-from ezdxf.dxftag import tag_type, point_tuple, is_point_code, internal_type
+from ezdxf.dxftag import tag_type, point_tuple, is_point_code, internal_type, handle_string
 from ezdxf.c23 import escape, ustr
 from ezdxf.reflinks import get_reference_link
 from ezdxf.sections import KNOWN_SECTIONS
@@ -93,6 +93,7 @@ TAG_TYPES = {
     int: '<int>',
     float: '<float>',
     ustr: '<str>',
+    handle_string: '<hex>',
     point_tuple: '<point>',
     internal_type: '<internal>',
 }
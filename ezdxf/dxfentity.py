@@ -6,7 +6,7 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
-from .dxftag import cast_tag_value, DXFTag
+from .dxftag import cast_tag_value
 from .const import DXFStructureError
 
 
@@ -185,8 +185,7 @@ class DXFEntity(object):
     @staticmethod
     def _get_extented_type(tags, code, xtype):
         def get_point():
-            index = tags.tag_index(code)
-            return tags[index].value
+            return tags.get_value(code)
 
         if xtype == 'Point3D':
             value = get_point()
@@ -208,11 +207,7 @@ class DXFEntity(object):
         value = cast_tag_value(code, value)
 
         def set_point():
-            if tags.has_tag(code):  # replace existing tag
-                index = tags.tag_index(code)
-                tags[index] = DXFTag(code, value)
-            else:  # append new tag
-                tags.append(DXFTag(code, value))
+            tags.set_first(code, value)  # replace existing tag or append new tag
 
         if xtype == 'Point2D':
             if len(value) != 2:
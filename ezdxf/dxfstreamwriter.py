@@ -0,0 +1,208 @@
+# Purpose: write DXF entities straight to disk
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import io
+
+from .sections import KNOWN_SECTIONS
+from .handle import handle_key
+
+HANDSEED_MARKER = '$HANDSEED\n  5\n'
+HANDSEED_FORMAT = '%016X'  # fixed length, patched at closing the writer
+HANDSEED_PLACEHOLDER = HANDSEED_FORMAT % 0
+
+
+class StreamEntitySpace(object):
+    """ Replaces the entity space of a layout while streaming.
+
+    A new entity is written to the stream and removed from the entity database, when the next entity is added or at
+    flush(). The delay is required, because the GraphicsFactory methods modify new entities after adding them to the
+    layout, e.g. add_polyline2d() appends the VERTEX entities.
+    """
+    def __init__(self, entitydb, stream):
+        self._entitydb = entitydb
+        self._stream = stream
+        self._pending = None
+        self.count = 0  # count of written entities
+        self._histogram = {}  # DXF type -> count of written entities
+
+    def __len__(self):
+        return self.count if self._pending is None else self.count + 1
+
+    def __iter__(self):
+        if self._pending is not None:
+            yield self._pending
+
+    def __contains__(self, handle):
+        try:
+            return handle_key(handle) == self._pending
+        except KeyError:  # invalid handle
+            return False
+
+    def append(self, handle):
+        self.flush()
+        self._pending = handle_key(handle)
+
+    def add_handle(self, handle, dxftype=None):
+        self.append(handle)
+
+    def handles_of_types(self, dxftypes=None):
+        return iter(self)
+
+    def type_histogram(self):
+        """ Returns a dict of DXF type -> entity count of the written entities and the pending entity.
+        """
+        histogram = dict(self._histogram)
+        if self._pending is not None:
+            dxftype = self._entitydb[self._pending].dxftype()
+            histogram[dxftype] = histogram.get(dxftype, 0) + 1
+        return histogram
+
+    def flush(self):
+        """ Write pending entity and its linked entities (VERTEX, ATTRIB, SEQEND) and remove them from the entity
+        database.
+        """
+        handle = self._pending
+        if handle is None:
+            return
+        self._pending = None
+        entitydb = self._entitydb
+        dxftype = entitydb[handle].dxftype()
+        self._histogram[dxftype] = self._histogram.get(dxftype, 0) + 1
+        while handle is not None:
+            tags = entitydb[handle]
+            tags.write(self._stream)
+            entitydb.delete_handle(handle)
+            handle = tags.link
+        self.count += 1
+
+    def delete_entity(self, entity):
+        if handle_key(entity.dxf.handle) == self._pending:
+            self._pending = None
+
+    def remove_handles(self, handles):
+        """ Remove the pending entity if its handle is in *handles*, written entities can not be removed. Returns
+        count of removed handles.
+        """
+        pending = self._pending
+        if pending is not None and any(handle_key(handle) == pending for handle in handles):
+            self._pending = None
+            return 1
+        return 0
+
+    def delete_all_entities(self):
+        self._pending = None
+
+
+class DXFStreamWriter(object):
+    """ Write-only drawing, writes new model space entities straight to the file *filename*.
+
+    Header, tables and blocks of the *drawing* are written at opening the writer, therefore all layers, styles
+    and block definitions have to be created before. Model space entities created while the writer is open are
+    written to disk and removed from the entity database, memory usage does not grow with the entity count.
+
+    Usage::
+
+        writer = DXFStreamWriter('big.dxf', ezdxf.new('AC1015'))
+        writer.drawing.layers.create('LINES')
+        with writer as msp:
+            for x in range(1000000):
+                msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+
+    A new entity is written, when the next entity is added or the writer is closed, don't modify an entity after
+    adding a new one.
+    """
+    def __init__(self, filename, drawing):
+        self.filename = filename
+        self.drawing = drawing
+        self._stream = None
+        self._handseed_pos = None
+        self._modelspace = None
+        self._entity_space = None
+        self._stored_entity_space = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def count(self):
+        """ Count of streamed entities. """
+        return 0 if self._entity_space is None else len(self._entity_space)
+
+    def open(self):
+        """ Open file, write all sections until the ENTITIES section and returns the model space layout with all
+        GraphicsFactory methods.
+        """
+        if self._stream is not None:
+            raise IOError("DXFStreamWriter is already open.")
+        drawing = self.drawing
+        drawing.filename = self.filename
+        # noinspection PyArgumentList
+        self._stream = io.open(self.filename, mode='w+t', encoding=drawing.encoding)
+        drawing._update_metadata()
+        for name in KNOWN_SECTIONS:
+            if name == 'entities':
+                break
+            section = drawing.sections.get(name)
+            if section is not None:
+                if name == 'header':
+                    self._write_header(section)
+                else:
+                    section.write(self._stream)
+        self._begin_entities_section()
+        return self._modelspace
+
+    def close(self):
+        """ Write all remaining sections and close the file.
+        """
+        if self._stream is None:
+            return
+        drawing = self.drawing
+        stream = self._stream
+        self._entity_space.flush()
+        self._modelspace._entity_space = self._stored_entity_space
+        stream.write("  0\nENDSEC\n")
+        for name in KNOWN_SECTIONS[KNOWN_SECTIONS.index('entities') + 1:]:
+            section = drawing.sections.get(name)
+            if section is not None:
+                section.write(stream)
+        stream.write('  0\nEOF\n')
+        self._patch_handseed()
+        stream.close()
+        self._stream = None
+
+    def _write_header(self, header):
+        buffer = io.StringIO()
+        header.write(buffer)
+        text = buffer.getvalue()
+        pos = text.find(HANDSEED_MARKER)
+        if pos == -1:
+            self._stream.write(text)
+            return
+        pos += len(HANDSEED_MARKER)
+        self._stream.write(text[:pos])
+        self._handseed_pos = self._stream.tell()
+        self._stream.write(HANDSEED_PLACEHOLDER)
+        self._stream.write(text[text.index('\n', pos):])
+
+    def _patch_handseed(self):
+        if self._handseed_pos is None:
+            return
+        self._stream.seek(self._handseed_pos)
+        self._stream.write(HANDSEED_FORMAT % int(str(self.drawing.entitydb.handles), 16))
+
+    def _begin_entities_section(self):
+        drawing = self.drawing
+        stream = self._stream
+        stream.write("  0\nSECTION\n  2\nENTITIES\n")
+        self._modelspace = drawing.modelspace()
+        drawing.entities.get_entity_space().write(stream, first_key=self._modelspace.layout_key)  # existing entities
+        self._entity_space = StreamEntitySpace(drawing.entitydb, stream)
+        self._stored_entity_space = self._modelspace._entity_space
+        self._modelspace._entity_space = self._entity_space
@@ -7,22 +7,20 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from collections import namedtuple
-from .c23 import ustr
+from .c23 import ustr, intern
 
-DXFTag = namedtuple('DXFTag', 'code value')
-NONE_TAG = DXFTag(999999, 'NONE')
 TAG_STRING_FORMAT = '%3d\n%s\n'
+POINT2D_STRING_FORMAT = TAG_STRING_FORMAT * 2
+POINT3D_STRING_FORMAT = TAG_STRING_FORMAT * 3
 
 
-class DXFTag():
-    STRING_FORMAT = '%3d\n%s\n'
-
-    def __init__(self, code, value):
-        self.code = code
-        self.value = value
+class DXFTag(namedtuple('_DXFTag', 'code value')):
+    """ Immutable DXF tag as (code, value) tuple, without a per-instance __dict__.
 
-    def __eq__(self, other):
-        return tuple(self) == tuple(other)
+    Compares equal to plain (code, value) tuples and supports unpacking: code, value = tag
+    """
+    __slots__ = ()
+    STRING_FORMAT = '%3d\n%s\n'
 
     def __str__(self):
         code = self.code
@@ -38,15 +36,10 @@ class DXFTag():
     def __repr__(self):
         return "DXFTag({}, {})".format(self.code, self.value)
 
-    def __getitem__(self, item):
-        return (self.code, self.value)[item]
-
-    def __len__(self):
-        return 2
-
     def write(self, stream):
         stream.write(str(self))
 
+NONE_TAG = DXFTag(999999, 'NONE')
 
 
 def point_tuple(value):
@@ -65,6 +58,13 @@ def internal_type(value):
     return value
 
 
+def handle_string(value):
+    """ References to handles are interned, all tags referencing the same handle share one string object. Entity
+    handles (group code 5) are unique and not interned.
+    """
+    return intern(ustr(value))
+
+
 TYPE_TABLE = _build_type_table([
     (internal_type, (-10, )),  # spacial tags for internal use
     (ustr, range(0, 10)),
@@ -80,9 +80,10 @@ TYPE_TABLE = _build_type_table([
     (float, range(211, 240)),  # code 220, 230 belongs to extrusion direction and should not appear alone
     (int, range(270, 290)),
     (int, range(290, 300)),  # bool 1=True 0=False
-    (ustr, range(300, 370)),
+    (ustr, range(300, 320)),
+    (handle_string, range(320, 370)),  # arbitrary object handles, soft/hard pointer and owner handles
     (int, range(370, 390)),
-    (ustr, range(390, 400)),
+    (handle_string, range(390, 400)),
     (int, range(400, 410)),
     (ustr, range(410, 420)),
     (int, range(420, 430)),
@@ -90,8 +91,9 @@ TYPE_TABLE = _build_type_table([
     (int, range(440, 460)),
     (float, range(460, 470)),
     (ustr, range(470, 480)),
-    (ustr, range(480, 482)),
+    (handle_string, range(480, 482)),
     (ustr, range(999, 1010)),
+    (handle_string, [1005]),
     (point_tuple, range(1010, 1020)),
     (float, range(1020, 1060)),  # code 1020-1039 belongs to 2d/3d points and should not appear alone
     (int, range(1060, 1072)),
@@ -107,16 +109,85 @@ def is_point_tag(tag):
 
 
 def cast_tag(tag, types=TYPE_TABLE):
-    caster = types.get(tag[0], ustr)
+    return DXFTag(tag[0], _cast_value(tag[0], tag[1], types))
+
+
+def _cast_value(code, value, types=TYPE_TABLE):
+    caster = types.get(code, ustr)
     try:
-        return DXFTag(tag[0], caster(tag[1]))
+        return caster(value)
     except ValueError:
         if caster is int:  # convert float to int
-            return DXFTag(tag[0], int(float(tag[1])))
+            return int(float(value))
         else:
             raise
 
 
+def raw_tag(tag, types=TYPE_TABLE):
+    """ Returns DXFTag() for string values and RawTag() for all other values, casting is delayed until first access.
+    """
+    code, value = tag
+    caster = types.get(code, ustr)
+    if caster is ustr:
+        return DXFTag(code, value)
+    if caster is handle_string:
+        return DXFTag(code, handle_string(value))
+    return RawTag(code, value)
+
+
+class RawTag(DXFTag):
+    """ DXFTag() which stores the raw string value read from the DXF file.
+
+    The value is cast at access by the *value* attribute, indexing or unpacking, and the raw string is written
+    verbatim by write(). Tags() replaces a RawTag() by the cast DXFTag() at the first access of the value.
+    """
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return _cast_value(self.code, tuple.__getitem__(self, 1))
+
+    @property
+    def raw_value(self):
+        return tuple.__getitem__(self, 1)
+
+    def __getitem__(self, index):
+        return (self.code, self.value)[index]
+
+    def __iter__(self):
+        yield self.code
+        yield self.value
+
+    def __eq__(self, other):
+        try:
+            return (self.code, self.value) == tuple(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.code, self.value))
+
+    def __getnewargs__(self):
+        return self.code, self.raw_value
+
+    def __str__(self):
+        code = self.code
+        raw_value = self.raw_value
+        if is_point_code(code):
+            if len(raw_value) == 3:
+                return POINT3D_STRING_FORMAT % (code, raw_value[0], code + 10, raw_value[1], code + 20, raw_value[2])
+            return POINT2D_STRING_FORMAT % (code, raw_value[0], code + 10, raw_value[1])
+        else:
+            return self.STRING_FORMAT % (code, raw_value)
+
+    def cast(self):
+        """ Returns the DXFTag() with the cast value. """
+        return DXFTag(self.code, self.value)
+
+
 def cast_tag_value(code, value, types=TYPE_TABLE):
     return types.get(code, ustr)(value)
 
@@ -0,0 +1,148 @@
+# Purpose: iterate over the entities of a DXF file without building a drawing
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from .tags import BufferedTagIterator, Tags
+from .classifiedtags import ClassifiedTags, get_tags_linker, LINKED_ENTITIES
+from .database import EntityDB
+from .dxffactory import dxffactory
+from .codepage import toencoding
+from .const import DXFStructureError
+
+# DXF types with a special link structure, see get_tags_linker()
+LINK_STRUCTURE_TYPES = frozenset(list(LINKED_ENTITIES.keys()) + list(LINKED_ENTITIES.values()) + ['SEQEND'])
+
+
+class StreamDrawing(object):
+    """ Minimal drawing environment for entities yielded by iter_entities().
+
+    The entity database contains only the current entity and its linked entities (ATTRIB, VERTEX, SEQEND),
+    there are no tables, blocks or layouts.
+    """
+    def __init__(self):
+        self.dxfversion = 'AC1009'
+        self.encoding = 'cp1252'
+        self.entitydb = EntityDB()
+        self.dxffactory = dxffactory(self)
+        self.vertex_arrays = {}
+
+    def setup(self, dxfversion, encoding):
+        self.dxfversion = dxfversion
+        self.encoding = encoding
+        self.dxffactory = dxffactory(self)
+
+    def clear_entitydb(self):
+        handles = self.entitydb.handles
+        self.entitydb = EntityDB()
+        self.vertex_arrays = {}
+        self.entitydb.handles = handles  # DXF R12: keep generated handles unique
+        self.dxffactory.wrapper_cache.clear()
+        self.entitydb.wrapper_cache = self.dxffactory.wrapper_cache
+
+
+def iter_entities(stream, types=None):
+    """ Yields all entities of the ENTITIES section of the DXF *stream* as wrapped DXF entities, stops reading the
+    *stream* at the end of the ENTITIES section.
+
+    The entities are not stored in a drawing, INSERT and POLYLINE entities are yielded with their linked ATTRIB and
+    VERTEX entities, all other entities and linked entities are removed from the entity database at the next iteration.
+
+    :param stream: text stream, with read() or readline() method
+    :param types: iterable of DXF types to yield, like ['LINE', 'TEXT'], *None* for all types
+    """
+    tagreader = BufferedTagIterator(stream)
+    drawing = StreamDrawing()
+    for section_name in _iter_section_names(tagreader):
+        if section_name == 'HEADER':
+            _read_header(tagreader, drawing)
+        elif section_name == 'ENTITIES':
+            for entity in _iter_section_entities(tagreader, drawing, types):
+                yield entity
+            return
+        else:
+            _skip_section(tagreader)
+
+
+def _iter_section_names(tagreader):
+    for tag in tagreader:
+        if tag == (0, 'EOF'):
+            return
+        if tag != (0, 'SECTION'):
+            raise DXFStructureError("Expected DXFTag(0, 'SECTION') at line %d." % tagreader.lineno)
+        yield next(tagreader).value
+
+
+def _skip_section(tagreader):
+    for tag in tagreader:
+        if tag == (0, 'ENDSEC'):
+            return
+
+
+def _read_header(tagreader, drawing):
+    dxfversion = 'AC1009'
+    encoding = 'cp1252'
+    for tag in tagreader:
+        if tag == (0, 'ENDSEC'):
+            break
+        if tag.code != 9:
+            continue
+        if tag.value == '$ACADVER':
+            dxfversion = next(tagreader).value
+        elif tag.value == '$DWGCODEPAGE':
+            encoding = toencoding(next(tagreader).value)
+    drawing.setup(dxfversion, encoding)
+
+
+def _iter_entity_tags(tagreader):
+    """ Yields the entities of a section as Tags(), like TagGroups(), but without storing the whole section.
+    """
+    group = None
+    for tag in tagreader:
+        if tag.code == 0:
+            if group is not None:
+                yield group
+            if tag.value == 'ENDSEC':
+                return
+            group = Tags([tag])
+        else:
+            group.append(tag)
+    raise DXFStructureError("Missing DXFTag(0, 'ENDSEC') for ENTITIES section.")
+
+
+def _iter_section_entities(tagreader, drawing, types):
+    def wrap(handle):
+        return drawing.dxffactory.wrap_handle(handle)
+
+    if types is not None:
+        types = frozenset(types)
+    linked_tags = get_tags_linker()
+    main_handle = None  # entity stored in the entity space
+    for group in _iter_entity_tags(tagreader):
+        dxftype = group[0].value
+        if types is not None and dxftype not in types and dxftype not in LINK_STRUCTURE_TYPES:
+            # skip unwanted entities without classifying the tags
+            if main_handle is not None:
+                yield wrap(main_handle)
+                main_handle = None
+            continue
+
+        tags = ClassifiedTags(group)
+        drawing.dxffactory.modify_tags(tags)  # post read tags fixer for VERTEX!
+        handle = drawing.entitydb.add_tags(tags)
+        if linked_tags(tags, handle):  # ATTRIB, VERTEX or SEQEND of the current entity
+            continue
+
+        if main_handle is not None:
+            drawing.entitydb.delete_handle(handle)
+            yield wrap(main_handle)
+            main_handle = None
+        drawing.clear_entitydb()  # constant memory usage
+        drawing.entitydb[handle] = tags
+        if types is None or dxftype in types:
+            main_handle = handle
+
+    if main_handle is not None:
+        yield wrap(main_handle)
@@ -10,7 +10,8 @@ from itertools import islice
 from .tags import TagGroups, DXFStructureError
 from .classifiedtags import ClassifiedTags, get_tags_linker
 from .entityspace import EntitySpace, LayoutSpaces
-from .query import EntityQuery
+from .handle import hex_handle
+from .query import EntityQuery, entity_dxftypes
 
 
 class AbstractSection(object):
@@ -61,11 +62,11 @@ class AbstractSection(object):
         """ Create new DXF entity add it to th entity database and add it to the entity space.
         """
         dxf_entity = self.dxffactory.create_db_entry(_type, dxfattribs)
-        self._entity_space.add_handle(dxf_entity.dxf.handle)
+        self._entity_space.add_handle(dxf_entity.dxf.handle, dxf_entity.dxftype())
         return dxf_entity
 
     def remove_handle(self, handle):
-        self._entity_space.remove(handle)
+        self._entity_space.remove_handle(handle)
 
     # start of public interface
 
@@ -76,7 +77,9 @@ class AbstractSection(object):
         return handle in self._entity_space
 
     def query(self, query='*'):
-        return EntityQuery(iter(self), query)
+        wrap = self.dxffactory.wrap_handle
+        handles = self._entity_space.handles(entity_dxftypes(query))
+        return EntityQuery((wrap(handle) for handle in handles), query)
 
     def delete_all_entities(self):
         """ Delete all entities. """
@@ -101,7 +104,7 @@ class ObjectsSection(ClassesSection):
     name = 'objects'
 
     def roothandle(self):
-        return self._entity_space[0]
+        return hex_handle(self._entity_space[0])
 
 
 class EntitySection(AbstractSection):
@@ -111,6 +114,19 @@ class EntitySection(AbstractSection):
         layout_spaces = LayoutSpaces(drawing.entitydb, drawing.dxfversion)
         super(EntitySection, self).__init__(layout_spaces, tags, drawing)
 
+    def load_index(self, entity_index):
+        """ Add EntityPlaceholder() objects of *entity_index* to the entity database and to the layout entity spaces,
+        entities are parsed at first access.
+        """
+        entitydb = self.entitydb
+        entity_index.fix_tags = self.dxffactory.modify_tags
+        layout_spaces = self._entity_space
+        placeholders = entity_index.placeholders(self.drawing.dxfversion, entitydb.handles)
+        for handle, dxftype, key, placeholder, is_linked in placeholders:
+            entitydb[handle] = placeholder
+            if not is_linked:
+                layout_spaces.get_entity_space(key).add_handle(handle, dxftype)
+
     def get_layout_space(self, key):
         return self._entity_space.get_entity_space(key)
 
@@ -122,6 +138,11 @@ class EntitySection(AbstractSection):
             entity = dxffactory.wrap_handle(handle)
             yield entity
 
+    def type_histogram(self):
+        """ Returns a dict of DXF type -> entity count of all layouts.
+        """
+        return self._entity_space.type_histogram()
+
     # end of public interface
 
     def write(self, stream):
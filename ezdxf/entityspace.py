@@ -6,16 +6,52 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+from itertools import islice
+
 from .const import DXFStructureError
+from .c23 import ordered_dict
+from .handle import handle_key
 
 
-class EntitySpace(list):
+class EntitySpace(object):
     """An EntitySpace is a collection of drawing entities.
     The ENTITY section is such an entity space, but also blocks.
     The EntitySpace stores only handles to the drawing entity database.
+
+    The handles are stored as ordered set, as keys of an insertion ordered dict with the DXF type as value, appending,
+    membership tests and removing of handles are O(1) operations and the write order of the entities is preserved.
+    The stored handles are integer keys of the entity database, all methods accept hex strings and integer keys, the
+    iterators yield integer keys.
+
+    The EntitySpace also manages an index of the DXF types of all stored handles, which is used to select entities by
+    DXF type without wrapping them and to count entities by DXF type.
     """
     def __init__(self, entitydb):
         self._entitydb = entitydb
+        self._handles = ordered_dict()  # handle -> DXF type
+        self._type_index = {}  # DXF type -> set of handles
+
+    def __iter__(self):
+        return iter(self._handles)
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __contains__(self, handle):
+        try:
+            return handle_key(handle) in self._handles
+        except KeyError:  # invalid handle
+            return False
+
+    def __getitem__(self, index):
+        """ Returns the handle key at position *index*, requires O(n) for all handles except the first one.
+        """
+        count = len(self._handles)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('EntitySpace index out of range')
+        return next(islice(self._handles, index, None))
 
     def get_tags_by_handle(self, handle):
         return self._entitydb[handle]
@@ -26,12 +62,13 @@ class EntitySpace(list):
         except ValueError:  # no handle tag available
             # handle is not stored in tags!!!
             handle = self._entitydb.handles.next()
-        self.append(handle)
-        self._entitydb[handle] = tags
+        key = handle_key(handle)
+        self._index_handle(key, tags.dxftype())
+        self._entitydb[key] = tags
         return handle
 
     def write(self, stream):
-        for handle in self:
+        for handle in self._handles:
             # write linked entities
             while handle is not None:
                 tags = self._entitydb[handle]
@@ -40,17 +77,106 @@ class EntitySpace(list):
 
     def delete_entity(self, entity):
         # do not delete database objects - entity space just manage handles
-        self.remove(entity.dxf.handle)
+        self.remove_handle(entity.dxf.handle)
 
     def delete_all_entities(self):
         # do not delete database objects - entity space just manage handles
-        del self[:]
+        self._handles.clear()
+        self._type_index.clear()
+
+    def add_handle(self, handle, dxftype=None):
+        """ Add *handle* to entity space, the DXF type is fetched from the entity database, if *dxftype* is *None*.
+        """
+        self._index_handle(handle_key(handle), dxftype)
 
-    def add_handle(self, handle):
-        self.append(handle)
+    def remove_handle(self, handle):
+        """ Remove *handle* from entity space, raises *ValueError* if *handle* does not exist.
+        """
+        key = handle_key(handle)
+        try:
+            dxftype = self._handles.pop(key)
+        except KeyError:
+            raise ValueError("Handle '{}' not in entity space.".format(handle))
+        self._unindex_handle(key, dxftype)
+
+    def remove_handles(self, handles):
+        """ Remove all *handles* from entity space, ignores not existing handles. Returns count of removed handles.
+        """
+        pop = self._handles.pop
+        count = 0
+        for handle in handles:
+            key = handle_key(handle)
+            dxftype = pop(key, None)
+            if dxftype is not None:
+                self._unindex_handle(key, dxftype)
+                count += 1
+        return count
+
+    def _index_handle(self, key, dxftype):
+        if dxftype is None:
+            dxftype = self._entitydb[key].dxftype()
+        if key in self._handles:  # replace existing handle at the end of the entity space
+            self._unindex_handle(key, self._handles.pop(key))
+        self._handles[key] = dxftype
+        try:
+            self._type_index[dxftype].add(key)
+        except KeyError:
+            self._type_index[dxftype] = {key}
+
+    def _unindex_handle(self, key, dxftype):
+        handles = self._type_index[dxftype]
+        handles.discard(key)
+        if not len(handles):
+            del self._type_index[dxftype]
+
+    def dxftype(self, handle):
+        """ Returns DXF type of *handle* without accessing the entity database.
+        """
+        return self._handles[handle_key(handle)]
+
+    def count_type(self, dxftype):
+        """ Returns count of entities of type *dxftype*.
+        """
+        return len(self._type_index.get(dxftype, ()))
+
+    def type_histogram(self):
+        """ Returns a dict of DXF type -> entity count.
+        """
+        return dict((dxftype, len(handles)) for dxftype, handles in self._type_index.items())
+
+    def handles(self, dxftypes=None):
+        """ Iterate over all handles, restricted to entities of the DXF types *dxftypes* if not *None*, same interface
+        as LayoutSpaces.handles().
+        """
+        return self.handles_of_types(dxftypes)
+
+    def handles_of_types(self, dxftypes=None):
+        """ Iterate over the handles of all entities of the DXF types *dxftypes* in entity space order, *None* for all
+        entities.
+        """
+        if dxftypes is None:
+            return iter(self._handles)
+        type_index = self._type_index
+        dxftypes = [dxftype for dxftype in dxftypes if dxftype in type_index]
+        if len(dxftypes) == 0:
+            return iter([])
+        if sum(len(type_index[dxftype]) for dxftype in dxftypes) == len(self._handles):
+            return iter(self._handles)
+        dxftypes = frozenset(dxftypes)
+        return (handle for handle, dxftype in self._handles.items() if dxftype in dxftypes)
+
+
+def _owner_key(tags):
+    try:
+        return handle_key(tags.noclass.find_first(330, default=0))  # if no owner tag, set 0 and repair later
+    except KeyError:  # invalid owner handle, repaired like a missing owner tag
+        return 0
 
 
 class LayoutSpaces(object):
+    """ Entity spaces of all layouts, keyed by the paper space flag for DXF R12 and by the integer key of the owner
+    handle for later DXF versions, all methods accept hex strings and integer keys as layout key.
+    """
     def __init__(self, entitydb, dxfversion):
         self._layout_spaces = {}
         self._entitydb = entitydb
@@ -58,7 +184,7 @@ class LayoutSpaces(object):
         if dxfversion == 'AC1009':
             self._get_key = lambda t: t.noclass.find_first(67, default=0)  # paper space value
         else:
-            self._get_key = lambda t: t.noclass.find_first(330, default=0)  # if no owner tag, set 0 and repair later
+            self._get_key = _owner_key
 
     def __iter__(self):
         """ Iterate over all layout entity spaces.
@@ -68,18 +194,28 @@ class LayoutSpaces(object):
     def __getitem__(self, key):
         """ Get layout entity space by *key*.
         """
-        return self._layout_spaces[key]
+        return self._layout_spaces[handle_key(key)]
 
     def __len__(self):
         return sum(len(entity_space) for entity_space in self._layout_spaces.values())
 
-    def handles(self):
-        """ Iterate over all handles in all entity spaces.
+    def handles(self, dxftypes=None):
+        """ Iterate over all handles in all entity spaces, restricted to entities of the DXF types *dxftypes* if not
+        *None*.
         """
         for entity_space in self:
-            for handle in entity_space:
+            for handle in entity_space.handles_of_types(dxftypes):
                 yield handle
 
+    def type_histogram(self):
+        """ Returns a dict of DXF type -> entity count of all entity spaces.
+        """
+        histogram = {}
+        for entity_space in self:
+            for dxftype, count in entity_space.type_histogram().items():
+                histogram[dxftype] = histogram.get(dxftype, 0) + count
+        return histogram
+
     def repair_model_space(self, new_model_space_key):
         def update_entity_tags(entity_space):
             for handle in entity_space:
@@ -102,13 +238,15 @@ class LayoutSpaces(object):
 
         temp_model_space = self._layout_spaces[0]
         model_space = self.get_entity_space(new_model_space_key)
-        model_space.extend(temp_model_space)
+        for handle in temp_model_space:
+            model_space.add_handle(handle, temp_model_space.dxftype(handle))
         update_entity_tags(temp_model_space)  # just for entities in the temporary model space
         del self._layout_spaces[0]  # just delete the temporary model space, not the entities itself
 
     def get_entity_space(self, key):
         """ Get entity space by *key* or create new entity space.
         """
+        key = handle_key(key)
         try:
             entity_space = self._layout_spaces[key]
         except KeyError:  # create new entity space
@@ -132,6 +270,7 @@ class LayoutSpaces(object):
         """
         keys = set(self._layout_spaces.keys())
         if first_key is not None:
+            first_key = handle_key(first_key)
             keys.remove(first_key)
             keys = [first_key] + list(keys)
 
@@ -154,6 +293,7 @@ class LayoutSpaces(object):
     def delete_entity_space(self, key):
         """ Delete layout entity space *key*.
         """
+        key = handle_key(key)
         entity_space = self._layout_spaces[key]
         entity_space.delete_all_entities()
         del self._layout_spaces[key]
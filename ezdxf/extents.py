@@ -0,0 +1,360 @@
+# Purpose: drawing extents calculated from raw entity tags
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import math
+from array import array
+
+from . import const
+from .spatialindex import OCS, DEFAULT_EXTRUSION, arc_points, polyline_points, transform_block_bbox
+from .spatialindex import POLYFACE_FACE_RECORD, POLYFACE_MESH_VERTEX
+
+POINT_CODES = frozenset(range(10, 19))
+# entities defined in the Object Coordinate System
+OCS_TYPES = frozenset(['CIRCLE', 'ARC', 'SOLID', 'TRACE', 'TEXT', 'ATTRIB', 'INSERT', 'LWPOLYLINE', 'HATCH', 'SHAPE'])
+# entities without finite or visible extents in model space
+IGNORED_TYPES = frozenset(['RAY', 'XLINE', 'VIEWPORT', 'ATTDEF', 'SEQEND', 'BLOCK', 'ENDBLK'])
+# point codes of entities with direction vectors or axis vectors in the range of point codes
+POINT_CODES_OF_TYPE = {
+    'MTEXT': frozenset([10]),
+    'SPLINE': frozenset([10, 11]),
+    'IMAGE': frozenset([10]),
+    'WIPEOUT': frozenset([10]),
+    'TOLERANCE': frozenset([10]),
+    'LEADER': frozenset([10]),
+    'MLINE': frozenset([10, 11]),  # 12 and 13 are direction vectors
+}
+# the alignment point (11) of TEXT and ATTRIB is only used for aligned text, else it is (0, 0, 0)
+TEXT_CODES = frozenset([10])
+ALIGNED_TEXT_CODES = frozenset([10, 11])
+
+
+class PointCollector(object):
+    """ Collects x-, y- and z-coordinates in arrays, the bounding box is calculated by min() and max() of the arrays.
+    """
+    def __init__(self):
+        self.x = array('d')
+        self.y = array('d')
+        self.z = array('d')
+
+    def __len__(self):
+        return len(self.x)
+
+    def add(self, point, z=0.):
+        self.x.append(point[0])
+        self.y.append(point[1])
+        self.z.append(point[2] if len(point) > 2 else z)
+
+    def extend(self, points, z=0., ocs=None):
+        """ Add *points*, 2D points get the elevation *z*, points are transformed from OCS to WCS if *ocs* is not
+        *None*.
+        """
+        if ocs is not None and ocs.transform:
+            points = [ocs.to_wcs((p[0], p[1], p[2] if len(p) > 2 else z)) for p in points]
+        for point in points:
+            self.add(point, z)
+
+    def add_bbox(self, box):
+        if box is not None:
+            self.add(box[:3])
+            self.add(box[3:])
+
+    def bbox(self):
+        """ Returns the bounding box (minx, miny, minz, maxx, maxy, maxz) or *None* for no points.
+        """
+        if not len(self.x):
+            return None
+        return min(self.x), min(self.y), min(self.z), max(self.x), max(self.y), max(self.z)
+
+
+def first_values(tags):
+    """ Returns a dict of group code -> first value of all subclasses of *tags*.
+    """
+    values = {}
+    for subclass in tags.subclasses:
+        for tag in subclass:
+            if tag.code not in values:
+                values[tag.code] = tag.value
+    return values
+
+
+class ExtentsEngine(object):
+    """ Calculates the extents of entities from the raw tags of the entity database without wrapping the entities.
+
+    Points of group codes 10 to 18 are collected for all entities, CIRCLE and ARC entities are expanded by the radius,
+    ELLIPSE entities by the length of the major axis, bulges of LWPOLYLINE and 2D POLYLINE entities are resolved and
+    INSERT entities are resolved by the cached extents of the block definitions, HATCH entities by the edges of the
+    boundary paths. Text extents are defined by the insertion and alignment points.
+    """
+    def __init__(self, drawing):
+        self.drawing = drawing
+        self.entitydb = drawing.entitydb
+        self._blocks = {}  # block name -> extents relative to the block base point
+        self._pending_blocks = set()  # recursion guard
+        self._collectors = {
+            'CIRCLE': self._circle,
+            'ARC': self._arc,
+            'ELLIPSE': self._ellipse,
+            'LWPOLYLINE': self._lwpolyline,
+            'POLYLINE': self._polyline,
+            'INSERT': self._insert,
+            'HATCH': self._hatch,
+            'TEXT': self._text,
+            'ATTRIB': self._text,
+        }
+
+    def extents(self, handles):
+        """ Returns the extents (minx, miny, minz, maxx, maxy, maxz) of the entities *handles* or *None*.
+        """
+        points = PointCollector()
+        entitydb = self.entitydb
+        for handle in handles:
+            self.collect(entitydb[handle], points)
+        return points.bbox()
+
+    def layout_extents(self, layout):
+        # noinspection PyProtectedMember
+        return self.extents(layout._entity_space)
+
+    def block_extents(self, name):
+        """ Returns the extents of block *name* relative to the block base point or *None*.
+        """
+        try:
+            return self._blocks[name]
+        except KeyError:
+            pass
+        if name in self._pending_blocks:  # self referencing block
+            return None
+        block_layout = self.drawing.blocks.get(name)
+        if block_layout is None:
+            return None
+        self._pending_blocks.add(name)
+        try:
+            box = self.layout_extents(block_layout)
+        finally:
+            self._pending_blocks.discard(name)
+        if box is not None:
+            base_point = block_layout.block.dxf.base_point
+            bx, by = base_point[0], base_point[1]
+            bz = base_point[2] if len(base_point) > 2 else 0.
+            box = (box[0] - bx, box[1] - by, box[2] - bz, box[3] - bx, box[4] - by, box[5] - bz)
+        self._blocks[name] = box
+        return box
+
+    def collect(self, tags, points):
+        """ Add the points of entity *tags* to the PointCollector() *points*.
+        """
+        dxftype = tags.dxftype()
+        if dxftype in IGNORED_TYPES:
+            return
+        try:
+            collector = self._collectors[dxftype]
+        except KeyError:
+            self._generic(tags, dxftype, points)
+        else:
+            collector(tags, points)
+
+    @staticmethod
+    def _ocs(values):
+        return OCS(values.get(210, DEFAULT_EXTRUSION))
+
+    def _generic(self, tags, dxftype, points, codes=None):
+        if codes is None:
+            codes = POINT_CODES_OF_TYPE.get(dxftype, POINT_CODES)
+        entity_points = []
+        extrusion = None
+        for subclass in tags.subclasses:
+            for tag in subclass:
+                if tag.code in codes:
+                    entity_points.append(tag.value)
+                elif tag.code == 210:
+                    extrusion = tag.value
+        ocs = OCS(extrusion) if extrusion is not None and dxftype in OCS_TYPES else None
+        points.extend(entity_points, ocs=ocs)
+
+    def _text(self, tags, points):
+        dxftype = tags.dxftype()
+        values = first_values(tags)
+        valign_code = 74 if dxftype == 'ATTRIB' else 73  # code 73 of ATTRIB is the field length
+        is_aligned = values.get(72, 0) or values.get(valign_code, 0)
+        self._generic(tags, dxftype, points, ALIGNED_TEXT_CODES if is_aligned else TEXT_CODES)
+
+    def _circle(self, tags, points):
+        values = first_values(tags)
+        cx, cy = values[10][:2]
+        z = values[10][2] if len(values[10]) > 2 else 0.
+        r = abs(values.get(40, 0.))
+        points.extend([(cx - r, cy - r, z), (cx + r, cy - r, z), (cx - r, cy + r, z), (cx + r, cy + r, z)],
+                      ocs=self._ocs(values))
+
+    def _arc(self, tags, points):
+        values = first_values(tags)
+        center = values[10]
+        z = center[2] if len(center) > 2 else 0.
+        arc = arc_points(center, abs(values.get(40, 0.)), values.get(50, 0.), values.get(51, 360.))
+        points.extend(arc, z=z, ocs=self._ocs(values))
+
+    @staticmethod
+    def _ellipse(tags, points):
+        # conservative estimate: the sphere around the center with the radius of the major axis contains the ellipse
+        # for any ratio and extrusion
+        values = first_values(tags)
+        center = values[10]
+        z = center[2] if len(center) > 2 else 0.
+        major_axis = values.get(11, (0., 0., 0.))
+        r = math.sqrt(sum(v * v for v in major_axis))
+        points.add((center[0] - r, center[1] - r, z - r))
+        points.add((center[0] + r, center[1] + r, z + r))
+
+    def _lwpolyline(self, tags, points):
+        values = first_values(tags)
+        vertices = []  # (x, y, bulge)
+        for subclass in tags.subclasses:
+            for tag in subclass:
+                if tag.code == 10:
+                    vertices.append([tag.value[0], tag.value[1], 0.])
+                elif tag.code == 42 and len(vertices):
+                    vertices[-1][2] = tag.value
+        closed = bool(values.get(70, 0) & const.LWPOLYLINE_CLOSED)
+        points.extend(polyline_points(vertices, closed), z=values.get(38, 0.), ocs=self._ocs(values))
+
+    def _polyline(self, tags, points):
+        values = first_values(tags)
+        flags = values.get(70, 0)
+        vertices = []
+        entitydb = self.entitydb
+        handle = tags.link
+        while handle is not None:
+            vertex = entitydb[handle]
+            handle = vertex.link
+            if vertex.dxftype() == 'VERTEX':
+                vertices.append(first_values(vertex))
+        if flags & (const.POLYLINE_3D_POLYLINE | const.POLYLINE_3D_POLYMESH | const.POLYLINE_POLYFACE):  # WCS
+            for vertex in vertices:
+                vertex_flags = vertex.get(70, 0)
+                if vertex_flags & POLYFACE_FACE_RECORD and not vertex_flags & POLYFACE_MESH_VERTEX:
+                    continue  # face record of a polyface mesh has no location
+                points.add(vertex[10])
+        else:  # 2D polyline in OCS
+            elevation = values.get(10, (0., 0., 0.))
+            vertices = [(vertex[10][0], vertex[10][1], vertex.get(42, 0.)) for vertex in vertices]
+            points.extend(polyline_points(vertices, bool(flags & const.POLYLINE_CLOSED)),
+                          z=elevation[2] if len(elevation) > 2 else 0., ocs=self._ocs(values))
+
+    def _insert(self, tags, points):
+        values = first_values(tags)
+        # ATTRIB entities are linked to the INSERT entity
+        entitydb = self.entitydb
+        handle = tags.link
+        while handle is not None:
+            attrib = entitydb[handle]
+            handle = attrib.link
+            if attrib.dxftype() == 'ATTRIB':
+                self._text(attrib, points)
+        block_box = self.block_extents(values.get(2))
+        if block_box is None:
+            return
+        insert = values.get(10, (0., 0., 0.))
+        points.add_bbox(transform_block_bbox(
+            block_box,
+            insert=(insert[0], insert[1], insert[2] if len(insert) > 2 else 0.),
+            scale=(values.get(41, 1.), values.get(42, 1.), values.get(43, 1.)),
+            rotation=values.get(50, 0.),
+            columns=values.get(70, 1),
+            rows=values.get(71, 1),
+            spacing=(values.get(44, 0.), values.get(45, 0.)),
+            extrusion=values.get(210, DEFAULT_EXTRUSION),
+        ))
+
+    def _hatch(self, tags, points):
+        values = first_values(tags)
+        elevation = values.get(10, (0., 0., 0.))  # first point of subclass AcDbHatch is the elevation point
+        try:
+            hatch_tags = tags.get_subclass('AcDbHatch')
+        except KeyError:
+            return
+        points.extend(hatch_boundary_points(hatch_tags), z=elevation[2] if len(elevation) > 2 else 0.,
+                      ocs=self._ocs(values))
+
+
+HATCH_PATH_CODES = frozenset([10, 11, 12, 13, 40, 42, 50, 51, 72, 73, 74, 92, 93, 94, 95, 96, 97, 330])
+HATCH_POLYLINE_PATH = 2  # path type flag
+HATCH_LINE_EDGE, HATCH_ARC_EDGE, HATCH_ELLIPSE_EDGE, HATCH_SPLINE_EDGE = 1, 2, 3, 4
+
+
+def hatch_boundary_points(hatch_tags):
+    """ Returns the 2D OCS points of the boundary paths of the AcDbHatch subclass *hatch_tags*.
+
+    The elevation point and the seed points are not part of the boundary paths, arcs are resolved like bulges,
+    ellipse edges are expanded to the bounding box of the full ellipse and spline edges are represented by their
+    control points and fit points (convex hull).
+    """
+    paths = []
+    collect = False
+    for tag in hatch_tags:
+        if collect:
+            if tag.code not in HATCH_PATH_CODES:
+                break
+            if tag.code == 92:  # path type flags, starts a new boundary path
+                paths.append([])
+            if len(paths):
+                paths[-1].append(tag)
+        elif tag.code == 91:  # number of boundary paths
+            collect = True
+
+    boundary_points = []
+    for path in paths:
+        if path[0].value & HATCH_POLYLINE_PATH:
+            boundary_points.extend(_polyline_path_points(path))
+        else:
+            boundary_points.extend(_edge_path_points(path))
+    return boundary_points
+
+
+def _polyline_path_points(path):
+    vertices = []  # (x, y, bulge)
+    closed = False
+    for tag in path:
+        if tag.code == 10:
+            vertices.append([tag.value[0], tag.value[1], 0.])
+        elif tag.code == 42 and len(vertices):
+            vertices[-1][2] = tag.value
+        elif tag.code == 73:
+            closed = bool(tag.value)
+    return polyline_points(vertices, closed)
+
+
+def _edge_path_points(path):
+    edges = []  # (edge type, dict of first values, all points)
+    for tag in path:
+        if tag.code == 72:  # edge type, starts a new edge
+            edges.append((tag.value, {}, []))
+        elif len(edges):
+            edge_type, edge_values, all_points = edges[-1]
+            if tag.code not in edge_values:
+                edge_values[tag.code] = tag.value
+            if tag.code in (10, 11):
+                all_points.append(tag.value)
+
+    edge_points = []
+    for edge_type, edge, all_points in edges:
+        if edge_type == HATCH_LINE_EDGE:
+            edge_points.extend(all_points)
+        elif edge_type == HATCH_ARC_EDGE and 10 in edge:
+            start_angle, end_angle = edge.get(50, 0.), edge.get(51, 360.)
+            if not edge.get(73, 1):  # clockwise arc: angles are measured clockwise
+                start_angle, end_angle = 360. - end_angle, 360. - start_angle
+            edge_points.extend(arc_points(edge[10], abs(edge.get(40, 0.)), start_angle, end_angle))
+        elif edge_type == HATCH_ELLIPSE_EDGE and 10 in edge:
+            cx, cy = edge[10][:2]
+            mx, my = edge.get(11, (1., 0.))[:2]  # major axis vector relative to the center
+            ratio = edge.get(40, 1.)  # minor axis length relative to the major axis length
+            dx = math.sqrt(mx * mx + ratio * ratio * my * my)
+            dy = math.sqrt(my * my + ratio * ratio * mx * mx)
+            edge_points.extend(((cx - dx, cy - dy), (cx + dx, cy + dy)))
+        elif edge_type == HATCH_SPLINE_EDGE:  # control points and fit points
+            edge_points.extend(all_points)
+    return edge_points
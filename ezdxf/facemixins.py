@@ -6,8 +6,7 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from . import const
-from .polyfacebuilder import PolyfaceBuilder
-from itertools import chain
+from .polyfacebuilder import PolyfaceBuilder, IncrementalPolyfaceBuilder
 
 
 class PolymeshMixin(object):
@@ -100,32 +99,22 @@ class PolyfaceMixin(object):
 
     def append_faces(self, faces, dxfattribs=None):
         """ Append multiple *faces*. *faces* is a list of single faces and a single face is a list of (x, y, z)-tuples.
+        Loads the existing mesh vertices at each call, use get_face_builder() to append many batches of faces.
 
         :param faces: list of (list of (x, y, z)-tuples)
         :param dxfattribs: dict of DXF attributes
         """
-        def new_face_record():
-            dxfattribs['flags'] = const.VTX_3D_POLYFACE_MESH_VERTEX
-            return self._new_entity('VERTEX', dxfattribs)
+        builder = self.get_face_builder()
+        builder.add_faces(faces, dxfattribs)
+        builder.commit()
 
-        if dxfattribs is None:
-            dxfattribs = {}
+    def get_face_builder(self, precision=6):
+        """ Get an IncrementalPolyfaceBuilder() object for this Polyface. The builder collects faces in arrays, merges
+        vertices with nearly the same location and creates the VERTEX entities at commit().
 
-        existing_vertices, existing_faces = self.indexed_faces()
-        # existing_faces is a generator, can't append new data
-        new_faces = []
-        for face in faces:
-            # convert face point coordinates to DXF Vertex() objects.
-            face_mesh_vertices = self._points_to_dxf_vertices(face, {})
-            # index of first new vertex
-            index = len(existing_vertices)
-            existing_vertices.extend(face_mesh_vertices)
-            # create a new face_record with all indices set to 0
-            face_record = Face(new_face_record(), existing_vertices)
-            # set correct indices
-            face_record.indices = tuple(range(index, index+len(face_mesh_vertices)))
-            new_faces.append(face_record)
-        self._rebuild(chain(existing_faces, new_faces))
+        :param int precision: decimal precision for determining identical vertex locations
+        """
+        return IncrementalPolyfaceBuilder(self, precision)
 
     def _rebuild(self, faces, precision=6):
         """ Build a valid Polyface() structure out of *faces*.
@@ -5,6 +5,31 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+try:
+    INTEGER_TYPES = (int, long)
+except NameError:  # Python 3
+    INTEGER_TYPES = (int, )
+
+
+def handle_key(handle):
+    """ Returns the integer key of the hex string *handle*, integer keys are returned unchanged, raises *KeyError* for
+    invalid handles.
+
+    The entity database, the entity spaces and the link chain of linked entities store handles as integer keys, hex
+    strings are used by the DXF tags and the public interface.
+    """
+    if isinstance(handle, INTEGER_TYPES):
+        return handle
+    try:
+        return int(handle, 16)
+    except (ValueError, TypeError):  # an invalid handle is not a key of any database
+        raise KeyError(handle)
+
+
+def hex_handle(key):
+    """ Returns the hex string of the integer *key*. """
+    return "%X" % key
+
 
 class HandleGenerator(object):
     def __init__(self, start_value='1'):
@@ -15,8 +40,8 @@ class HandleGenerator(object):
         return "%X" % self._handle
 
     def next(self):
-        next_handle = self.__str__()
-        self._handle += 1
-        return next_handle
+        handle = self._handle
+        self._handle = handle + 1
+        return "%X" % handle
     __next__ = next
 
@@ -4,6 +4,7 @@
 # License: MIT License
 
 from .query import name_query
+from .handle import handle_key, hex_handle
 
 
 class Importer(object):
@@ -12,6 +13,7 @@ class Importer(object):
         self.target = target  # type of: ezdxf.Drawing
         self._renamed_blocks = {}
         self._handle_translation_table = {}
+        source._flush_vertex_arrays()  # the VERTEX entities are imported as DXF tags
         if strict_mode and not self.is_compatible():
             raise TypeError("DXF drawings are not compatible. Source version {}; Target version {}".format(
                 source.dxfversion, target.dxfversion))
@@ -213,12 +215,12 @@ class Importer(object):
                     main_target_handle = target_handle
 
                 if prev_tags is not None:
-                    prev_tags.link = target_handle
+                    prev_tags.link = handle_key(target_handle)
 
                 if new_tags.link is None:
                     break
                 else:  # clone linked tags
-                    source_handle = new_tags.link
+                    source_handle = hex_handle(new_tags.link)
                     prev_tags = new_tags
 
         return main_target_handle
@@ -0,0 +1,44 @@
+# Purpose: load expensive module level objects at first access
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from importlib import import_module
+
+from .c23 import MutableMapping
+
+
+class LazyMapping(MutableMapping):
+    """ Proxy of the mapping *name* of module *module_name*, the module is imported at first access. All operations,
+    including modifications, are delegated to the mapping of the module.
+    """
+    def __init__(self, module_name, name):
+        self._module_name = module_name
+        self._name = name
+        self._mapping = None
+
+    @property
+    def mapping(self):
+        if self._mapping is None:
+            self._mapping = getattr(import_module(self._module_name), self._name)
+        return self._mapping
+
+    def __getitem__(self, key):
+        return self.mapping[key]
+
+    def __setitem__(self, key, value):
+        self.mapping[key] = value
+
+    def __delitem__(self, key):
+        del self.mapping[key]
+
+    def __iter__(self):
+        return iter(self.mapping)
+
+    def __len__(self):
+        return len(self.mapping)
+
+    def __repr__(self):
+        return repr(self.mapping)
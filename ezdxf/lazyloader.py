@@ -0,0 +1,238 @@
+# Purpose: lazy loading of DXF entities by a memory mapped DXF file
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import io
+import mmap
+from array import array
+from contextlib import closing
+
+from .tags import BufferedTagIterator
+from .decoding import decode
+from .dxftag import DXFTag
+from .classifiedtags import ClassifiedTags, LINKED_ENTITIES
+from .const import DXFStructureError
+from .handle import handle_key
+from .options import options
+
+# tasks per worker process, smaller tasks balance the load better but increase the communication overhead
+TASKS_PER_WORKER = 4
+
+OFFSET_TYPECODE = str('q')
+
+
+class EntityPlaceholder(object):
+    """ Placeholder for an unparsed entity in the LazyEntityDB(), stores the byte range of the entity in the memory
+    mapped DXF file.
+    """
+    __slots__ = ('index', 'start', 'end', 'handle', 'link')
+
+    def __init__(self, index, start, end, handle):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.handle = handle
+        self.link = None  # link to following entities like INSERT -> ATTRIB and POLYLINE -> VERTEX
+
+    def load(self):
+        """ Parse entity and returns ClassifiedTags().
+        """
+        tags = ClassifiedTags(BufferedTagIterator(self.index.text_stream(self.start, self.end)))
+        return self.setup_tags(tags)
+
+    def setup_tags(self, tags):
+        """ Setup parsed *tags* of this entity for the usage in the drawing. """
+        tags.link = self.link
+        if self.index.fix_tags is not None:
+            self.index.fix_tags(tags)
+        noclass = tags.noclass
+        if not (noclass.has_tag(5) or noclass.has_tag(105)):  # DXF R12: handles are optional
+            noclass.insert(1, DXFTag(5, self.handle))
+        return tags
+
+
+class EntityIndex(object):
+    """ First pass over a memory mapped DXF file, records the byte offset of every entity in the ENTITIES section,
+    the DXF type, the handle, the layout key (owner handle or paperspace) and the attribs follow flag of INSERT.
+
+    No tags are cast and no tag objects are created.
+    """
+    def __init__(self, filename, encoding='cp1252'):
+        self.filename = filename
+        self.encoding = encoding
+        self.fix_tags = None  # post read tags fixer, set by the drawing
+        self._file = open(filename, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.entities_start = -1  # first byte of the entities, -1 for no ENTITIES section
+        self.entities_end = -1  # first byte of the (0, ENDSEC) tag of the ENTITIES section
+        self.starts = array(OFFSET_TYPECODE)
+        self.dxftypes = []
+        self.handles = []
+        self.owners = []
+        self.paperspace = []
+        self.attribs_follow = []
+        self._scan()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def close(self):
+        """ Close the memory mapped DXF file, unloaded EntityPlaceholder() objects of this index can not be loaded
+        afterwards.
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def _scan(self):
+        mm = self._mmap
+        readline = mm.readline
+        tell = mm.tell
+        # find ENTITIES section
+        while True:
+            code = readline().strip()
+            if not code:
+                return
+            value = readline().strip()
+            if code == b'0' and value == b'SECTION':
+                readline()
+                if readline().strip() == b'ENTITIES':
+                    break
+        self.entities_start = tell()
+
+        starts = self.starts
+        in_appdata = False
+        in_noclass = True
+        while True:
+            pos = tell()
+            code = readline().strip()
+            if not code:
+                raise DXFStructureError("Missing DXFTag(0, 'ENDSEC') for ENTITIES section.")
+            value = readline().strip()
+            if code == b'0':
+                if value == b'ENDSEC':
+                    self.entities_end = pos
+                    return
+                starts.append(pos)
+                self.dxftypes.append(value.decode('ascii', 'ignore'))
+                self.handles.append(None)
+                self.owners.append(0)
+                self.paperspace.append(0)
+                self.attribs_follow.append(False)
+                in_appdata = False
+                in_noclass = True
+            elif code == b'102':
+                in_appdata = value.startswith(b'{')
+            elif in_appdata:
+                continue
+            elif code == b'100':
+                in_noclass = False
+            elif code == b'5' or code == b'105':
+                if self.handles[-1] is None:
+                    self.handles[-1] = value.decode('ascii', 'ignore')
+            elif code == b'330':
+                if in_noclass and self.owners[-1] == 0:
+                    self.owners[-1] = value.decode('ascii', 'ignore')
+            elif code == b'67':
+                self.paperspace[-1] = int(value)
+            elif code == b'66':
+                self.attribs_follow[-1] = bool(int(value))
+
+    def text(self, start, end):
+        # same decoding as readfile(), lines with decoding errors are decoded as 'utf-8'
+        return decode(self._mmap[start:end], self.encoding)[0]
+
+    def text_stream(self, start, end):
+        return io.StringIO(self.text(start, end))
+
+    def stream_without_entities(self):
+        """ Returns a text stream of the DXF file with an empty ENTITIES section.
+        """
+        size = len(self._mmap)
+        if self.entities_start == -1:
+            return self.text_stream(0, size)
+        text = self.text(0, self.entities_start) + self.text(self.entities_end, size)
+        return io.StringIO(text)
+
+    def placeholders(self, dxfversion, handles):
+        """ Yields (handle, DXF type, layout key, placeholder, is_linked) tuples for all entities, creates the link structure of
+        POLYLINE -> VERTEX and INSERT -> ATTRIB like get_tags_linker().
+
+        :param dxfversion: DXF version of the drawing, defines the layout key
+        :param handles: handle generator for entities without handle (DXF R12)
+        """
+        layout_keys = self.paperspace if dxfversion == 'AC1009' else self.owners
+        starts = self.starts
+        count = len(starts)
+        prev = None
+        expected = ""
+        for index in range(count):
+            dxftype = self.dxftypes[index]
+            handle = self.handles[index]
+            if handle is None:
+                handle = handles.next()
+            end = starts[index + 1] if index + 1 < count else self.entities_end
+            placeholder = EntityPlaceholder(self, starts[index], end, handle)
+            is_linked = False
+            if prev is not None:
+                is_linked = True
+                if dxftype == 'SEQEND':
+                    prev.link = handle_key(handle)
+                    prev = None
+                elif dxftype == expected:
+                    prev.link = handle_key(handle)
+                    prev = placeholder
+                else:
+                    raise DXFStructureError("expected DXF entity %s or SEQEND" % dxftype)
+            elif dxftype == 'POLYLINE' or (dxftype == 'INSERT' and self.attribs_follow[index]):
+                prev = placeholder
+                expected = LINKED_ENTITIES[dxftype]
+            yield handle, dxftype, layout_keys[index], placeholder, is_linked
+
+
+def load_placeholders(placeholders, workers=1):
+    """ Returns the parsed ClassifiedTags() of all *placeholders* in the same order, parsing is done by a pool of
+    *workers* processes if *workers* > 1 and more than one CPU core is available.
+
+    All *placeholders* have to belong to the same EntityIndex().
+    """
+    if workers < 2 or len(placeholders) < 2:
+        return [placeholder.load() for placeholder in placeholders]
+
+    import multiprocessing  # not imported by 'import ezdxf', see LAZY_MODULES in tests/test_import_time.py
+    workers = min(workers, multiprocessing.cpu_count())  # more processes than cores is just overhead
+    if workers < 2:
+        return [placeholder.load() for placeholder in placeholders]
+
+    index = placeholders[0].index
+    flags = (options.use_array_tags, options.lazy_cast, options.verbatim_passthrough)
+    count = workers * TASKS_PER_WORKER
+    size = max(1, -(-len(placeholders) // count))
+    tasks = []
+    for start in range(0, len(placeholders), size):
+        ranges = [(p.start, p.end) for p in placeholders[start:start+size]]
+        tasks.append((index.filename, index.encoding, flags, ranges))
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.map(_parse_entities, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+    parsed_tags = (tags for chunk in results for tags in chunk)
+    return [placeholder.setup_tags(tags) for placeholder, tags in zip(placeholders, parsed_tags)]
+
+
+def _parse_entities(task):
+    """ Worker process function, returns a list of ClassifiedTags() for the byte ranges of a DXF file.
+    """
+    filename, encoding, flags, ranges = task
+    options.use_array_tags, options.lazy_cast, options.verbatim_passthrough = flags
+    with open(filename, 'rb') as fp, closing(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+        return [
+            ClassifiedTags(BufferedTagIterator(io.StringIO(decode(mm[start:end], encoding)[0])))
+            for start, end in ranges
+        ]
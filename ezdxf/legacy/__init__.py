@@ -63,6 +63,9 @@ the section markers and table headers present:
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+from ..options import options
+from ..wrappercache import WrapperCache
+from ..handle import handle_key
 from .headervars import VARMAP
 from . import tableentries
 from . import graphics
@@ -108,6 +111,8 @@ class LegacyDXFFactory(object):
     def __init__(self, drawing):
         self.ENTITY_WRAPPERS = dict(ENTITY_WRAPPERS)
         self.drawing = drawing
+        self.wrapper_cache = WrapperCache(options.cache_wrappers)
+        drawing.entitydb.wrapper_cache = self.wrapper_cache
 
     @property
     def entitydb(self):
@@ -134,16 +139,31 @@ class LegacyDXFFactory(object):
             raise ValueError('Unsupported entity type: %s' % type_)
 
     def wrap_entity(self, tags):
+        try:
+            handle = tags.get_handle()
+        except ValueError:  # DXF R12: entities without handle are not cached
+            return self._wrap_tags(tags)
+        return self._wrap_cached(handle, tags)
+
+    def wrap_handle(self, handle):
+        key = handle_key(handle)
+        tags = self.entitydb[key]
+        return self._wrap_cached(key, tags)
+
+    def _wrap_cached(self, handle, tags):
+        entity = self.wrapper_cache.get(handle, tags)
+        if entity is None:
+            entity = self._wrap_tags(tags)
+            self.wrapper_cache.put(handle, entity)
+        return entity
+
+    def _wrap_tags(self, tags):
         wrapper = self.ENTITY_WRAPPERS.get(tags.dxftype(), self.DEFAULT_WRAPPER)
         entity = wrapper(tags, self.drawing)
         if hasattr(entity, 'cast'):
             entity = entity.cast()
         return entity
 
-    def wrap_handle(self, handle):
-        tags = self.entitydb[handle]
-        return self.wrap_entity(tags)
-
     def create_db_entry(self, type_, dxfattribs):
         """ Create new entity and add to drawing-database. """
         handle = self.handles.next()
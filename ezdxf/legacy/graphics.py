@@ -5,12 +5,14 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
 from ..dxfentity import DXFEntity
 from .. import const
 from ..const import VERTEXNAMES
+from ..handle import handle_key
 from ..facemixins import PolyfaceMixin, PolymeshMixin
+from ..vertexarray import VertexArray, VertexPrototype
 
 class QuadrilateralMixin(object):
     def __getitem__(self, num):
@@ -71,7 +73,7 @@ LINE
 
 
 class Line(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_LINE_TPL)
+    TEMPLATE = LazyTemplate(_LINE_TPL)
     DXFATTRIBS = make_attribs({
         'start': DXFAttr(10, xtype='Point2D/3D'),
         'end': DXFAttr(11, xtype='Point2D/3D'),
@@ -93,7 +95,7 @@ POINT
 
 
 class Point(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_POINT_TPL)
+    TEMPLATE = LazyTemplate(_POINT_TPL)
     DXFATTRIBS = make_attribs({
         'location': DXFAttr(10, xtype='Point2D/3D'),
     })
@@ -116,7 +118,7 @@ CIRCLE
 
 
 class Circle(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_CIRCLE_TPL)
+    TEMPLATE = LazyTemplate(_CIRCLE_TPL)
     DXFATTRIBS = make_attribs({
         'center': DXFAttr(10, xtype='Point2D/3D'),
         'radius': DXFAttr(40),
@@ -144,7 +146,7 @@ ARC
 
 
 class Arc(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_ARC_TPL)
+    TEMPLATE = LazyTemplate(_ARC_TPL)
     DXFATTRIBS = make_attribs({
         'center': DXFAttr(10, xtype='Point2D/3D'),
         'radius': DXFAttr(40),
@@ -186,7 +188,7 @@ TRACE
 
 
 class Trace(GraphicEntity, QuadrilateralMixin):
-    TEMPLATE = ClassifiedTags.from_text(_TRACE_TPL)
+    TEMPLATE = LazyTemplate(_TRACE_TPL)
     DXFATTRIBS = make_attribs({
         'vtx0': DXFAttr(10, xtype='Point2D/3D'),
         'vtx1': DXFAttr(11, xtype='Point2D/3D'),
@@ -196,11 +198,11 @@ class Trace(GraphicEntity, QuadrilateralMixin):
 
 
 class Solid(Trace):
-    TEMPLATE = ClassifiedTags.from_text(_TRACE_TPL.replace('TRACE', 'SOLID'))
+    TEMPLATE = LazyTemplate(_TRACE_TPL.replace('TRACE', 'SOLID'))
 
 
 class Face(Trace):
-    TEMPLATE = ClassifiedTags.from_text(_TRACE_TPL.replace('TRACE', '3DFACE'))
+    TEMPLATE = LazyTemplate(_TRACE_TPL.replace('TRACE', '3DFACE'))
     DXFATTRIBS = make_attribs({
         'vtx0': DXFAttr(10, xtype='Point3D'),
         'vtx1': DXFAttr(11, xtype='Point3D'),
@@ -249,7 +251,7 @@ STANDARD
 
 
 class Text(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_TEXT_TPL)
+    TEMPLATE = LazyTemplate(_TEXT_TPL)
     DXFATTRIBS = make_attribs({
         'insert': DXFAttr(10, xtype='Point2D/3D'),
         'height': DXFAttr(40),
@@ -326,7 +328,7 @@ BLOCKNAME
 
 
 class Block(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_BLOCK_TPL)
+    TEMPLATE = LazyTemplate(_BLOCK_TPL)
     DXFATTRIBS = make_attribs({
         'name': DXFAttr(2),
         'name2': DXFAttr(3),
@@ -337,7 +339,7 @@ class Block(GraphicEntity):
 
 
 class EndBlk(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text("  0\nENDBLK\n  5\n0\n")
+    TEMPLATE = LazyTemplate("  0\nENDBLK\n  5\n0\n")
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {'handle': DXFAttr(5)}))
 
 _INSERT_TPL = """  0
@@ -369,7 +371,7 @@ BLOCKNAME
 
 
 class Insert(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_INSERT_TPL)
+    TEMPLATE = LazyTemplate(_INSERT_TPL)
     DXFATTRIBS = make_attribs({
         'attribs_follow': DXFAttr(66, default=0),
         'name': DXFAttr(2),
@@ -458,8 +460,8 @@ class Insert(GraphicEntity):
             prev = attribs[-1]
             seqend = self.dxffactory.wrap_handle(prev.tags.link)
 
-        prev.tags.link = entity.dxf.handle
-        entity.tags.link = seqend.dxf.handle
+        prev.tags.link = handle_key(entity.dxf.handle)
+        entity.tags.link = handle_key(seqend.dxf.handle)
         self.dxf.attribs_follow = 1
 
     def destroy(self):
@@ -477,7 +479,7 @@ class Insert(GraphicEntity):
 
 
 class SeqEnd(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text("  0\nSEQEND\n  5\n0\n")
+    TEMPLATE = LazyTemplate("  0\nSEQEND\n  5\n0\n")
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'paperspace': DXFAttr(67, default=0),
@@ -531,7 +533,7 @@ STANDARD
 
 
 class Attdef(Text):
-    TEMPLATE = ClassifiedTags.from_text(_ATTDEF_TPL)
+    TEMPLATE = LazyTemplate(_ATTDEF_TPL)
     DXFATTRIBS = make_attribs({
         'insert': DXFAttr(10, xtype='Point2D/3D'),
         'height': DXFAttr(40),
@@ -596,7 +598,7 @@ STANDARD
 
 
 class Attrib(Text):
-    TEMPLATE = ClassifiedTags.from_text(_ATTRIB_TPL)
+    TEMPLATE = LazyTemplate(_ATTRIB_TPL)
     DXFATTRIBS = make_attribs({
         'insert': DXFAttr(10, xtype='Point2D/3D'),
         'height': DXFAttr(40),
@@ -635,7 +637,7 @@ POLYLINE
 
 class Polyline(GraphicEntity):
     ANY3D = const.POLYLINE_3D_POLYLINE + const.POLYLINE_3D_POLYMESH + const.POLYLINE_POLYFACE
-    TEMPLATE = ClassifiedTags.from_text(_POLYLINE_TPL)
+    TEMPLATE = LazyTemplate(_POLYLINE_TPL)
     DXFATTRIBS = make_attribs({
         'elevation': DXFAttr(10, xtype='Point2D/3D'),
         'flags': DXFAttr(70, default=0),
@@ -650,7 +652,7 @@ class Polyline(GraphicEntity):
 
     def post_new_hook(self):
         seqend = self._new_entity('SEQEND', {})
-        self.tags.link = seqend.dxf.handle
+        self.tags.link = handle_key(seqend.dxf.handle)
 
     def get_vertex_flags(self):
         return const.VERTEX_FLAGS[self.get_mode()]
@@ -693,7 +695,24 @@ class Polyline(GraphicEntity):
         if n_close:
             self.n_close()
 
+    def vertex_array(self):
+        """ Returns the vertices as VertexArray(), changes are written back to the VERTEX entities before the drawing
+        is written or the vertices are accessed by the Polyline() methods.
+        """
+        vertex_array = self.drawing.vertex_arrays.get(self.dxf.handle)
+        if vertex_array is None:
+            vertex_array = VertexArray(self)
+        return vertex_array
+
+    def _flush_vertex_array(self):
+        drawing = self.drawing
+        if drawing is not None and len(drawing.vertex_arrays):
+            vertex_array = drawing.vertex_arrays.get(self.dxf.handle)
+            if vertex_array is not None:
+                vertex_array.flush()
+
     def __len__(self):
+        self._flush_vertex_array()
         count = 0
         db = self.entitydb
         tags = db[self.tags.link]
@@ -703,6 +722,7 @@ class Polyline(GraphicEntity):
         return count
 
     def __getitem__(self, pos):
+        self._flush_vertex_array()
         count = 0
         db = self.entitydb
         tags = db[self.tags.link]
@@ -714,6 +734,7 @@ class Polyline(GraphicEntity):
         raise IndexError("vertex index out of range")
 
     def vertices(self):
+        self._flush_vertex_array()
         wrapper = self.dxffactory.wrap_handle
         handle = self.tags.link
         while handle is not None:
@@ -737,10 +758,11 @@ class Polyline(GraphicEntity):
     @staticmethod
     def _insert_after(prev_vertex, new_vertex):
         succ = prev_vertex.tags.link
-        prev_vertex.tags.link = new_vertex.dxf.handle
+        prev_vertex.tags.link = handle_key(new_vertex.dxf.handle)
         new_vertex.tags.link = succ
 
     def _get_last_vertex(self):
+        self._flush_vertex_array()
         db = self.entitydb
         tags = self.tags
         handle = self.dxf.handle
@@ -758,6 +780,7 @@ class Polyline(GraphicEntity):
         """
         if dxfattribs is None:
             dxfattribs = {}
+        self._flush_vertex_array()
         if pos > 0:
             insert_vertex = self.__getitem__(pos - 1)
         else:
@@ -783,13 +806,23 @@ class Polyline(GraphicEntity):
         :param dxfattribs: dict of DXF attributes
         """
         dxfattribs['flags'] = dxfattribs.get('flags', 0) | self.get_vertex_flags()
+        # all vertices are copies of one prototype, which is much faster than setting all DXF attributes of each vertex
+        prototype = VertexPrototype(self, dxfattribs)
+        db = self.entitydb
+        handles = db.handles
+        wrap = self.dxffactory.wrap_handle
+        location = self.dxffactory.ENTITY_WRAPPERS['VERTEX'].DXFATTRIBS['location']
         vertices = []
         for point in points:
-            dxfattribs['location'] = point
-            vertices.append(self._new_entity('VERTEX', dxfattribs))
+            handle = handles.next()
+            tags = prototype.new_tags(handle)
+            tags.subclasses[location.subclass].set_first(location.code, tuple(point))
+            db[handle] = tags
+            vertices.append(wrap(handle))
         return vertices
 
     def delete_vertices(self, pos, count=1):
+        self._flush_vertex_array()
         db = self.entitydb
         prev_vertex = self.__getitem__(pos-1).tags if pos > 0 else self.tags
         vertex = db[prev_vertex.link]
@@ -810,13 +843,21 @@ class Polyline(GraphicEntity):
     def cast(self):
         mode = self.get_mode()
         if mode == 'AcDbPolyFaceMesh':
-            return Polyface.convert(self)
+            entity = Polyface.convert(self)
         elif mode == 'AcDbPolygonMesh':
-            return Polymesh.convert(self)
+            entity = Polymesh.convert(self)
         else:
             return self
+        self._discard_cached_wrapper()
+        return entity
+
+    def _discard_cached_wrapper(self):
+        # type change: a cached wrapper of this handle is replaced by the casted wrapper
+        if self.drawing is not None:
+            self.dxffactory.wrapper_cache.discard(self.dxf.handle)
 
     def destroy(self):
+        self._flush_vertex_array()
         db = self.entitydb
         handle = self.tags.link
         while handle is not None:
@@ -865,7 +906,7 @@ VERTEX
 class Vertex(GraphicEntity, QuadrilateralMixin):
     FACE_FLAGS = const.VTX_3D_POLYGON_MESH_VERTEX + const.VTX_3D_POLYFACE_MESH_VERTEX
     VTX3D = const.VTX_3D_POLYLINE_VERTEX + const.VTX_3D_POLYGON_MESH_VERTEX + const.VTX_3D_POLYFACE_MESH_VERTEX
-    TEMPLATE = ClassifiedTags.from_text(_VERTEX_TPL)
+    TEMPLATE = LazyTemplate(_VERTEX_TPL)
     DXFATTRIBS = make_attribs({
         'location': DXFAttr(10, xtype='Point2D/3D'),
         'start_width': DXFAttr(40, default=0.0),
@@ -933,7 +974,7 @@ MVIEW
 
 
 class Viewport(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_VPORT_TPL)
+    TEMPLATE = LazyTemplate(_VPORT_TPL)
     DXFATTRIBS = make_attribs({
         'center': DXFAttr(10, xtype='Point2D/3D'),  # center point of entity in paper space coordinates)
         'width': DXFAttr(40),  # width in paper space units
@@ -1004,7 +1045,7 @@ DIMSTYLE
 
 
 class Dimension(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_DIMENSION_TPL)
+    TEMPLATE = LazyTemplate(_DIMENSION_TPL)
     DXFATTRIBS = make_attribs({
         'geometry': DXFAttr(2),  # name of pseudo-Block containing the current dimension  entity geometry
         'dimstyle': DXFAttr(3),
@@ -1051,7 +1092,7 @@ NAME
 
 # SHAPE is not tested with real world DXF drawings!
 class Shape(GraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_SHAPE_TPL)
+    TEMPLATE = LazyTemplate(_SHAPE_TPL)
     DXFATTRIBS = make_attribs({
         'insert': DXFAttr(10, xtype='Point2D/3D'),
         'size': DXFAttr(40),
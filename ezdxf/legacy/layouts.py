@@ -8,7 +8,9 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from .graphicsfactory import GraphicsFactory
 from ..entityspace import EntitySpace
-from ..query import EntityQuery
+from ..c23 import isstring
+from ..query import EntityQuery, entity_dxftypes, entity_matcher
+from ..spatialindex import SpatialIndex
 
 
 class DXF12Layouts(object):
@@ -44,6 +46,7 @@ class BaseLayout(GraphicsFactory):
     def __init__(self, dxffactory, entity_space):
         super(BaseLayout, self).__init__(dxffactory)
         self._entity_space = entity_space
+        self._spatial_index = None  # created at first spatial query
 
     def __len__(self):
         return len(self._entity_space)
@@ -80,16 +83,44 @@ class BaseLayout(GraphicsFactory):
     def add_entity(self, entity):
         """ Add entity to entity space but not to the drawing database.
         """
-        self._entity_space.append(entity.dxf.handle)
+        self._entity_space.add_handle(entity.dxf.handle, entity.dxftype())
         self._set_paperspace(entity)
+        if self._spatial_index is not None:
+            self._spatial_index.add_handle(entity.dxf.handle)
 
     def delete_entity(self, entity):
         """ Delete entity from entity space and drawing database.
         """
+        if self._spatial_index is not None:
+            self._spatial_index.discard_handle(entity.dxf.handle)
         self.entitydb.delete_entity(entity)  # 1. database
         self._entity_space.delete_entity(entity)  # 2. entity space
         entity.dxf.paperspace = -1  # set invalid paper space
 
+    def delete_entities(self, entities):
+        """ Delete *entities* from entity space and drawing database in one pass, *entities* is an iterable of wrapped
+        entities or a query string, entities of other layouts are ignored. Returns count of deleted entities.
+        """
+        if isstring(entities):
+            entities = self.query(entities)
+        entity_space = self._entity_space
+        entitydb = self.entitydb
+        handles = []
+        deleted = set()
+        for entity in list(entities):  # temp list, because delete modifies the base data structure of the iterator
+            handle = entity.dxf.handle
+            if handle in deleted or handle not in entity_space:
+                continue
+            deleted.add(handle)
+            entitydb.delete_entity(entity)
+            entity.dxf.paperspace = -1  # set invalid paper space
+            handles.append(handle)
+        entity_space.remove_handles(handles)
+        if self._spatial_index is not None:
+            for handle in handles:
+                self._spatial_index.discard_handle(handle)
+        return len(handles)
+
     def delete_all_entities(self):
         """ Delete all entities of this layout from entity space and from drawing database.
 
@@ -97,8 +128,7 @@ class BaseLayout(GraphicsFactory):
         space.
         """
         # noinspection PyTypeChecker
-        for entity in list(self):  # temp list, because delete modifies the base data structure of the iterator
-            self.delete_entity(entity)
+        self.delete_entities(self)
 
     def _set_paperspace(self, entity):
         pass
@@ -108,9 +138,42 @@ class BaseLayout(GraphicsFactory):
         """
         return self._dxffactory.wrap_handle(handle)
 
-    # noinspection PyTypeChecker
     def query(self, query='*'):
-        return EntityQuery(iter(self), query)
+        """ Returns an EntityQuery() of all layout entities matching *query*, entities of not requested DXF types are
+        skipped without wrapping them.
+        """
+        wrap = self._dxffactory.wrap_handle
+        handles = self._entity_space.handles_of_types(entity_dxftypes(query))
+        return EntityQuery((wrap(handle) for handle in handles), query)
+
+    def type_histogram(self):
+        """ Returns a dict of DXF type -> entity count of this layout.
+        """
+        return self._entity_space.type_histogram()
+
+    @property
+    def spatial_index(self):
+        """ SpatialIndex() of the layout entities, created at first access.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self)
+        return self._spatial_index
+
+    def query_bbox(self, min_point, max_point, query='*'):
+        """ Returns an EntityQuery() of all layout entities matching *query* with bounding boxes intersecting the box
+        defined by *min_point* and *max_point*. The z-axis is ignored for 2D points.
+        """
+        wrap = self._dxffactory.wrap_handle
+        handles = self.spatial_index.intersecting_handles(min_point, max_point)
+        return EntityQuery((wrap(handle) for handle in handles), query)
+
+    def nearest_entity(self, point, query='*'):
+        """ Returns the entity matching *query* with the nearest bounding box to *point* or *None*.
+        """
+        result = self.spatial_index.nearest_handle(point, entity_matcher(query))
+        if result is None:
+            return None
+        return self._dxffactory.wrap_handle(result[1])
 
 
 class DXF12Layout(BaseLayout):
@@ -213,12 +276,14 @@ class DXF12BlockLayout(BaseLayout):
     def add_entity(self, entity):
         """ Add entity to the block entity space.
         """
-        self.add_handle(entity.dxf.handle)
+        self.add_handle(entity.dxf.handle, entity.dxftype())
 
-    def add_handle(self, handle):
+    def add_handle(self, handle, dxftype=None):
         """ Add entity by handle to the block entity space.
         """
-        self._entity_space.append(handle)
+        self._entity_space.add_handle(handle, dxftype)
+        if self._spatial_index is not None:
+            self._spatial_index.add_handle(handle)
 
     def write(self, stream):
         def write_tags(handle):
@@ -232,7 +297,8 @@ class DXF12BlockLayout(BaseLayout):
     def attdefs(self):
         """ Iterate over all ATTDEF entities.
         """
-        return (entity for entity in self if entity.dxftype() == 'ATTDEF')
+        wrap = self._dxffactory.wrap_handle
+        return (wrap(handle) for handle in self._entity_space.handles_of_types(['ATTDEF']))
 
     def delete_all_entities(self):
         # 1. delete from database
@@ -240,6 +306,8 @@ class DXF12BlockLayout(BaseLayout):
             del self.entitydb[handle]
         # 2. delete from entity space
         self._entity_space.delete_all_entities()
+        if self._spatial_index is not None:
+            self._spatial_index.clear()
 
     def destroy(self):
         self.delete_all_entities()
@@ -7,7 +7,7 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from ..dxfentity import DXFEntity
 from ..tags import DXFTag
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
 
 _LAYERTEMPLATE = """  0
@@ -27,7 +27,7 @@ CONTINUOUS
 
 # noinspection PyAugmentAssignment,PyUnresolvedReferences
 class Layer(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_LAYERTEMPLATE)
+    TEMPLATE = LazyTemplate(_LAYERTEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -93,7 +93,7 @@ arial.ttf
 
 
 class Style(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_STYLETEMPLATE)
+    TEMPLATE = LazyTemplate(_STYLETEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -123,7 +123,7 @@ LTYPEDESCRIPTION
 
 
 class Linetype(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_LTYPETEMPLATE)
+    TEMPLATE = LazyTemplate(_LTYPETEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -226,7 +226,7 @@ VPORTNAME
 
 
 class Viewport(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_VPORTTEMPLATE)
+    TEMPLATE = LazyTemplate(_VPORTTEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -289,7 +289,7 @@ UCSNAME
 
 
 class UCS(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_UCSTEMPLATE)
+    TEMPLATE = LazyTemplate(_UCSTEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -312,7 +312,7 @@ APPNAME
 
 
 class AppID(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_APPIDTEMPLATE)
+    TEMPLATE = LazyTemplate(_APPIDTEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -361,7 +361,7 @@ VIEWNAME
 
 
 class View(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_VIEWTEMPLATE)
+    TEMPLATE = LazyTemplate(_VIEWTEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(5),
         'name': DXFAttr(2),
@@ -468,7 +468,7 @@ DIMSTYLENAME
 
 
 class DimStyle(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_DIMSTYLETEMPLATE)
+    TEMPLATE = LazyTemplate(_DIMSTYLETEMPLATE)
     DXFATTRIBS = DXFAttributes(DefSubclass(None, {
         'handle': DXFAttr(105),
         'name': DXFAttr(2),
@@ -9,7 +9,7 @@ __author__ = "mozman <mozman@gmx.at>"
 from contextlib import contextmanager
 
 from ..tags import DXFTag
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
 from ..dxfentity import DXFEntity
 from ..c23 import isstring
@@ -398,7 +398,7 @@ Layoutname
 
 
 class DXFLayout(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_LAYOUT_TPL)
+    TEMPLATE = LazyTemplate(_LAYOUT_TPL)
     DXFATTRIBS = DXFAttributes(
         none_subclass,
         plot_settings_subclass,
@@ -515,7 +515,7 @@ AcDbGroup
 GROUP_ITEM_CODE = 340
 
 class DXFGroup(DXFEntity):
-    TEMPLATE = ClassifiedTags.from_text(_GROUP_TPL)
+    TEMPLATE = LazyTemplate(_GROUP_TPL)
     DXFATTRIBS = DXFAttributes(
         none_subclass,
         DefSubclass('AcDbGroup', {
@@ -11,7 +11,7 @@ from contextlib import contextmanager
 from .graphics import none_subclass, entity_subclass, ModernGraphicEntity
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
 from ..tags import DXFTag, DXFStructureError, TagGroups
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 
 _HATCH_TPL = """  0
 HATCH
@@ -78,7 +78,7 @@ hatch_subclass = DefSubclass('AcDbHatch', {
 
 
 class Hatch(ModernGraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_HATCH_TPL)
+    TEMPLATE = LazyTemplate(_HATCH_TPL)
     DXFATTRIBS = DXFAttributes(none_subclass, entity_subclass, hatch_subclass)
 
     @property
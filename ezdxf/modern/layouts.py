@@ -175,7 +175,7 @@ class BlockLayout(DXF12BlockLayout, ModernGraphicsFactory):
         if isinstance(entity, ClassifiedTags):
             entity = self._dxffactory.wrap_entity(entity)
         entity.dxf.owner = self.get_block_record_handle()
-        self._entity_space.append(entity.dxf.handle)
+        self.add_handle(entity.dxf.handle, entity.dxftype())
 
     def get_block_record_handle(self):
         return self.block.dxf.owner
@@ -6,12 +6,21 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import gc
+import sys
 from contextlib import contextmanager
+from array import array
+from numbers import Number
+from functools import partial
+from collections import namedtuple
+from itertools import chain, islice, product, repeat, takewhile
+from math import floor
+from operator import eq, itemgetter
 
 from .graphics import none_subclass, entity_subclass, ModernGraphicEntity
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
 from ..tags import DXFTag
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 from ..const import DXFStructureError
 
 _MESH_TPL = """  0
@@ -50,7 +59,7 @@ mesh_subclass = DefSubclass('AcDbSubDMesh', {
 
 
 class Mesh(ModernGraphicEntity):
-    TEMPLATE = ClassifiedTags.from_text(_MESH_TPL)
+    TEMPLATE = LazyTemplate(_MESH_TPL)
     DXFATTRIBS = DXFAttributes(none_subclass, entity_subclass, mesh_subclass)
 
     @property
@@ -66,10 +75,11 @@ class Mesh(ModernGraphicEntity):
         except ValueError:
             raise DXFStructureError("Tag 92 (vertex count) in MESH entity not found.")
         pending_tags = self._remove_existing_data(pos92)
-        self._append_vertices(data.vertices)
-        self._append_faces(data.faces)
-        self._append_edges(data.edges)
-        self._append_edge_crease_values(data.edge_crease_values)
+        with _suspended_gc():
+            self._append_vertices(data.vertices)
+            self._append_faces(data.faces)
+            self._append_edges(data.edges)
+            self._append_edge_crease_values(data.edge_crease_values)
         self.AcDbSubDMesh.extend(pending_tags)
 
     def _remove_existing_data(self, insert_pos):
@@ -85,7 +95,10 @@ class Mesh(ModernGraphicEntity):
                     raise DXFStructureError("No count tag 93, 94 or 95 in MESH entity found.")
             else:
                 break
-        last_pos = count_tag + 1 + tags[count_tag].value
+        count = tags[count_tag].value
+        if code == 94:  # edge count, 2 tags for each edge
+            count *= 2
+        last_pos = count_tag + 1 + count
         pending_tags = tags[last_pos:]
         del tags[insert_pos:]
         return pending_tags
@@ -109,9 +122,9 @@ class Mesh(ModernGraphicEntity):
         self.AcDbSubDMesh.extend(tags)
 
     def _append_edges(self, edges):
-        # (94) count of edge tags
+        # (94) edge count
         tags = self.AcDbSubDMesh
-        tags.append(DXFTag(94, len(edges)*2))
+        tags.append(DXFTag(94, len(edges)))
         for edge in edges:
             tags.append(DXFTag(90, edge[0]))
             tags.append(DXFTag(90, edge[1]))
@@ -122,6 +135,120 @@ class Mesh(ModernGraphicEntity):
         tags.append(DXFTag(95, len(values)))
         tags.extend(DXFTag(140, value) for value in values)
 
+    def set_arrays(self, vertices, faces=None, edges=None, edge_crease_values=None):
+        """ Set the mesh data from arrays, the counterpart of the array accessors vertices_array(), faces_arrays(),
+        edges_array() and edge_crease_values_array().
+
+        :param vertices: NumPy (N, 3) array or flat sequence of x, y, z coordinates or sequence of (x, y, z)-tuples
+        :param faces: faces in CSR form as (offsets, indices)-tuple, the indices of face n are
+            indices[offsets[n]:offsets[n+1]]
+        :param edges: NumPy (M, 2) array or flat sequence of vertex indices or sequence of (start, end)-tuples
+        :param edge_crease_values: sequence of floats
+        """
+        try:
+            pos92 = self.AcDbSubDMesh.tag_index(92)
+        except ValueError:
+            raise DXFStructureError("Tag 92 (vertex count) in MESH entity not found.")
+        pending_tags = self._remove_existing_data(pos92)
+        with _suspended_gc():
+            self._extend_by_arrays(vertices, faces, edges, edge_crease_values)
+        self.AcDbSubDMesh.extend(pending_tags)
+
+    def _extend_by_arrays(self, vertices, faces, edges, edge_crease_values):
+        tags = self.AcDbSubDMesh
+        coords = _flat_list(vertices)
+        icoords = iter(coords)
+        tags.append(DXFTag(92, len(coords) // 3))
+        tags.extend(_dxftags(10, zip(icoords, icoords, icoords)))
+
+        face_list = []  # vertex count of face followed by the vertex indices
+        if faces is not None:
+            offsets, indices = _flat_list(faces[0]), _flat_list(faces[1])
+            count = len(offsets) - 1
+            size = offsets[1] - offsets[0] if count > 0 else 0
+            if size > 0 and offsets == list(range(offsets[0], offsets[0] + count * size + 1, size)):
+                # fast path for meshes with the same vertex count for all faces, like triangle or quad meshes
+                face_list = [size] * (count * (size + 1))
+                start = offsets[0]
+                for index in range(size):
+                    face_list[index + 1::size + 1] = indices[start + index:start + count * size:size]
+            else:
+                for start, end in zip(offsets, islice(offsets, 1, None)):
+                    face_list.append(end - start)
+                    face_list.extend(indices[start:end])
+        tags.append(DXFTag(93, len(face_list)))
+        tags.extend(_dxftags(90, face_list))
+
+        edge_list = [] if edges is None else _flat_list(edges)
+        tags.append(DXFTag(94, len(edge_list) // 2))
+        tags.extend(_dxftags(90, edge_list))
+
+        crease_list = [] if edge_crease_values is None else _flat_list(edge_crease_values)
+        tags.append(DXFTag(95, len(crease_list)))
+        tags.extend(_dxftags(140, crease_list))
+
+    def vertices_array(self):
+        """ Returns the vertices as NumPy (N, 3) float64 array or as flat array('d') of x, y, z coordinates if NumPy
+        is not available.
+        """
+        coords = array('d')
+        tags = self.AcDbSubDMesh
+        try:
+            pos = tags.tag_index(92)
+        except ValueError:
+            return _numpy_view(coords, 3)
+        locations = Mesh.get_raw_list(tags, pos + 1, code=10, count=tags[pos].value)
+        coords.extend(chain.from_iterable(location if len(location) > 2 else (location[0], location[1], 0.)
+                                          for location in locations))
+        return _numpy_view(coords, 3)
+
+    def faces_arrays(self):
+        """ Returns the faces in CSR form as (offsets, indices)-tuple, the vertex indices of face n are
+        indices[offsets[n]:offsets[n+1]]. The arrays are NumPy int64 arrays or array('l') if NumPy is not available.
+        """
+        offsets = array('l', [0])
+        indices = array('l')
+        tags = self.AcDbSubDMesh
+        try:
+            pos = tags.tag_index(93)
+        except ValueError:
+            return _numpy_view(offsets), _numpy_view(indices)
+        face_list = Mesh.get_raw_list(tags, pos + 1, code=90, count=tags[pos].value)
+        size = len(face_list)
+        if size:  # fast path for meshes with the same vertex count for all faces, like triangle or quad meshes
+            stride = face_list[0] + 1
+            counts = face_list[::stride]
+            if stride > 1 and size == len(counts) * stride and counts.count(stride - 1) == len(counts):
+                indices = array('l', face_list)
+                del indices[::stride]
+                return _numpy_view(array('l', range(0, len(indices) + 1, stride - 1))), _numpy_view(indices)
+        index = 0
+        while index < size:
+            count = face_list[index]
+            index += 1
+            indices.extend(face_list[index:index + count])
+            offsets.append(len(indices))
+            index += count
+        return _numpy_view(offsets), _numpy_view(indices)
+
+    def edges_array(self):
+        """ Returns the edges as NumPy (M, 2) int64 array or as flat array('l') of start and end vertex indices if
+        NumPy is not available.
+        """
+        tags = self.AcDbSubDMesh
+        try:
+            pos = tags.tag_index(94)
+        except ValueError:
+            return _numpy_view(array('l'), 2)
+        edge_list = Mesh.get_raw_list(tags, pos + 1, code=90, count=tags[pos].value * 2)
+        del edge_list[len(edge_list) & ~1:]  # ignore incomplete edge
+        return _numpy_view(array('l', edge_list), 2)
+
+    def edge_crease_values_array(self):
+        """ Returns the edge crease values as NumPy float64 array or as array('d') if NumPy is not available.
+        """
+        return _numpy_view(array('d', self.get_edge_crease_values()))
+
     @contextmanager
     def edit_data(self):
         data = self.get_data()
@@ -194,19 +321,79 @@ class Mesh(ModernGraphicEntity):
         return Mesh.get_raw_list(self.AcDbSubDMesh, pos+1, code=140)
 
     @staticmethod
-    def get_raw_list(tags, pos, code):
-        raw_list = []
-        itags = iter(tags[pos:])
-        while True:
-            try:
-                tag = next(itags)
-            except StopIteration:
-                break
-            if tag.code == code:
-                raw_list.append(tag.value)
-            else:
-                break
-        return raw_list
+    def get_raw_list(tags, pos, code, count=None):
+        """ Returns the values of the tags starting at *pos* with group code *code*, stops at the first tag with
+        another group code or after *count* tags.
+        """
+        chunk = list(islice(tags, pos, None if count is None else pos + count))
+        codes = list(map(itemgetter(0), chunk))
+        if codes.count(code) != len(codes):
+            del chunk[len(list(takewhile(partial(eq, code), codes))):]
+        return list(map(itemgetter(1), chunk))
+
+
+@contextmanager
+def _suspended_gc():
+    """ Creating millions of DXF tags triggers many garbage collections without any result, because DXF tags have no
+    reference cycles.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _dxftags(code, values):
+    """ Returns an iterator of DXFTag(code, value) for all *values*, created by tuple.__new__() without the Python
+    level DXFTag.__new__().
+    """
+    return map(tuple.__new__, repeat(DXFTag), zip(repeat(code), values))
+
+
+_numpy_module = False  # not imported yet
+
+
+def _numpy():
+    """ Returns the NumPy module or *None* if NumPy is not available, NumPy is imported at the first call.
+    """
+    global _numpy_module
+    if _numpy_module is False:
+        try:
+            import numpy  # not imported by 'import ezdxf', see LAZY_MODULES in tests/test_import_time.py
+        except ImportError:  # NumPy is an optional dependency, the array accessors return array.array() objects
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def _numpy_view(values, columns=None):
+    """ Returns *values* of type array.array() as NumPy array without copying the data, reshaped to *columns* columns
+    if not *None*, or *values* unchanged if NumPy is not available.
+    """
+    numpy = _numpy()
+    if numpy is None:
+        return values
+    result = numpy.frombuffer(values, dtype=numpy.dtype(values.typecode)) if len(values) else \
+        numpy.zeros(0, dtype=numpy.dtype(values.typecode))
+    return result if columns is None else result.reshape(-1, columns)
+
+
+def _flat_list(values):
+    """ Returns the items of a NumPy array, a flat sequence or a sequence of tuples as flat list. """
+    numpy = sys.modules.get('numpy')  # a NumPy array requires an imported NumPy
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.reshape(-1).tolist()
+    values = list(values)
+    if len(values) and not isinstance(values[0], Number):
+        return list(chain.from_iterable(values))
+    return values
+
+
+OptimizeReport = namedtuple('OptimizeReport', 'merged_vertices unused_vertices degenerate_faces duplicate_faces '
+                                               'degenerate_edges duplicate_edges')
 
 
 class MeshData(object):
@@ -216,11 +403,178 @@ class MeshData(object):
         self.edges = mesh.get_edges()
         self.edge_crease_values = mesh.get_edge_crease_values()
 
-    def add_face(self, vertices):  # todo
-        pass
+    def add_face(self, vertices):
+        """ Add a face by coordinates, *vertices* is a list of (x, y, z)-tuples, use optimize() to merge the vertices
+        with existing vertices.
+        """
+        index = len(self.vertices)
+        self.vertices.extend(tuple(vertex) for vertex in vertices)
+        self.faces.append(tuple(range(index, len(self.vertices))))
+
+    def add_edge(self, vertices):
+        """ Add an edge by coordinates, *vertices* is a list of two (x, y, z)-tuples, use optimize() to merge the
+        vertices with existing vertices.
+        """
+        if len(vertices) != 2:
+            raise ValueError("An edge requires two vertices.")
+        if len(self.edge_crease_values) == len(self.edges):  # keep one crease value for each edge
+            self.edge_crease_values.append(0.)
+        index = len(self.vertices)
+        self.vertices.extend(tuple(vertex) for vertex in vertices)
+        self.edges.append((index, index + 1))
+
+    def optimize(self, precision=6):
+        """ Welds vertices which differ less than 10**-precision in each coordinate, removes degenerated faces with
+        less than 3 different vertices, duplicate faces, degenerated and duplicate edges and unused vertices.
+
+        Returns an OptimizeReport() with the count of removed elements.
+        """
+        with _suspended_gc():  # creates millions of tuples without reference cycles
+            return self._optimize(precision)
+
+    def _optimize(self, precision):
+        vertices, index_map = weld_vertices(self.vertices, 10. ** -precision)
+        merged_vertices = len(self.vertices) - len(vertices)
+
+        faces = []
+        face_keys = set()
+        degenerate_faces = 0
+        duplicate_faces = 0
+        for face in self.faces:
+            indices = [index_map[index] for index in face]
+            # remove consecutive vertices welded into the same vertex, indices[-1] is the predecessor of indices[0]
+            indices = [index for pos, index in enumerate(indices) if index != indices[pos - 1]]
+            if len(set(indices)) < 3:
+                degenerate_faces += 1
+                continue
+            key = _face_key(indices)
+            if key in face_keys:
+                duplicate_faces += 1
+                continue
+            face_keys.add(key)
+            faces.append(indices)
+
+        edges = []
+        creases = []
+        edge_keys = set()
+        degenerate_edges = 0
+        duplicate_edges = 0
+        crease_values = self.edge_crease_values
+        for edge_index, edge in enumerate(self.edges):
+            start, end = index_map[edge[0]], index_map[edge[1]]
+            if start == end:
+                degenerate_edges += 1
+                continue
+            key = (start, end) if start < end else (end, start)
+            if key in edge_keys:
+                duplicate_edges += 1
+                continue
+            edge_keys.add(key)
+            edges.append((start, end))
+            if edge_index < len(crease_values):
+                creases.append(crease_values[edge_index])
+
+        # remove unused vertices
+        used = bytearray(len(vertices))
+        for face in faces:
+            for index in face:
+                used[index] = 1
+        for start, end in edges:
+            used[start] = 1
+            used[end] = 1
+        compact_map = []
+        used_vertices = []
+        for index, vertex in enumerate(vertices):
+            compact_map.append(len(used_vertices))
+            if used[index]:
+                used_vertices.append(vertex)
+
+        self.vertices = used_vertices
+        self.faces = [tuple(compact_map[index] for index in face) for face in faces]
+        self.edges = [(compact_map[start], compact_map[end]) for start, end in edges]
+        if len(crease_values):
+            self.edge_crease_values = creases
+        return OptimizeReport(
+            merged_vertices=merged_vertices,
+            unused_vertices=len(vertices) - len(used_vertices),
+            degenerate_faces=degenerate_faces,
+            duplicate_faces=duplicate_faces,
+            degenerate_edges=degenerate_edges,
+            duplicate_edges=duplicate_edges,
+        )
+
+
+def _face_key(indices):
+    """ Returns the same key for all rotations and both orientations of a face. """
+    start = indices.index(min(indices))
+    forward = tuple(indices[start:] + indices[:start])
+    backward = forward[:1] + forward[:0:-1]
+    return min(forward, backward)
+
+
+def weld_vertices(vertices, tolerance):
+    """ Welds *vertices* which differ less or equal than *tolerance* in each coordinate, the first vertex of a group of
+    near vertices is the welded vertex.
+
+    Returns the welded vertices as list of (x, y, z)-tuples and a list which maps the index of each vertex of
+    *vertices* to the index of its welded vertex.
+
+    The welded vertices are stored in a spatial hash of cubic cells with an edge length of 16 * *tolerance*, vertices
+    closer than *tolerance* to the border of a cell are also compared to the welded vertices of the adjacent cells.
+    The cells are centered at multiples of the cell size, so vertices at 'round' coordinates like 0 or 1 are in the
+    middle of a cell.
+    """
+    cell_size = tolerance * 16.
+    inv_cell_size = 1. / cell_size
+    low = tolerance / cell_size  # vertices with a fractional position in cell <= low or >= high are near the border
+    high = 1. - low
+    welded = []
+    index_map = []
+    exact = {}  # vertex -> welded index, shortcut for identical vertices
+    grid = {}  # cell -> list of welded indices
+
+    def find(cell, x, y, z):
+        for index in grid.get(cell, ()):
+            wx, wy, wz = welded[index]
+            if abs(wx - x) <= tolerance and abs(wy - y) <= tolerance and abs(wz - z) <= tolerance:
+                return index
+        return None
 
-    def add_edge(self, vertices):  # todo
-        pass
+    def neighbors(c, f):
+        # f = fractional position in cell, range [0, 1)
+        if f <= low:
+            return c - 1, c
+        if f >= high:
+            return c, c + 1
+        return c,
 
-    def optimize(self):  # todo
-        pass
+    with _suspended_gc():
+        for vertex in vertices:
+            if type(vertex) is not tuple:  # lists are not hashable
+                vertex = tuple(vertex)
+            index = exact.get(vertex)
+            if index is None:
+                x, y = vertex[0], vertex[1]
+                z = vertex[2] if len(vertex) > 2 else 0.
+                fx, fy, fz = x * inv_cell_size + .5, y * inv_cell_size + .5, z * inv_cell_size + .5
+                cx, cy, cz = int(floor(fx)), int(floor(fy)), int(floor(fz))
+                cell = (cx, cy, cz)
+                index = find(cell, x, y, z) if cell in grid else None
+                if index is None:
+                    dx, dy, dz = fx - cx, fy - cy, fz - cz
+                    if not (low < dx < high and low < dy < high and low < dz < high):  # near the border of the cell
+                        for near_cell in product(neighbors(cx, dx), neighbors(cy, dy), neighbors(cz, dz)):
+                            if near_cell != cell and near_cell in grid:
+                                index = find(near_cell, x, y, z)
+                                if index is not None:
+                                    break
+                if index is None:
+                    index = len(welded)
+                    welded.append((x, y, z))
+                    try:
+                        grid[cell].append(index)
+                    except KeyError:
+                        grid[cell] = [index]
+                exact[vertex] = index
+            index_map.append(index)
+    return welded, index_map
@@ -6,7 +6,7 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from ..tags import DXFTag
-from ..classifiedtags import ClassifiedTags
+from ..classifiedtags import LazyTemplate
 from ..legacy import tableentries as legacy
 from ..dxfentity import DXFEntity
 from ..dxfattr import DXFAttr, DXFAttributes, DefSubclass
@@ -56,7 +56,7 @@ layer_subclass = DefSubclass('AcDbLayerTableRecord', {
 
 
 class Layer(legacy.Layer):
-    TEMPLATE = ClassifiedTags.from_text(_LAYERTEMPLATE)
+    TEMPLATE = LazyTemplate(_LAYERTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, layer_subclass)
 
     @classmethod
@@ -106,7 +106,7 @@ style_subclass = DefSubclass('AcDbTextStyleTableRecord', {
 
 
 class Style(legacy.Style):
-    TEMPLATE = ClassifiedTags.from_text(_STYLETEMPLATE)
+    TEMPLATE = LazyTemplate(_STYLETEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, style_subclass)
 
 _LTYPETEMPLATE = """  0
@@ -135,7 +135,7 @@ linetype_subclass = DefSubclass('AcDbLinetypeTableRecord', {
 
 
 class Linetype(legacy.Linetype):
-    TEMPLATE = ClassifiedTags.from_text(_LTYPETEMPLATE)
+    TEMPLATE = LazyTemplate(_LTYPETEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, linetype_subclass)
 
     def _setup_pattern(self, pattern):
@@ -167,7 +167,7 @@ appid_subclass = DefSubclass('AcDbRegAppTableRecord', {
 
 
 class AppID(legacy.AppID):
-    TEMPLATE = ClassifiedTags.from_text(_APPIDTEMPLATE)
+    TEMPLATE = LazyTemplate(_APPIDTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, appid_subclass)
 
 _DIMSTYLETEMPLATE = """  0
@@ -312,7 +312,7 @@ dimstyle_subclass = DefSubclass('AcDbDimStyleTableRecord', {
 
 
 class DimStyle(legacy.DimStyle):
-    TEMPLATE = ClassifiedTags.from_text(_DIMSTYLETEMPLATE)
+    TEMPLATE = LazyTemplate(_DIMSTYLETEMPLATE)
     DXFATTRIBS = DXFAttributes(handle105_subclass, symbol_subclass, dimstyle_subclass)
 
 _UCSTEMPLATE = """  0
@@ -356,7 +356,7 @@ ucs_subclass = DefSubclass('AcDbUCSTableRecord', {
 
 
 class UCS(legacy.UCS):
-    TEMPLATE = ClassifiedTags.from_text(_UCSTEMPLATE)
+    TEMPLATE = LazyTemplate(_UCSTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, ucs_subclass)
 
 _VIEWTEMPLATE = """  0
@@ -419,7 +419,7 @@ view_subclass = DefSubclass('AcDbViewTableRecord', {
 
 
 class View(legacy.View):
-    TEMPLATE = ClassifiedTags.from_text(_VIEWTEMPLATE)
+    TEMPLATE = LazyTemplate(_VIEWTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, view_subclass)
 
 _VPORTTEMPLATE = """  0
@@ -533,7 +533,7 @@ vport_subclass = DefSubclass('AcDbViewportTableRecord', {
 
 
 class Viewport(legacy.Viewport):
-    TEMPLATE = ClassifiedTags.from_text(_VPORTTEMPLATE)
+    TEMPLATE = LazyTemplate(_VPORTTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, vport_subclass)
 
 _BLOCKRECORDTEMPLATE = """  0
@@ -564,5 +564,5 @@ class BlockRecord(DXFEntity):
     owner: Soft-pointer ID/handle to owner object
     layout: Hard-pointer ID/handle to associated LAYOUT object
     """
-    TEMPLATE = ClassifiedTags.from_text(_BLOCKRECORDTEMPLATE)
+    TEMPLATE = LazyTemplate(_BLOCKRECORDTEMPLATE)
     DXFATTRIBS = DXFAttributes(none_subclass, symbol_subclass, blockrec_subclass)
@@ -24,6 +24,30 @@ class Options(object):
         # compress binary data tags 310-319, collects multiple succeeding binary tags as one compressed tag
         self.compress_binary_data = False
 
+        # store tags of DXF entities in ArrayTags() instead of Tags(), requires less memory and provides faster
+        # searching for group codes
+        self.use_array_tags = False
+
+        # keep raw string values of loaded tags and cast them at first access, unchanged values are written verbatim
+        self.lazy_cast = False
+
+        # store the DXF text of loaded entities and write unmodified entities verbatim, modified entities are
+        # serialized, use it with lazy_cast = True to keep the original formatting of values
+        self.verbatim_passthrough = False
+
+        # the DXF factory of a drawing returns the same wrapper object for the same handle, as long as the wrapper
+        # is referenced elsewhere
+        self.cache_wrappers = True
+
+        # update the header variables $EXTMIN and $EXTMAX by the extents of the model space at saving
+        self.update_extents_on_save = False
+
+        # cache the tokenized template files of Drawing.new() in memory
+        self.cache_templates = True
+
+        # max. total size in bytes of all cache files in the cache directory of readfile(filename, cache_dir=...)
+        self.parse_cache_size = 256 * 1024 * 1024
+
     @property
     def debug(self):
         return self._debug
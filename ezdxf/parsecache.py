@@ -0,0 +1,190 @@
+# Purpose: on-disk cache of tokenized DXF files
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import os
+import io
+import struct
+import hashlib
+import pickle
+import tempfile
+import zlib
+
+from .tags import BufferedTagIterator, StructureTag
+from .decoding import DecodingStream
+from .c23 import unicode2bytes
+from .options import options
+
+MAGIC = b'EZDXF-PARSE-CACHE'
+FORMAT_VERSION = 1
+CACHE_FILE_EXT = '.ezc'
+HEADER_SIZE = struct.Struct(str('<I'))
+
+
+def _replace(src, dst):
+    try:
+        os.replace(src, dst)
+    except AttributeError:  # Python 2.7
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+class ParseCache(object):
+    """ On-disk cache of tokenized DXF files, the drawing is build from the cached DXF tags without parsing the DXF
+    text.
+
+    Every DXF file has its own cache file, named by the hash of the absolute file path. A cache file is only used if
+    size, modification time and SHA-1 hash of the DXF file are unchanged. The cache file stores the tags as compressed
+    pickle data, with a SHA-1 hash of the data as corruption check, invalid cache files are deleted.
+
+    The total size of all cache files is limited to *max_size* bytes, the least recently used cache files are deleted
+    if the limit is exceeded.
+
+    The cache files are loaded by the pickle module, use only a cache directory which is not writable by others.
+    """
+    def __init__(self, cache_dir, max_size=None):
+        self.cache_dir = cache_dir
+        self.max_size = options.parse_cache_size if max_size is None else max_size
+        self.hits = 0
+        self.misses = 0
+
+    def cache_file(self, filename):
+        name = hashlib.sha1(unicode2bytes(os.path.abspath(filename))).hexdigest()
+        return os.path.join(self.cache_dir, name + CACHE_FILE_EXT)
+
+    @staticmethod
+    def file_key(filename, data):
+        """ Returns the key of the DXF file *filename* with the content *data* as dict. """
+        stat = os.stat(filename)
+        return {
+            'path': os.path.abspath(filename),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'sha1': hashlib.sha1(data).hexdigest(),
+            'lazy_cast': options.lazy_cast,  # lazy_cast changes the type of the tags
+            'verbatim_passthrough': options.verbatim_passthrough,  # StructureTag() with the source text of entities
+        }
+
+    def read_tags(self, filename):
+        """ Returns the DXF tags of file *filename* as list, loaded from the cache if possible. """
+        with io.open(filename, mode='rb') as fp:
+            data = fp.read()
+        key = self.file_key(filename, data)
+        cache_file = self.cache_file(filename)
+        tags = self.load(cache_file, key)
+        if tags is not None:
+            self.hits += 1
+            return tags
+
+        self.misses += 1
+        stream = DecodingStream(io.BytesIO(data))
+        if not stream.is_dxf:
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+        tags = list(BufferedTagIterator(stream))
+        try:
+            self.store(cache_file, key, tags)
+        except (IOError, OSError) as err:  # a failing cache should not prevent reading the DXF file
+            options.logger.warning("Can not write parse cache file '{}': {}".format(cache_file, err))
+        return tags
+
+    def load(self, cache_file, key):
+        """ Returns the tags of *cache_file* or *None* for a missing, outdated or corrupt cache file. """
+        try:
+            with io.open(cache_file, mode='rb') as fp:
+                content = fp.read()
+        except (IOError, OSError):
+            return None
+        try:
+            header, payload = self._split(content)
+            if header != dict(key, version=FORMAT_VERSION, payload=header['payload']):
+                return None  # outdated, the cache file will be replaced
+            if hashlib.sha1(payload).hexdigest() != header['payload']:
+                raise ValueError('payload checksum error')
+            tags = pickle.loads(zlib.decompress(payload))
+        except Exception as err:  # any error of a corrupt cache file
+            options.logger.warning("Deleting corrupt parse cache file '{}': {}".format(cache_file, err))
+            self._remove(cache_file)
+            return None
+        try:
+            os.utime(cache_file, None)  # modification time is the last usage time for the LRU eviction
+        except OSError:
+            pass
+        return tags
+
+    @staticmethod
+    def _split(content):
+        start = len(MAGIC)
+        if content[:start] != MAGIC:
+            raise ValueError('invalid file signature')
+        header_size = HEADER_SIZE.unpack_from(content, start)[0]
+        start += HEADER_SIZE.size
+        header = pickle.loads(content[start:start + header_size])
+        return header, content[start + header_size:]
+
+    def store(self, cache_file, key, tags):
+        # identical tags stored as one object reduces the size of the pickle data and the loading time, a StructureTag()
+        # compares equal to other tags with the same code and value, but has its own source text
+        shared = {}
+        tags = [tag if type(tag) is StructureTag else shared.setdefault(tag, tag) for tag in tags]
+        payload = zlib.compress(pickle.dumps(tags, pickle.HIGHEST_PROTOCOL), 1)
+        header = pickle.dumps(dict(key, version=FORMAT_VERSION, payload=hashlib.sha1(payload).hexdigest()), 2)
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        fd, tmp_file = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(MAGIC)
+                fp.write(HEADER_SIZE.pack(len(header)))
+                fp.write(header)
+                fp.write(payload)
+            _replace(tmp_file, cache_file)
+        except Exception:
+            self._remove(tmp_file)
+            raise
+        self.evict()
+
+    def cache_files(self):
+        """ Returns all cache files as list of (last usage time, size, filepath) tuples, oldest first. """
+        files = []
+        if not os.path.isdir(self.cache_dir):
+            return files
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_FILE_EXT):
+                filepath = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:  # removed by another process
+                    continue
+                files.append((stat.st_mtime, stat.st_size, filepath))
+        files.sort()
+        return files
+
+    def size(self):
+        """ Returns the total size of all cache files in bytes. """
+        return sum(size for _, size, _ in self.cache_files())
+
+    def evict(self):
+        """ Delete least recently used cache files until the total size is below the size limit. """
+        files = self.cache_files()
+        total_size = sum(size for _, size, _ in files)
+        for _, size, filepath in files:
+            if total_size <= self.max_size:
+                break
+            self._remove(filepath)
+            total_size -= size
+
+    def clear(self):
+        for _, _, filepath in self.cache_files():
+            self._remove(filepath)
+
+    @staticmethod
+    def _remove(filepath):
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
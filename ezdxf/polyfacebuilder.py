@@ -5,7 +5,14 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
-from .const import VERTEXNAMES
+from array import array
+
+from .const import VERTEXNAMES, VTX_3D_POLYGON_MESH_VERTEX, VTX_3D_POLYFACE_MESH_VERTEX
+from .dxftag import DXFTag
+from .handle import handle_key
+from .vertexarray import VertexPrototype
+
+FACE_FLAGS = VTX_3D_POLYGON_MESH_VERTEX | VTX_3D_POLYFACE_MESH_VERTEX
 
 
 class PolyfaceBuilder(object):
@@ -51,3 +58,219 @@ class PolyfaceBuilder(object):
             self.index_mapping[location] = index
             self.vertices.append(vertex)
             return index
+
+
+class IncrementalPolyfaceBuilder(object):
+    """ Collects faces of a polyface mesh in arrays and creates the VERTEX entities at commit().
+
+    Vertices with the same location rounded to *precision* decimal places are merged, the rounded location is the key
+    of a hash grid of all mesh vertices, including the existing mesh vertices of the polyface. New mesh vertices are
+    inserted after the existing mesh vertices and new face records are appended after the existing face records.
+
+    Creating the builder loads the existing mesh vertices, adding faces and commit() are linear in the count of new
+    faces, reuse one builder to add many batches of faces to a large polyface. commit() reloads the existing mesh, if
+    the head or the tail of the VERTEX chain or the vertex or face count of the polyface was changed after loading,
+    other changes of the existing VERTEX entities are not detected.
+    """
+    def __init__(self, polyface, precision=6):
+        self.polyface = polyface
+        self.precision = precision
+        vertex_class = polyface.dxffactory.ENTITY_WRAPPERS['VERTEX']
+        self._location = vertex_class.DXFATTRIBS['location']
+        self._flags = vertex_class.DXFATTRIBS['flags']
+        self._vtx = vertex_class.DXFATTRIBS['vtx0']
+        self._vtx_codes = [vertex_class.DXFATTRIBS[name].code for name in VERTEXNAMES]
+        self._load()
+
+    def _load(self):
+        self.polyface._flush_vertex_array()
+        self._clear()
+        self._grid = {}  # rounded location -> 0-based vertex index
+        self._nvertices, self._nfaces, self._last_vertex, self._last = self._scan(self._grid)
+        self._state = self._chain_state()
+
+    def _chain_state(self):
+        """ Returns the state of the VERTEX chain, which is checked by commit() in O(1): the first linked entity, the
+        links of the last mesh vertex and of the last VERTEX entity and the vertex and face count of the polyface.
+        """
+        polyface = self.polyface
+        return (polyface.tags.link, self._last_vertex.link, self._last.link,
+                polyface.get_dxf_attrib('m_count', 0), polyface.get_dxf_attrib('n_count', 0))
+
+    def _is_changed(self):
+        db = self.polyface.entitydb
+        for tags in (self._last_vertex, self._last):
+            handle = tags.get_handle()
+            if handle not in db or db[handle] is not tags:  # deleted entity
+                return True
+        return self._chain_state() != self._state
+
+    def _scan(self, grid=None):
+        """ Returns the count of mesh vertices, the count of face records, the last mesh vertex and the last VERTEX
+        entity of the polyface, adds the existing mesh vertices to the hash *grid* if *grid* is not *None*.
+        """
+        polyface = self.polyface
+        precision = self.precision
+        location = self._location
+        flags = self._flags
+        db = polyface.entitydb
+        nvertices = 0
+        nfaces = 0
+        last_vertex = polyface.tags  # new mesh vertices are inserted after this entity
+        last = polyface.tags  # new face records are appended after this entity
+        handle = polyface.tags.link
+        while handle is not None:
+            tags = db[handle]
+            if tags.dxftype() != 'VERTEX':  # SEQEND
+                break
+            if tags.subclasses[flags.subclass].find_first(flags.code, 0) & FACE_FLAGS == FACE_FLAGS:
+                if grid is not None:
+                    point = tags.subclasses[location.subclass].get_value(location.code)
+                    key = (round(point[0], precision), round(point[1], precision),
+                           round(point[2] if len(point) > 2 else 0., precision))
+                    grid.setdefault(key, nvertices)
+                nvertices += 1
+                last_vertex = tags
+            else:
+                nfaces += 1
+            last = tags
+            handle = tags.link
+        return nvertices, nfaces, last_vertex, last
+
+    def _reload(self):
+        """ Reloads the existing mesh if the polyface was changed after loading, e.g. by Polyface.append_faces(), and
+        adds the new mesh vertices and faces again, because the vertex indices of the new faces may have changed.
+        """
+        self.polyface._flush_vertex_array()
+        if not self._is_changed():
+            return
+        nvertices = self._nvertices
+        existing = dict((index, key) for key, index in self._grid.items() if index < nvertices)
+        vertices, dims, faces, face_attribs, dxfattribs = \
+            self.vertices, self._dims, self.faces, self._face_attribs, self._dxfattribs
+        self._load()
+        self._dxfattribs = dxfattribs
+        add_vertex = self.add_vertex
+        new_indices = [add_vertex(tuple(vertices[index * 3:index * 3 + dims[index]])) for index in range(len(dims))]
+
+        def new_index(index):  # 1-based indices, 0 for unused indices
+            if index == 0:
+                return 0
+            index -= 1
+            if index < nvertices:  # existing mesh vertex, located by the rounded location
+                return add_vertex(existing[index]) + 1
+            return new_indices[index - nvertices] + 1
+
+        self.faces.extend(new_index(index) for index in faces)
+        self._face_attribs = face_attribs
+
+    def _clear(self):
+        self.vertices = array('d')  # locations of new mesh vertices as flat array of x, y, z coordinates
+        self._dims = array('b')  # 2 or 3 dimensions of the locations of the new mesh vertices
+        self.faces = array('l')  # 4 1-based vertex indices per new face, 0 for unused indices
+        self._face_attribs = array('l')  # index of DXF attributes in self._dxfattribs for each new face
+        self._dxfattribs = [{}]
+
+    @property
+    def nvertices(self):
+        """ Count of mesh vertices, existing and new. """
+        return self._nvertices + len(self.vertices) // 3
+
+    @property
+    def nfaces(self):
+        """ Count of faces, existing and new. """
+        return self._nfaces + len(self._face_attribs)
+
+    def add_vertex(self, point):
+        """ Returns the 0-based index of the mesh vertex at location *point*, adds a new mesh vertex if no mesh vertex
+        exists at this location.
+        """
+        precision = self.precision
+        dims = 3 if len(point) > 2 else 2
+        point = (point[0], point[1], point[2] if dims == 3 else 0.)
+        key = (round(point[0], precision), round(point[1], precision), round(point[2], precision))
+        try:
+            return self._grid[key]
+        except KeyError:
+            index = self.nvertices
+            self._grid[key] = index
+            self.vertices.extend(point)
+            self._dims.append(dims)
+            return index
+
+    def add_face(self, face, dxfattribs=None):
+        """ Add a single *face*, a face is a list of 3 or 4 (x, y, z)-tuples. """
+        self.add_faces([face], dxfattribs)
+
+    def add_faces(self, faces, dxfattribs=None):
+        """ Add multiple *faces*, a face is a list of 3 or 4 (x, y, z)-tuples. The face records get the DXF
+        attributes *dxfattribs*.
+        """
+        if dxfattribs:
+            self._dxfattribs.append(dict(dxfattribs))
+            attribs_index = len(self._dxfattribs) - 1
+        else:
+            attribs_index = 0
+        add_vertex = self.add_vertex
+        face_indices = self.faces
+        face_attribs = self._face_attribs
+        for face in faces:
+            if len(face) > 4:
+                raise ValueError("A polyface face has 4 vertices at most.")
+            indices = [add_vertex(point) + 1 for point in face]  # DXF indices are 1-based
+            indices.extend([0] * (4 - len(indices)))
+            face_indices.extend(indices)
+            face_attribs.append(attribs_index)
+
+    def commit(self):
+        """ Create the VERTEX entities of all new mesh vertices and face records and update the vertex and face
+        count of the polyface.
+        """
+        self._reload()
+        polyface = self.polyface
+        db = polyface.entitydb
+        handles = db.handles
+
+        # new mesh vertices after the last existing mesh vertex
+        prototype = VertexPrototype(polyface, {'flags': polyface.get_vertex_flags()})
+        location = self._location
+        vertices = self.vertices
+        prev = self._last_vertex
+        succ = prev.link
+        for index, dims in enumerate(self._dims):
+            handle = handles.next()
+            tags = prototype.new_tags(handle)
+            tags.subclasses[location.subclass].set_first(location.code, tuple(vertices[index * 3:index * 3 + dims]))
+            db[handle] = tags
+            prev.link = handle_key(handle)
+            prev = tags
+        prev.link = succ
+        if self._last is self._last_vertex:  # no face records
+            self._last = prev
+        self._last_vertex = prev
+
+        # new face records after the last existing face record
+        prototypes = [VertexPrototype(polyface, dict(dxfattribs, flags=VTX_3D_POLYFACE_MESH_VERTEX))
+                      for dxfattribs in self._dxfattribs]
+        vtx_codes = self._vtx_codes
+        vtx_subclass = self._vtx.subclass
+        faces = self.faces
+        prev = self._last
+        succ = prev.link
+        for face_index, attribs_index in enumerate(self._face_attribs):
+            handle = handles.next()
+            tags = prototypes[attribs_index].new_tags(handle)
+            indices = faces[face_index * 4:face_index * 4 + 4]
+            tags.subclasses[vtx_subclass].extend(
+                DXFTag(code, index) for code, index in zip(vtx_codes, indices) if index != 0)
+            db[handle] = tags
+            prev.link = handle_key(handle)
+            prev = tags
+        prev.link = succ
+        self._last = prev
+
+        self._nvertices = self.nvertices
+        self._nfaces = self.nfaces
+        self._clear()
+        polyface.update_count(self._nvertices, self._nfaces)
+        self._state = self._chain_state()
@@ -5,11 +5,10 @@
 
 import re
 import operator
+from collections import OrderedDict
 
 from .c23 import isstring, Sequence
 
-from .queryparser import EntityQueryParser
-
 
 class EntityQuery(Sequence):
     """EntityQuery is a result container, which is filled with dxf entities matching the query string.
@@ -102,14 +101,68 @@ class EntityQuery(Sequence):
         return EntityQuery(self.entities, query)
 
 
+class MatcherCache(object):
+    """ Bounded LRU cache of compiled entity matchers keyed by query string.
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, query):
+        cache = self._cache
+        try:
+            matcher = cache.pop(query)
+        except KeyError:
+            self.misses += 1
+            matcher = compile_entity_matcher(query)
+            if len(cache) >= self.maxsize:
+                cache.popitem(last=False)  # remove least recently used matcher
+        else:
+            self.hits += 1
+        cache[query] = matcher  # most recently used matcher at the end
+        return matcher
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+matcher_cache = MatcherCache()
+
+
 def entity_matcher(query):
-    query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+    """ Returns the compiled matcher function for *query*, compiled matchers are cached.
+    """
+    return matcher_cache.get(query)
+
+
+def entity_dxftypes(query):
+    """ Returns the DXF types of the entity query of *query* as frozenset or *None* for all DXF types ('*').
+    """
+    return matcher_cache.get(query).dxftypes
 
-    def matcher(entity):
-        return entity_matcher_(entity) and attrib_matcher(entity)
 
+def compile_entity_matcher(query):
+    """ Returns the matcher function for *query*, the attribute *dxftypes* of the matcher function contains the
+    requested DXF types, see entity_dxftypes().
+    """
+    from .queryparser import EntityQueryParser  # the query grammar is build at first query
+    query_args = EntityQueryParser.parseString(query, parseAll=True)
+    names = query_args.EntityQuery
+    entity_matcher_ = build_entity_name_matcher(names)
+    if len(query_args.AttribQuery):
+        attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+
+        def matcher(entity):
+            return entity_matcher_(entity) and attrib_matcher(entity)
+    else:
+        matcher = entity_matcher_
+    matcher.dxftypes = None if names[0] == '*' else frozenset(names)
     return matcher
 
 
@@ -155,6 +208,20 @@ class Relation:
         except ValueError:  # entity supports this attribute, but has no value for it
             return False
 
+    def compile(self):
+        """ Returns the relation as function evaluate(entity). """
+        dxf_attrib = self.dxf_attrib
+        compare = self.compare
+        convert_case = self.convert_case
+        reference = self.value
+
+        def evaluate(entity):
+            try:
+                return compare(convert_case(entity.get_dxf_attrib(dxf_attrib)), reference)
+            except (AttributeError, ValueError):  # attribute not supported or no value
+                return False
+        return evaluate
+
 
 def to_lower(value):
     return value.lower() if hasattr(value, 'lower') else value
@@ -192,6 +259,43 @@ class BoolExpression:
             values.append(value)
         return values.pop()
 
+    def compile(self):
+        """ Returns the expression as one nested function evaluate(entity), the operator order is resolved at compile
+        time like in evaluate().
+        """
+        if isinstance(self.tokens, Relation):
+            return self.tokens.compile()
+
+        functions = []  # first in, first out
+        operators = []  # first in, first out
+        for token in self.tokens:
+            if hasattr(token, 'compile'):
+                functions.append(token.compile())
+            else:  # bool operator
+                operators.append(token)
+        functions.reverse()
+        for op in operators:
+            if op == '!':
+                function = _compile_not(functions.pop())
+            elif op == '&':
+                function = _compile_and(functions.pop(), functions.pop())
+            else:
+                function = _compile_or(functions.pop(), functions.pop())
+            functions.append(function)
+        return functions.pop()
+
+
+def _compile_not(term):
+    return lambda entity: not term(entity)
+
+
+def _compile_and(term1, term2):
+    return lambda entity: term1(entity) and term2(entity)
+
+
+def _compile_or(term1, term2):
+    return lambda entity: term1(entity) or term2(entity)
+
 
 def _compile_tokens(tokens, ignore_case):
     def is_relation(tokens):
@@ -211,12 +315,7 @@ def build_entity_attributes_matcher(tokens, options):
     if not len(tokens):
         return lambda x: True
     ignore_case = 'i' == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))
-
-    def match_bool_expr(entity):
-        return expr.evaluate(entity)
-
-    return match_bool_expr
+    return BoolExpression(_compile_tokens(tokens, ignore_case)).compile()
 
 
 def unique_entities(entities):
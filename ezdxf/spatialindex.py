@@ -0,0 +1,612 @@
+# Purpose: bounding boxes and spatial index of layout entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import math
+
+DEFAULT_EXTRUSION = (0., 0., 1.)
+MAX_CELLS = 64  # entities covering more grid cells are stored in an extra list
+TEXT_DESCENDER = 0.25  # of text height
+POLYFACE_FACE_RECORD = 128
+POLYFACE_MESH_VERTEX = 64
+
+
+def _normalize(v):
+    length = math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+    return v[0] / length, v[1] / length, v[2] / length
+
+
+def _cross(a, b):
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+class OCS(object):
+    """ Object Coordinate System defined by the extrusion vector (arbitrary axis algorithm).
+    """
+    def __init__(self, extrusion=DEFAULT_EXTRUSION):
+        self.transform = tuple(extrusion) != DEFAULT_EXTRUSION
+        if self.transform:
+            az = _normalize(extrusion)
+            if abs(az[0]) < 1. / 64. and abs(az[1]) < 1. / 64.:
+                ax = _normalize(_cross((0., 1., 0.), az))
+            else:
+                ax = _normalize(_cross((0., 0., 1.), az))
+            ay = _normalize(_cross(az, ax))
+            self.ux, self.uy, self.uz = ax, ay, az
+
+    def to_wcs(self, point):
+        """ Returns OCS *point* as WCS point.
+        """
+        if not self.transform:
+            return point
+        x, y, z = point
+        ux, uy, uz = self.ux, self.uy, self.uz
+        return (x * ux[0] + y * uy[0] + z * uz[0],
+                x * ux[1] + y * uy[1] + z * uz[1],
+                x * ux[2] + y * uy[2] + z * uz[2])
+
+
+def _point3d(point, z=0.):
+    return (point[0], point[1], point[2]) if len(point) > 2 else (point[0], point[1], z)
+
+
+def bbox_of_points(points):
+    """ Returns the bounding box (minx, miny, minz, maxx, maxy, maxz) of 3D *points* or *None* for no points.
+    """
+    points = list(points)
+    if not len(points):
+        return None
+    xs, ys, zs = zip(*points)
+    return min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)
+
+
+def union(boxes):
+    """ Returns the bounding box of *boxes*, *None* boxes are ignored.
+    """
+    boxes = [box for box in boxes if box is not None]
+    if not len(boxes):
+        return None
+    return (min(box[0] for box in boxes), min(box[1] for box in boxes), min(box[2] for box in boxes),
+            max(box[3] for box in boxes), max(box[4] for box in boxes), max(box[5] for box in boxes))
+
+
+def corners(box):
+    """ Returns the 8 corner points of *box*.
+    """
+    minx, miny, minz, maxx, maxy, maxz = box
+    return [(x, y, z) for x in (minx, maxx) for y in (miny, maxy) for z in (minz, maxz)]
+
+
+def arc_points(center, radius, start_angle, end_angle):
+    """ Returns the start point, the end point and all quadrant points of an arc in counter clockwise orientation,
+    angles in degrees.
+    """
+    cx, cy = center[0], center[1]
+    start_angle %= 360.
+    end_angle %= 360.
+    if end_angle <= start_angle:
+        end_angle += 360.
+    angles = [start_angle, end_angle]
+    quadrant = math.ceil(start_angle / 90.) * 90.
+    while quadrant < end_angle:
+        angles.append(quadrant)
+        quadrant += 90.
+    return [(cx + radius * math.cos(math.radians(angle)), cy + radius * math.sin(math.radians(angle)))
+            for angle in angles]
+
+
+def bulge_points(start, end, bulge):
+    """ Returns the extreme points of the arc segment from *start* to *end* defined by *bulge*.
+    """
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    chord = math.hypot(dx, dy)
+    if chord == 0.:
+        return []
+    angle = 4. * math.atan(bulge)  # included angle, > 0 counter clockwise
+    radius = chord / (2. * math.sin(abs(angle) / 2.))
+    # distance of center from chord midpoint, positive = left of chord direction
+    sagitta_distance = radius * math.cos(angle / 2.) * (1. if bulge > 0 else -1.)
+    mx, my = (start[0] + end[0]) / 2., (start[1] + end[1]) / 2.
+    center = (mx - dy / chord * sagitta_distance, my + dx / chord * sagitta_distance)
+    start_angle = math.degrees(math.atan2(start[1] - center[1], start[0] - center[0]))
+    end_angle = math.degrees(math.atan2(end[1] - center[1], end[0] - center[0]))
+    if bulge < 0:
+        start_angle, end_angle = end_angle, start_angle
+    return arc_points(center, radius, start_angle, end_angle)
+
+
+def polyline_points(vertices, closed):
+    """ Returns all 2D points of *vertices* (x, y, bulge) including the extreme points of bulge arcs.
+    """
+    points = []
+    count = len(vertices)
+    for index, (x, y, bulge) in enumerate(vertices):
+        points.append((x, y))
+        if bulge != 0. and (index + 1 < count or closed):
+            next_vertex = vertices[(index + 1) % count]
+            points.extend(bulge_points((x, y), next_vertex[:2], bulge))
+    return points
+
+
+def _get(entity, key, default):
+    try:
+        return entity.get_dxf_attrib(key, default)
+    except AttributeError:  # attribute not supported by entity
+        return default
+
+
+def _ocs_bbox(ocs, points2d, z, expand=0.):
+    """ Returns the WCS bounding box of the 2D OCS *points2d* at elevation *z*.
+    """
+    if not len(points2d):
+        return None
+    xs = [p[0] for p in points2d]
+    ys = [p[1] for p in points2d]
+    box = (min(xs) - expand, min(ys) - expand, z, max(xs) + expand, max(ys) + expand, z)
+    return bbox_of_points(ocs.to_wcs(point) for point in corners(box))
+
+
+class BoundingBoxCalculator(object):
+    """ Calculates WCS bounding boxes (minx, miny, minz, maxx, maxy, maxz) of wrapped DXF entities.
+
+    Supported DXF types: LINE, POINT, CIRCLE, ARC, LWPOLYLINE, POLYLINE, TEXT, ATTRIB, INSERT, 3DFACE, SOLID, TRACE
+    and MESH. Text extents are estimated by the text height, text length and width factor. Bounding boxes of block
+    definitions are cached, call clear() after modifying block definitions.
+    """
+    def __init__(self, drawing):
+        self.drawing = drawing
+        self._blocks = {}  # block name -> bounding box in block coordinates
+        self._pending_blocks = set()  # recursion guard
+        self._calculators = {
+            'LINE': self._line,
+            'POINT': self._point,
+            'CIRCLE': self._circle,
+            'ARC': self._arc,
+            'LWPOLYLINE': self._lwpolyline,
+            'POLYLINE': self._polyline,
+            'TEXT': self._text,
+            'ATTRIB': self._text,
+            'INSERT': self._insert,
+            '3DFACE': self._face,
+            'SOLID': self._solid,
+            'TRACE': self._solid,
+            'MESH': self._mesh,
+        }
+
+    def clear(self):
+        self._blocks = {}
+
+    def bbox(self, entity):
+        """ Returns the bounding box of *entity* or *None* for unsupported DXF types and entities without geometry.
+        """
+        try:
+            calculator = self._calculators[entity.dxftype()]
+        except KeyError:
+            return None
+        return calculator(entity)
+
+    @staticmethod
+    def _line(entity):
+        return bbox_of_points([_point3d(entity.dxf.start), _point3d(entity.dxf.end)])
+
+    @staticmethod
+    def _point(entity):
+        return bbox_of_points([_point3d(entity.dxf.location)])
+
+    @staticmethod
+    def _circle(entity):
+        extrusion = _get(entity, 'extrusion', DEFAULT_EXTRUSION)
+        center = OCS(extrusion).to_wcs(_point3d(entity.dxf.center))
+        radius = abs(entity.dxf.radius)
+        normal = _normalize(extrusion)
+        # extents of a circle in 3D space: radius * sqrt(1 - n^2) for each axis
+        extents = [radius * math.sqrt(max(0., 1. - n * n)) for n in normal]
+        return (center[0] - extents[0], center[1] - extents[1], center[2] - extents[2],
+                center[0] + extents[0], center[1] + extents[1], center[2] + extents[2])
+
+    def _arc(self, entity):
+        extrusion = _get(entity, 'extrusion', DEFAULT_EXTRUSION)
+        if tuple(extrusion) != DEFAULT_EXTRUSION:
+            return self._circle(entity)  # full circle as conservative estimation
+        center = _point3d(entity.dxf.center)
+        points = arc_points(center, abs(entity.dxf.radius), entity.dxf.start_angle, entity.dxf.end_angle)
+        return bbox_of_points((x, y, center[2]) for x, y in points)
+
+    def _lwpolyline(self, entity):
+        vertices = []
+        width = abs(_get(entity, 'const_width', 0.))
+        for x, y, start_width, end_width, bulge in entity.get_points():
+            vertices.append((x, y, bulge))
+            width = max(width, abs(start_width), abs(end_width))
+        points = polyline_points(vertices, entity.closed)
+        ocs = OCS(_get(entity, 'extrusion', DEFAULT_EXTRUSION))
+        return _ocs_bbox(ocs, points, _get(entity, 'elevation', 0.), width / 2.)
+
+    def _polyline(self, entity):
+        if entity.is_2d_polyline:
+            vertices = [(vertex.dxf.location[0], vertex.dxf.location[1], _get(vertex, 'bulge', 0.))
+                        for vertex in entity.vertices()]
+            points = polyline_points(vertices, bool(entity.dxf.flags & 1))
+            ocs = OCS(_get(entity, 'extrusion', DEFAULT_EXTRUSION))
+            elevation = _get(entity, 'elevation', (0., 0., 0.))
+            return _ocs_bbox(ocs, points, elevation[2] if len(elevation) > 2 else 0.)
+        points = []
+        for vertex in entity.vertices():
+            flags = _get(vertex, 'flags', 0)
+            if flags & POLYFACE_FACE_RECORD and not flags & POLYFACE_MESH_VERTEX:
+                continue  # face record of a polyface mesh has no location
+            points.append(_point3d(vertex.dxf.location))
+        return bbox_of_points(points)
+
+    @staticmethod
+    def _text(entity):
+        height = abs(_get(entity, 'height', 1.))
+        width = len(_get(entity, 'text', '')) * height * abs(_get(entity, 'width', 1.))
+        halign = _get(entity, 'halign', 0)
+        valign = _get(entity, 'valign', 0)
+        insert = _point3d(entity.dxf.insert)
+        if halign == 0 and valign == 0:
+            origin = insert
+            points = [(0., -TEXT_DESCENDER * height), (width, height)]
+        else:  # alignment point defines the text position, estimate extents in all directions
+            origin = _point3d(_get(entity, 'align_point', insert))
+            points = [(-width, -height), (width, height)]
+        angle = math.radians(_get(entity, 'rotation', 0.))
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        rotated = [(origin[0] + x * cos_a - y * sin_a, origin[1] + x * sin_a + y * cos_a)
+                   for x in (points[0][0], points[1][0]) for y in (points[0][1], points[1][1])]
+        rotated.append(insert[:2])
+        ocs = OCS(_get(entity, 'extrusion', DEFAULT_EXTRUSION))
+        return _ocs_bbox(ocs, rotated, origin[2])
+
+    @staticmethod
+    def _face(entity):
+        return bbox_of_points(_point3d(entity[index]) for index in range(4))
+
+    @staticmethod
+    def _solid(entity):
+        points = []
+        for index in range(4):
+            try:
+                points.append(_point3d(entity[index]))
+            except ValueError:  # 4th vertex is optional
+                pass
+        ocs = OCS(_get(entity, 'extrusion', DEFAULT_EXTRUSION))
+        return bbox_of_points(ocs.to_wcs(point) for point in points)
+
+    @staticmethod
+    def _mesh(entity):
+        return bbox_of_points(_point3d(vertex) for vertex in entity.get_data().vertices)
+
+    def block_bbox(self, name):
+        """ Returns the bounding box of block *name* in block coordinates relative to the block base point.
+        """
+        try:
+            return self._blocks[name]
+        except KeyError:
+            pass
+        if name in self._pending_blocks:  # self referencing block
+            return None
+        block_layout = self.drawing.blocks.get(name)
+        if block_layout is None:
+            return None
+        self._pending_blocks.add(name)
+        try:
+            box = union(self.bbox(entity) for entity in block_layout if entity.dxftype() != 'ATTDEF')
+        finally:
+            self._pending_blocks.discard(name)
+        if box is not None:
+            base_point = _point3d(block_layout.block.dxf.base_point)
+            box = (box[0] - base_point[0], box[1] - base_point[1], box[2] - base_point[2],
+                   box[3] - base_point[0], box[4] - base_point[1], box[5] - base_point[2])
+        self._blocks[name] = box
+        return box
+
+    def _insert(self, entity):
+        boxes = [self.bbox(attrib) for attrib in entity.attribs()]
+        block_box = self.block_bbox(entity.dxf.name)
+        if block_box is not None:
+            boxes.append(transform_block_bbox(
+                block_box,
+                insert=_point3d(entity.dxf.insert),
+                scale=(_get(entity, 'xscale', 1.), _get(entity, 'yscale', 1.), _get(entity, 'zscale', 1.)),
+                rotation=_get(entity, 'rotation', 0.),
+                columns=_get(entity, 'column_count', 1),
+                rows=_get(entity, 'row_count', 1),
+                spacing=(_get(entity, 'column_spacing', 0.), _get(entity, 'row_spacing', 0.)),
+                extrusion=_get(entity, 'extrusion', DEFAULT_EXTRUSION),
+            ))
+        return union(boxes)
+
+
+def transform_block_bbox(block_box, insert, scale=(1., 1., 1.), rotation=0., columns=1, rows=1, spacing=(0., 0.),
+                         extrusion=DEFAULT_EXTRUSION):
+    """ Returns the WCS bounding box of a block reference, *block_box* is the bounding box of the block definition
+    relative to the block base point, *insert* is the OCS insertion point, *rotation* in degrees, *columns*, *rows*
+    and *spacing* define the block array (MINSERT).
+    """
+    columns = max(1, columns)
+    rows = max(1, rows)
+    # block extents of all array elements in unrotated block reference coordinates
+    box = union([
+        (block_box[0] * scale[0], block_box[1] * scale[1], block_box[2] * scale[2],
+         block_box[3] * scale[0], block_box[4] * scale[1], block_box[5] * scale[2]),
+        (block_box[0] * scale[0] + (columns - 1) * spacing[0],
+         block_box[1] * scale[1] + (rows - 1) * spacing[1], block_box[2] * scale[2],
+         block_box[3] * scale[0] + (columns - 1) * spacing[0],
+         block_box[4] * scale[1] + (rows - 1) * spacing[1], block_box[5] * scale[2]),
+    ])
+    box = bbox_of_points(corners(box))  # fix negative scaling
+    angle = math.radians(rotation)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    ocs = OCS(extrusion)
+    return bbox_of_points(
+        ocs.to_wcs((insert[0] + x * cos_a - y * sin_a, insert[1] + x * sin_a + y * cos_a, insert[2] + z))
+        for x, y, z in corners(box)
+    )
+
+
+def _intersects(box, minx, miny, minz, maxx, maxy, maxz):
+    return box[0] <= maxx and box[3] >= minx and box[1] <= maxy and box[4] >= miny and box[2] <= maxz and \
+        box[5] >= minz
+
+
+def _distance(box, point):
+    """ Returns the distance of *point* to *box*, 0 for points inside of the box.
+    """
+    dx = max(box[0] - point[0], 0., point[0] - box[3])
+    dy = max(box[1] - point[1], 0., point[1] - box[4])
+    dz = max(box[2] - point[2], 0., point[2] - box[5]) if len(point) > 2 else 0.
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def _ring_cells(center_col, center_row, ring, bounds):
+    """ Yields the grid cells (column, row) of the square ring with distance *ring* around the center cell, clipped
+    to *bounds* (min column, min row, max column, max row).
+    """
+    min_col, min_row, max_col, max_row = bounds
+    if ring == 0:
+        if min_col <= center_col <= max_col and min_row <= center_row <= max_row:
+            yield center_col, center_row
+        return
+    col1, col2 = center_col - ring, center_col + ring
+    row1, row2 = center_row - ring, center_row + ring
+    cols = range(max(col1, min_col), min(col2, max_col) + 1)
+    for row in (row1, row2):
+        if min_row <= row <= max_row:
+            for col in cols:
+                yield col, row
+    rows = range(max(row1 + 1, min_row), min(row2 - 1, max_row) + 1)
+    for col in (col1, col2):
+        if min_col <= col <= max_col:
+            for row in rows:
+                yield col, row
+
+
+def _handle_key(handle):
+    return int(handle, 16)
+
+
+class SpatialIndex(object):
+    """ Uniform grid of the entity bounding boxes of a layout in the xy-plane.
+
+    The index is built at creation, entities added or deleted by the layout methods update the index, bounding boxes
+    of new entities are calculated at the next query, so entities can be modified until then (POLYLINE vertices,
+    INSERT attribs). Call update() for entities modified later and rebuild() after modifying block definitions.
+
+    :param layout: Layout() or BlockLayout()
+    :param cell_size: grid cell size in drawing units, *None* for an estimation by the layout extents
+    """
+    def __init__(self, layout, cell_size=None):
+        self._layout = layout
+        self._calculator = BoundingBoxCalculator(layout.drawing)
+        self._fixed_cell_size = cell_size
+        self.cell_size = 1.
+        self._boxes = {}  # handle -> bounding box
+        self._grid = {}  # (column, row) -> set of handles
+        self._large = set()  # handles of entities covering more than MAX_CELLS grid cells
+        self._pending = set()  # handles of new entities, bounding boxes are calculated at the next query
+        self._bounds = None  # (min column, min row, max column, max row) of used grid cells
+        self.rebuild()
+
+    def __len__(self):
+        self._flush()
+        return len(self._boxes)
+
+    def __contains__(self, handle):
+        return handle in self._boxes or handle in self._pending
+
+    def rebuild(self):
+        """ Recalculate the bounding boxes of all layout entities.
+        """
+        self._calculator.clear()
+        self._pending.clear()
+        bbox = self._calculator.bbox
+        self._boxes = dict((entity.dxf.handle, bbox(entity)) for entity in self._layout)
+        if self._fixed_cell_size is not None:
+            self.cell_size = float(self._fixed_cell_size)
+        else:
+            self.cell_size = self._estimate_cell_size()
+        self._grid = {}
+        self._large = set()
+        self._bounds = None
+        for handle, box in self._boxes.items():
+            self._insert(handle, box)
+
+    def _estimate_cell_size(self):
+        extents = self.extents()
+        count = len(self._boxes)
+        if extents is None or count == 0:
+            return 1.
+        size = max(extents[3] - extents[0], extents[4] - extents[1]) / math.sqrt(count)
+        return size if size > 0. else 1.
+
+    def _cells(self, box):
+        size = self.cell_size
+        return (int(math.floor(box[0] / size)), int(math.floor(box[1] / size)),
+                int(math.floor(box[3] / size)), int(math.floor(box[4] / size)))
+
+    def _insert(self, handle, box):
+        if box is None:
+            return
+        col1, row1, col2, row2 = self._cells(box)
+        if (col2 - col1 + 1) * (row2 - row1 + 1) > MAX_CELLS:
+            self._large.add(handle)
+            return
+        bounds = self._bounds
+        if bounds is None:
+            self._bounds = (col1, row1, col2, row2)
+        else:  # bounds are not reduced by removing entities
+            self._bounds = (min(col1, bounds[0]), min(row1, bounds[1]), max(col2, bounds[2]), max(row2, bounds[3]))
+        grid = self._grid
+        for col in range(col1, col2 + 1):
+            for row in range(row1, row2 + 1):
+                try:
+                    grid[col, row].add(handle)
+                except KeyError:
+                    grid[col, row] = {handle}
+
+    def _remove(self, handle):
+        box = self._boxes.pop(handle, None)
+        if box is None:
+            return
+        if handle in self._large:
+            self._large.discard(handle)
+            return
+        col1, row1, col2, row2 = self._cells(box)
+        grid = self._grid
+        for col in range(col1, col2 + 1):
+            for row in range(row1, row2 + 1):
+                handles = grid.get((col, row))
+                if handles is not None:
+                    handles.discard(handle)
+                    if not len(handles):
+                        del grid[col, row]
+
+    def _flush(self):
+        if not len(self._pending):
+            return
+        wrap = self._layout.get_entity_by_handle
+        entitydb = self._layout.entitydb
+        bbox = self._calculator.bbox
+        for handle in self._pending:
+            if handle in entitydb:
+                box = bbox(wrap(handle))
+                self._boxes[handle] = box
+                self._insert(handle, box)
+        self._pending.clear()
+
+    def add_handle(self, handle):
+        """ Add entity *handle* to the index, the bounding box is calculated at the next query.
+        """
+        self._remove(handle)
+        self._pending.add(handle)
+
+    def discard_handle(self, handle):
+        """ Remove entity *handle* from the index.
+        """
+        self._pending.discard(handle)
+        self._remove(handle)
+
+    def update(self, entity):
+        """ Recalculate the bounding box of the modified *entity*.
+        """
+        self.add_handle(entity.dxf.handle)
+
+    def clear(self):
+        """ Remove all entities from the index.
+        """
+        self._boxes = {}
+        self._grid = {}
+        self._large = set()
+        self._bounds = None
+        self._pending.clear()
+
+    def bbox(self, handle):
+        """ Returns the bounding box of entity *handle* or *None*.
+        """
+        self._flush()
+        return self._boxes.get(handle)
+
+    def extents(self):
+        """ Returns the bounding box of all indexed entities or *None*.
+        """
+        self._flush()
+        return union(self._boxes.values())
+
+    def intersecting_handles(self, min_point, max_point):
+        """ Returns the handles of all entities with bounding boxes intersecting the box defined by the points
+        *min_point* and *max_point*, sorted by handle. The z-axis is ignored for 2D points.
+        """
+        self._flush()
+        if len(min_point) > 2 and len(max_point) > 2:
+            minz, maxz = min(min_point[2], max_point[2]), max(min_point[2], max_point[2])
+        else:
+            minz, maxz = float('-inf'), float('inf')
+        window = (min(min_point[0], max_point[0]), min(min_point[1], max_point[1]), minz,
+                  max(min_point[0], max_point[0]), max(min_point[1], max_point[1]), maxz)
+        candidates = set(self._large)
+        col1, row1, col2, row2 = self._cells(window)
+        grid = self._grid
+        if (col2 - col1 + 1) * (row2 - row1 + 1) > len(grid):
+            for (col, row), handles in grid.items():  # window covers more cells than used
+                if col1 <= col <= col2 and row1 <= row <= row2:
+                    candidates.update(handles)
+        else:
+            for col in range(col1, col2 + 1):
+                for row in range(row1, row2 + 1):
+                    handles = grid.get((col, row))
+                    if handles is not None:
+                        candidates.update(handles)
+        boxes = self._boxes
+        entitydb = self._layout.entitydb
+        result = [handle for handle in candidates if _intersects(boxes[handle], *window) and handle in entitydb]
+        return sorted(result, key=_handle_key)
+
+    def nearest_handle(self, point, matcher=None):
+        """ Returns (distance, handle) of the entity with the nearest bounding box to *point* or *None*, considers
+        only entities for which *matcher(entity)* is *True* if *matcher* is not *None*. The z-axis is ignored for 2D
+        points.
+        """
+        self._flush()
+        boxes = self._boxes
+        entitydb = self._layout.entitydb
+        wrap = self._layout.get_entity_by_handle
+        best = [float('inf'), None]
+        seen = set()
+
+        def check(handles):
+            for handle in handles:
+                if handle in seen:
+                    continue
+                seen.add(handle)
+                distance = _distance(boxes[handle], point)
+                if distance < best[0] and handle in entitydb and (matcher is None or matcher(wrap(handle))):
+                    best[0] = distance
+                    best[1] = handle
+
+        check(self._large)
+        if self._bounds is not None:
+            center_col = int(math.floor(point[0] / self.cell_size))
+            center_row = int(math.floor(point[1] / self.cell_size))
+            bounds = self._bounds
+            col1, row1, col2, row2 = bounds
+            max_ring = max(abs(center_col - col1), abs(center_col - col2), abs(center_row - row1),
+                           abs(center_row - row2))
+            # first ring overlapping the used grid cells, 0 for points inside of the bounds
+            min_ring = max(0, col1 - center_col, center_col - col2, row1 - center_row, center_row - row2)
+            grid = self._grid
+            for ring in range(min_ring, max_ring + 1):
+                for cell in _ring_cells(center_col, center_row, ring, bounds):
+                    handles = grid.get(cell)
+                    if handles is not None:
+                        check(handles)
+                # entities in the next ring are at least ring * cell_size away
+                if best[1] is not None and best[0] <= ring * self.cell_size:
+                    break
+        if best[1] is None:
+            return None
+        return best[0], best[1]
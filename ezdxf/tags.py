@@ -6,12 +6,17 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from io import StringIO
+from itertools import islice
 
 from .codepage import toencoding
 from .const import acadrelease, DXFStructureError
-from .dxftag import NONE_TAG, DXFTag, is_point_code, cast_tag
+from .dxftag import NONE_TAG, DXFTag, RawTag, is_point_code, cast_tag, raw_tag
+from .options import options
 from .compressedstring import CompressedString
 
+# min. tag count of Tags() for group code lookups by a code to index map, shorter tag lists are searched linearly
+CODE_INDEX_MIN_LENGTH = 8
+
 
 def write_tags(stream, tags):
     for tag in tags:
@@ -26,6 +31,7 @@ class TagIterator(object):
         self.last_tag = NONE_TAG
         self.undo_coord = None
         self.eof = False
+        self.cast_tag = raw_tag if options.lazy_cast else cast_tag
 
     def __iter__(self):
         return self
@@ -86,7 +92,7 @@ class TagIterator(object):
                 if is_point_code(code):  # 2D or 3D point
                     value = read_point(code, value)
 
-            self.last_tag = cast_tag((code, value))
+            self.last_tag = self.cast_tag((code, value))
             return self.last_tag
 
         if self.eof:  # stored end of file
@@ -111,6 +117,184 @@ class TagIterator(object):
             raise ValueError('No tag to undo')
 
 
+class BufferedTagIterator(object):
+    """ Fast tag reader, reads the *textfile* in large blocks and splits the lines in bulk.
+
+    Yields the same DXFTag() sequence as TagIterator(), including 2D/3D point merging, skipping of comments
+    (code 999) and undotag(). *textfile* requires a read() method, streams with just a readline() method are
+    supported, but read line by line.
+    """
+    BLOCK_SIZE = 1 << 20  # characters
+
+    def __init__(self, textfile, blocksize=None):
+        self.textfile = textfile
+        self.blocksize = blocksize or self.BLOCK_SIZE
+        self.lineno = 0
+        self.undo = False
+        self.last_tag = NONE_TAG
+        self._last_tag_lines = 0
+        self.cast_tag = raw_tag if options.lazy_cast else cast_tag
+        # record the source text of structures for options.verbatim_passthrough, see StructureTag()
+        self._record_spans = options.verbatim_passthrough
+        self._span_text = ''  # source text of the last completed structure
+        self._tags = self._cast_tags()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.undo:
+            self.undo = False
+            self.lineno += self._last_tag_lines
+            return self.last_tag
+        lineno = self.lineno
+        self.last_tag = next(self._tags)
+        self._last_tag_lines = self.lineno - lineno
+        return self.last_tag
+    # for Python 2.7
+    next = __next__
+
+    def undotag(self):
+        if not self.undo and self.last_tag is not NONE_TAG:
+            self.undo = True
+            self.lineno -= self._last_tag_lines
+        else:
+            raise ValueError('No tag to undo')
+
+    def _read_blocks(self):
+        read = getattr(self.textfile, 'read', None)
+        if read is not None:
+            blocksize = self.blocksize
+            while True:
+                block = read(blocksize)
+                if not block:
+                    return
+                yield block
+        else:  # stream supports just readline(), like ZipReader()
+            readline = self.textfile.readline
+            while True:
+                line = readline()
+                if not line:
+                    return
+                yield line
+
+    def _raw_tags(self):
+        """ Yields (code, value) tuples, group codes as int, values as raw strings without line endings.
+
+        If recording is enabled, the source text in front of each (0, ...) tag, which is the source text of the
+        preceding structure, is stored in self._span_text before the tag is yielded, the source text of the last
+        structure is stored at the end of the stream.
+        """
+        record = self._record_spans
+        span = []  # source text chunks of the current structure
+        tail = ''
+        code_line = None
+        for block in self._read_blocks():
+            lines = (tail + block).split('\n')
+            tail = lines.pop()  # incomplete last line
+            if code_line is not None:
+                lines.insert(0, code_line)
+                code_line = None
+            if len(lines) & 1:  # value of last group code is in the next block
+                code_line = lines.pop()
+            index = 0
+            span_start = 0
+            count = len(lines)
+            while index < count:
+                try:
+                    code = int(lines[index])
+                except ValueError:  # like TagIterator(): invalid group code ends the tag stream
+                    return
+                if code == 0 and record:
+                    if index > span_start:
+                        span.append('\n'.join(lines[span_start:index]) + '\n')
+                    self._span_text = ''.join(span)
+                    span = []
+                    span_start = index
+                self.lineno += 2
+                yield code, lines[index + 1]
+                index += 2
+            if record and count > span_start:
+                span.append('\n'.join(lines[span_start:count]) + '\n')
+
+        if code_line is None:  # last line without line ending
+            code_line, tail = tail, ''
+        if code_line:
+            try:
+                code = int(code_line)
+            except ValueError:
+                code = None
+            if code is not None:
+                if code == 0 and record:
+                    self._span_text = ''.join(span)
+                    span = []
+                span.append(code_line + '\n' + tail + '\n')
+                self.lineno += 2
+                yield code, tail
+        if record:
+            self._span_text = ''.join(span)
+
+    def _cast_tags(self):
+        cast_tag = self.cast_tag
+        raw_tags = self._raw_tags()
+        record = self._record_spans
+        structure_tag = None  # StructureTag() waiting for its source text
+        undo_coord = None
+        while True:
+            if undo_coord is not None:
+                code, value = undo_coord
+                undo_coord = None
+                self.lineno += 2
+            else:
+                try:
+                    code, value = next(raw_tags)
+                except StopIteration:
+                    break
+            if code == 999:  # skip comments
+                continue
+
+            if code == 0 and record:
+                if structure_tag is not None:
+                    structure_tag.source_text = self._span_text
+                structure_tag = StructureTag(code, value)
+                yield structure_tag
+                continue
+
+            if is_point_code(code):  # 2D or 3D point
+                try:
+                    code_y, value_y = next(raw_tags)  # 2. coordinate is always necessary
+                except StopIteration:
+                    code_y = 0
+                if code_y != code + 10:
+                    raise DXFStructureError("invalid 2D/3D point at line %d" % self.lineno)
+                try:
+                    code_z, value_z = next(raw_tags)
+                except StopIteration:  # 2D point at end of file
+                    yield cast_tag((code, (value, value_y)))
+                    break
+                if code_z == code + 20:  # is a 3D point
+                    value = (value, value_y, value_z)
+                else:  # not a Z coordinate -> 2D point
+                    undo_coord = (code_z, value_z)
+                    self.lineno -= 2
+                    value = (value, value_y)
+            yield cast_tag((code, value))
+
+        if structure_tag is not None:
+            structure_tag.source_text = self._span_text
+
+
+class StructureTag(DXFTag):
+    """ DXFTag(0, ...) yielded by the BufferedTagIterator() for options.verbatim_passthrough, *source_text* is the
+    source text of the structure, from this tag up to the next (0, ...) tag. The source text is set after the
+    structure has been read completely.
+
+    ClassifiedTags() takes the source text and stores a plain DXFTag(), so StructureTag() instances exist just while
+    loading.
+    """
+    source_text = None  # no __slots__: source_text is stored in the instance __dict__
+
+
 class StringIterator(TagIterator):
     def __init__(self, string):
         super(StringIterator, self).__init__(StringIO(string))
@@ -141,7 +325,7 @@ class DXFInfo(object):
 def dxf_info(stream):
     info = DXFInfo()
     tag = (999999, '')
-    tagreader = TagIterator(stream)
+    tagreader = BufferedTagIterator(stream)
     while tag != (0, 'ENDSEC'):
         tag = next(tagreader)
         if tag.code != 9:
@@ -155,7 +339,101 @@ def dxf_info(stream):
 
 
 class Tags(list):
-    """ DXFTag() chunk as flat list. """
+    """ DXFTag() chunk as flat list.
+
+    Group code lookups of long tag lists use a code to index map, which is built at the first lookup and invalidated
+    by list mutations, which change the position of group codes.
+
+    All list mutations set *modified* to *True*, which marks the DXF entity as modified for
+    options.verbatim_passthrough.
+    """
+    _code_index = None  # {code: index of first tag}, see _get_code_index()
+    modified = False
+
+    def _get_code_index(self):
+        code_index = self._code_index
+        if code_index is None:
+            code_index = {}
+            setdefault = code_index.setdefault
+            for index, tag in enumerate(self):
+                setdefault(tag.code, index)
+            self._code_index = code_index
+        return code_index
+
+    # list mutations
+
+    def __setitem__(self, index, tag):
+        self.modified = True
+        if self._code_index is not None:
+            # replacing a tag by a tag with the same group code keeps the code index valid
+            if type(index) is slice or list.__getitem__(self, index).code != tag.code:
+                self._code_index = None
+        list.__setitem__(self, index, tag)
+
+    def __delitem__(self, index):
+        self.modified = True
+        self._code_index = None
+        list.__delitem__(self, index)
+
+    def __setslice__(self, i, j, tags):  # Python 2.7
+        self.modified = True
+        self._code_index = None
+        list.__setslice__(self, i, j, tags)
+
+    def __delslice__(self, i, j):  # Python 2.7
+        self.modified = True
+        self._code_index = None
+        list.__delslice__(self, i, j)
+
+    def __iadd__(self, tags):
+        self.modified = True
+        self._code_index = None
+        return list.__iadd__(self, tags)
+
+    def __imul__(self, count):
+        self.modified = True
+        self._code_index = None
+        return list.__imul__(self, count)
+
+    def append(self, tag):
+        self.modified = True
+        code_index = self._code_index
+        if code_index is not None and tag.code not in code_index:
+            code_index[tag.code] = len(self)
+        list.append(self, tag)
+
+    def extend(self, tags):
+        self.modified = True
+        self._code_index = None
+        list.extend(self, tags)
+
+    def insert(self, index, tag):
+        self.modified = True
+        self._code_index = None
+        list.insert(self, index, tag)
+
+    def pop(self, index=-1):
+        self.modified = True
+        self._code_index = None
+        return list.pop(self, index)
+
+    def remove(self, tag):
+        self.modified = True
+        self._code_index = None
+        list.remove(self, tag)
+
+    def reverse(self):
+        self.modified = True
+        self._code_index = None
+        list.reverse(self)
+
+    def sort(self, *args, **kwargs):
+        self.modified = True
+        self._code_index = None
+        list.sort(self, *args, **kwargs)
+
+    # Tags() interface
+
     def write(self, stream):
         write_tags(stream, self)
 
@@ -191,24 +469,25 @@ class Tags(list):
     def find_first(self, code, default=ValueError):
         """ Returns value of first DXFTag(code, ...) or default if default != ValueError, else raises ValueError.
         """
-        for tag in self:
-            if tag.code == code:
-                return tag.value
-        if default is ValueError:
-            raise ValueError(code)
-        else:
-            return default
+        try:
+            return self.get_value(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
 
     def get_first_tag(self, code, default=ValueError):
         """ Returns first DXFTag(code, ...) or default if default != ValueError, else raises ValueError.
         """
-        for tag in self:
-            if tag.code == code:
-                return tag
-        if default is ValueError:
-            raise ValueError(code)
-        else:
-            return default
+        try:
+            index = self.tag_index(code)
+        except ValueError:
+            if default is ValueError:
+                raise ValueError(code)
+            else:
+                return default
+        return self._cast_tag(index)
 
     def find_all(self, code):
         """ Returns a list of DXFTag(code, ...).
@@ -218,24 +497,32 @@ class Tags(list):
     def tag_index(self, code, start=0, end=None):
         """ Return first index of DXFTag(code, ...).
         """
-        if end is None:
-            end = len(self)
-        for index, tag in enumerate(self[start:end]):
+        count = len(self)
+        if start == 0 and end is None and count >= CODE_INDEX_MIN_LENGTH:
+            try:
+                return self._get_code_index()[code]
+            except KeyError:
+                raise ValueError(code)
+        for index, tag in enumerate(islice(self, start, end), start):
             if tag.code == code:
-                return start + index
+                return index
         raise ValueError(code)
 
     def has_tag(self, code):
+        if len(self) >= CODE_INDEX_MIN_LENGTH:
+            return code in self._get_code_index()
         for tag in self:
             if tag.code == code:
                 return True
         return False
 
     def update(self, code, value):
-        """ Update first existing tag, raises ValueError if tag not exists.
+        """ Update first existing tag, raises ValueError if tag not exists. Setting the same value is not a
+        modification.
         """
         index = self.tag_index(code)
-        self[index] = DXFTag(code, value)
+        if self._cast_tag(index).value != value:
+            self[index] = DXFTag(code, value)
 
     def set_first(self, code, value):
         """ Update first existing DXFTag(code, ...) or append a new
@@ -250,7 +537,16 @@ class Tags(list):
 
     def get_value(self, code):
         index = self.tag_index(code)
-        return self[index].value
+        return self._cast_tag(index).value
+
+    def _cast_tag(self, index):
+        """ Returns tag at *index*, replaces a RawTag() by the cast DXFTag() at first access.
+        """
+        tag = self[index]
+        if type(tag) is RawTag:
+            tag = tag.cast()
+            list.__setitem__(self, index, tag)  # same code: code index is still valid, and the entity is unmodified
+        return tag
 
     @staticmethod
     def from_text(text):
@@ -266,9 +562,9 @@ class Tags(list):
         return self.__copy__()
 
     def remove_tags(self, codes):
-        delete_tags = [tag for tag in self if tag.code in codes]
-        for tag in delete_tags:
-            self.remove(tag)
+        codes = frozenset(codes)
+        if any(self.has_tag(code) for code in codes):
+            self[:] = [tag for tag in self if tag.code not in codes]
 
     def collect_consecutive_tags(self, codes, start=0, end=None):
         """Collect all consecutive tags with code in codes, start and end delimits the search range. A tag code not
@@ -0,0 +1,54 @@
+# Purpose: in-process cache of tokenized template files
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+import os
+
+from .tags import BufferedTagIterator
+from .templatefinder import TemplateFinder
+from .options import options
+
+
+class TemplateCache(object):
+    """ Cache of tokenized template files keyed by the absolute file path, used by Drawing.new().
+
+    DXF tags are immutable, so all new drawings share the cached tags and only the mutable structures of a drawing
+    (entity database, sections, layouts) are built for each new drawing. A cached template is reloaded if the
+    modification time or size of the template file changes.
+    """
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}  # (filepath, lazy_cast) -> (mtime, size, tags)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, dxfversion, template_dir=None):
+        """ Returns the tags of the template file for *dxfversion* as tuple of DXFTag(). """
+        finder = TemplateFinder(template_dir)
+        filepath = os.path.abspath(finder.filepath(dxfversion))
+        stat = os.stat(filepath)
+        key = (filepath, options.lazy_cast)  # lazy_cast changes the type of the tags
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        stream = finder.getstream(dxfversion)
+        try:
+            tags = tuple(BufferedTagIterator(stream))
+        finally:
+            stream.close()
+        self._cache[key] = (stat.st_mtime, stat.st_size, tags)
+        return tags
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+template_cache = TemplateCache()
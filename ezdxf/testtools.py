@@ -30,6 +30,7 @@ class DrawingProxy:
         self.dxfversion = version
         self.entitydb = EntityDB()
         self.dxffactory = dxffactory(self)
+        self.vertex_arrays = {}
 
     def modelspace(self):
         return ModelSpace()
@@ -0,0 +1,263 @@
+# Purpose: array based vertex storage for POLYLINE entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from array import array
+
+from .handle import handle_key
+
+
+# vertex attributes stored in arrays, all other vertex attributes are stored in the VERTEX entities
+ARRAY_ATTRIBS = ('start_width', 'end_width', 'bulge', 'flags')
+# modification flags of vertices
+LOCATION_MODIFIED = 1
+ATTRIBS_MODIFIED = 2
+
+
+def _point3d(point):
+    return (point[0], point[1], point[2] if len(point) > 2 else 0.)
+
+
+class VertexPrototype(object):
+    """ VERTEX entity template for new vertices, the prototype is not stored in the entity database.
+    """
+    def __init__(self, polyline, dxfattribs):
+        factory = polyline.dxffactory
+        vertex = factory.new_entity('VERTEX', '0', dxfattribs)
+        factory.copy_layout(polyline, vertex)
+        self.tags = vertex.tags
+
+    def new_tags(self, handle):
+        # DXF tags are immutable, copying the tag lists is sufficient and much faster than ClassifiedTags.clone()
+        def copy(tag_lists):
+            return [tags.__class__(tags) for tags in tag_lists]
+
+        prototype = self.tags
+        tags = prototype.__class__()
+        tags.subclasses = copy(prototype.subclasses)
+        tags.appdata = copy(prototype.appdata)
+        tags.xdata = copy(prototype.xdata)
+        tags.replace_handle(handle)
+        return tags
+
+
+class VertexArray(object):
+    """ Vertices of a POLYLINE entity stored in arrays, locations as flat array('d') of x, y, z coordinates,
+    start width, end width and bulge as array('d') and vertex flags as array('l').
+
+    Indexing is O(1), appending, inserting and deleting of many vertices is done by one array operation. The changes
+    are written back to the VERTEX entities by flush(), which is called automatically before the drawing is written
+    and before the vertices of the POLYLINE entity are accessed by the Polyline() methods. All other DXF attributes of
+    existing vertices are preserved.
+
+    Get the VertexArray() of a POLYLINE entity by Polyline.vertex_array().
+    """
+    def __init__(self, polyline):
+        self._polyline = polyline
+        vertex_class = polyline.dxffactory.ENTITY_WRAPPERS['VERTEX']
+        dxfattribs = vertex_class.DXFATTRIBS
+        self._location = dxfattribs['location']
+        self._attribs = [(name, dxfattribs[name]) for name in ARRAY_ATTRIBS]
+        self._loaded = False
+        self._changed = False
+
+    def _load(self):
+        polyline = self._polyline
+        db = polyline.entitydb
+        # A loaded VertexArray() is registered at the drawing, the Polyline() methods flush it before they access or
+        # change the VERTEX entities, so the next access reloads the vertices. Just one VertexArray() per POLYLINE
+        # entity is loaded at the same time.
+        vertex_arrays = polyline.drawing.vertex_arrays
+        other = vertex_arrays.get(polyline.dxf.handle)
+        if other is not None and other is not self:
+            other.flush()
+        self.locations = array('d')
+        self.start_width = array('d')
+        self.end_width = array('d')
+        self.bulge = array('d')
+        self.flags = array('l')
+        self._handles = []  # None for new vertices
+        self._tags = []  # VertexPrototype() for new vertices
+        self._modified = array('b')
+        self._deleted = []  # handles of deleted VERTEX entities
+        location = self._location
+        attribs = [(getattr(self, name), dxfattr) for name, dxfattr in self._attribs]
+        handle = polyline.tags.link
+        while handle is not None:
+            tags = db[handle]
+            if tags.dxftype() != 'VERTEX':  # SEQEND
+                break
+            self._handles.append(handle)
+            self._tags.append(tags)
+            self._modified.append(0)
+            self.locations.extend(_point3d(tags.subclasses[location.subclass].find_first(location.code, (0., 0., 0.))))
+            for values, dxfattr in attribs:
+                values.append(tags.subclasses[dxfattr.subclass].find_first(dxfattr.code, dxfattr.default or 0))
+            handle = tags.link
+        self._seqend = handle
+        self._loaded = True
+        self._changed = False
+        vertex_arrays[polyline.dxf.handle] = self
+
+    def _check(self):
+        if not self._loaded:
+            self._load()
+        self._changed = True
+
+    def __len__(self):
+        if not self._loaded:
+            self._load()
+        return len(self._handles)
+
+    def _index(self, index):
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('vertex index out of range')
+        return index
+
+    def __getitem__(self, index):
+        """ Returns location of vertex *index* as (x, y, z) tuple. """
+        index = self._index(index) * 3
+        return tuple(self.locations[index:index + 3])
+
+    def __setitem__(self, index, point):
+        """ Set location of vertex *index*. """
+        self._check()
+        index = self._index(index)
+        self.locations[index * 3:index * 3 + 3] = array('d', _point3d(point))
+        self._modified[index] |= LOCATION_MODIFIED
+
+    def __iter__(self):
+        locations = self.points_array()
+        return (tuple(locations[index:index + 3]) for index in range(0, len(locations), 3))
+
+    def points_array(self):
+        """ Returns the locations of all vertices as flat array('d') of x, y, z coordinates. """
+        if not self._loaded:
+            self._load()
+        return array('d', self.locations)
+
+    def get_attrib(self, index, key):
+        """ Returns vertex attribute *key* of vertex *index*, *key* is 'start_width', 'end_width', 'bulge' or
+        'flags'.
+        """
+        key = self._valid_key(key)
+        index = self._index(index)  # loads the vertices
+        return getattr(self, key)[index]
+
+    def set_attrib(self, index, key, value):
+        """ Set vertex attribute *key* of vertex *index*, *key* is 'start_width', 'end_width', 'bulge' or 'flags'.
+        """
+        key = self._valid_key(key)
+        self._check()
+        index = self._index(index)
+        getattr(self, key)[index] = value
+        self._modified[index] |= ATTRIBS_MODIFIED
+
+    @staticmethod
+    def _valid_key(key):
+        if key not in ARRAY_ATTRIBS:
+            raise ValueError("Invalid vertex attribute '{}'.".format(key))
+        return key
+
+    def append(self, points, dxfattribs=None):
+        """ Append *points* as new vertices with the DXF attributes *dxfattribs*. """
+        self.insert(len(self), points, dxfattribs)
+
+    def insert(self, pos, points, dxfattribs=None):
+        """ Insert *points* as new vertices at position *pos* with the DXF attributes *dxfattribs*. """
+        self._check()
+        count = len(self._handles)
+        if pos < 0:
+            pos += count
+        pos = max(0, min(pos, count))
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['flags'] = dxfattribs.get('flags', 0) | self._polyline.get_vertex_flags()
+        values = dict((name, dxfattribs.pop(name, 0.)) for name in ARRAY_ATTRIBS)
+        # the new VERTEX entities get the array attributes by the prototype, default values are not stored
+        dxfattribs.update((name, value) for name, value in values.items() if value or name == 'flags')
+        prototype = VertexPrototype(self._polyline, dxfattribs)
+
+        locations = array('d')
+        for point in points:
+            locations.extend(_point3d(point))
+        new = len(locations) // 3
+        if new == 0:
+            return
+        self.locations[pos * 3:pos * 3] = locations
+        for name in ARRAY_ATTRIBS:
+            values_array = getattr(self, name)
+            values_array[pos:pos] = array(values_array.typecode, [values[name]]) * new
+        self._modified[pos:pos] = array('b', [LOCATION_MODIFIED]) * new  # all other attributes by the prototype
+        self._handles[pos:pos] = [None] * new
+        self._tags[pos:pos] = [prototype] * new
+
+    def delete(self, pos, count=1):
+        """ Delete *count* vertices starting at position *pos*. """
+        self._check()
+        pos = self._index(pos)
+        end = pos + count
+        if count < 1 or end > len(self._handles):
+            raise ValueError("invalid count")
+        self._deleted.extend(handle for handle in self._handles[pos:end] if handle is not None)
+        del self.locations[pos * 3:end * 3]
+        for name in ARRAY_ATTRIBS:
+            del getattr(self, name)[pos:end]
+        del self._modified[pos:end]
+        del self._handles[pos:end]
+        del self._tags[pos:end]
+
+    def flush(self):
+        """ Write all changes back to the VERTEX entities and rebuild the link structure of the POLYLINE entity. The
+        VertexArray() reloads the vertices at the next access.
+        """
+        if not self._loaded:
+            return
+        polyline = self._polyline
+        vertex_arrays = polyline.drawing.vertex_arrays
+        if vertex_arrays.get(polyline.dxf.handle) is self:
+            del vertex_arrays[polyline.dxf.handle]
+        self._loaded = False
+        if self._changed:
+            self._write_back()
+            self._changed = False
+
+    def _write_back(self):
+        polyline = self._polyline
+        db = polyline.entitydb
+        handles = db.handles
+        for handle in self._deleted:
+            db.delete_handle(handle)
+
+        location = self._location
+        attribs = [(getattr(self, name), dxfattr) for name, dxfattr in self._attribs]
+        modified = self._modified
+        locations = self.locations
+        update_subclass = hasattr(polyline.dxffactory.ENTITY_WRAPPERS['VERTEX'], 'update_subclass_specifier')
+        prev = polyline.tags
+        for index, handle in enumerate(self._handles):
+            tags = self._tags[index]
+            if handle is None:  # new vertex
+                handle = handles.next()
+                tags = tags.new_tags(handle)
+                handle = handle_key(handle)
+                db[handle] = tags
+            if modified[index] & LOCATION_MODIFIED:
+                point = tuple(locations[index * 3:index * 3 + 3])
+                tags.subclasses[location.subclass].set_first(location.code, point)
+            if modified[index] & ATTRIBS_MODIFIED:
+                for values, dxfattr in attribs:
+                    subclass = tags.subclasses[dxfattr.subclass]
+                    value = values[index]
+                    if subclass.find_first(dxfattr.code, None) != value:
+                        subclass.set_first(dxfattr.code, value)
+                        if dxfattr.code == 70 and update_subclass:  # DXF R2000+: subclass name depends on flags
+                            polyline.dxffactory.wrap_handle(handle).update_subclass_specifier()
+            prev.link = handle
+            prev = tags
+        prev.link = self._seqend
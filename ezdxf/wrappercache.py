@@ -0,0 +1,64 @@
+# Purpose: identity map of wrapped DXF entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+__author__ = "mozman <mozman@gmx.at>"
+
+from collections import namedtuple
+from weakref import WeakValueDictionary
+
+from .handle import handle_key
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses size')
+
+
+class WrapperCache(object):
+    """ Identity map of wrapped DXF entities keyed by handle, repeated wrapping of the same handle returns the same
+    wrapper object as long as this wrapper is referenced elsewhere.
+
+    The map holds weak references, so it costs no memory for wrappers which are not in use, and a single pass over
+    many entities does not evict anything. A cached wrapper is only returned if it still wraps the tags stored in the
+    entity database, so replaced database entries are detected without explicit invalidation.
+
+    Handles are stored as integer keys like in the entity database, all methods accept hex strings and integer keys.
+    """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._cache = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, handle):
+        try:
+            return handle_key(handle) in self._cache
+        except KeyError:  # invalid handle
+            return False
+
+    def get(self, handle, tags):
+        """ Returns the cached wrapper of *handle* for *tags* or *None*. """
+        entity = self._cache.get(handle_key(handle))
+        if entity is not None and entity.tags is tags:
+            self.hits += 1
+            return entity
+        self.misses += 1
+        return None
+
+    def put(self, handle, entity):
+        if self.enabled:
+            self._cache[handle_key(handle)] = entity
+
+    def discard(self, handle):
+        self._cache.pop(handle_key(handle), None)
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """ Returns the cache statistic as CacheInfo(hits, misses, size). """
+        return CacheInfo(self.hits, self.misses, len(self._cache))
@@ -8,8 +8,11 @@
 from __future__ import unicode_literals
 
 import unittest
+import sys
+import types
 
 import ezdxf
+from ezdxf.modern import mesh as mesh_module
 from ezdxf.modern.mesh import Mesh
 from ezdxf.classifiedtags import ClassifiedTags
 
@@ -53,6 +56,196 @@ class TestNewMesh(unittest.TestCase):
         self.assertEqual(0, mesh.dxf.subdivision_levels)
 
 
+def flat(values):
+    # array accessors return NumPy arrays if NumPy is available, else flat array.array() objects
+    return list(values.flatten()) if hasattr(values, 'flatten') else list(values)
+
+
+class TestMeshArrays(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh(ClassifiedTags.from_text(MESH), DWG)
+
+    def test_arrays_match_lists(self):
+        mesh = self.mesh
+        vertices = mesh.get_vertices()
+        self.assertEqual([coord for vertex in vertices for coord in vertex], flat(mesh.vertices_array()))
+        offsets, indices = mesh.faces_arrays()
+        offsets, indices = flat(offsets), flat(indices)
+        faces = [tuple(indices[start:end]) for start, end in zip(offsets, offsets[1:])]
+        self.assertEqual(mesh.get_faces(), faces)
+        edges = flat(mesh.edges_array())
+        self.assertEqual(mesh.get_edges(), list(zip(edges[::2], edges[1::2])))
+        self.assertEqual(mesh.get_edge_crease_values(), flat(mesh.edge_crease_values_array()))
+
+    def test_set_arrays_round_trip(self):
+        mesh = self.mesh
+        vertices = mesh.vertices_array()
+        faces = mesh.faces_arrays()
+        edges = mesh.edges_array()
+        creases = mesh.edge_crease_values_array()
+        data = mesh.get_data()
+        mesh.set_arrays(vertices, faces, edges, creases)
+        self.assertEqual(data.vertices, mesh.get_vertices())
+        self.assertEqual(data.faces, mesh.get_faces())
+        self.assertEqual(data.edges, mesh.get_edges())
+        self.assertEqual(data.edge_crease_values, mesh.get_edge_crease_values())
+        self.assertEqual(3, mesh.dxf.subdivision_levels)
+
+    def test_set_arrays_mixed_faces(self):
+        mesh = DWG.modelspace().add_mesh()
+        mesh.set_arrays([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)], faces=([0, 4, 7], [0, 1, 2, 3, 1, 4, 2]),
+                        edges=[(0, 1), (1, 2)])
+        self.assertEqual([(0, 1, 2, 3), (1, 4, 2)], mesh.get_faces())
+        self.assertEqual([(0, 1), (1, 2)], mesh.get_edges())
+        self.assertEqual([], mesh.get_edge_crease_values())
+        self.assertEqual([0, 4, 7], flat(mesh.faces_arrays()[0]))
+
+    def test_empty_mesh(self):
+        mesh = DWG.modelspace().add_mesh()
+        self.assertEqual([], flat(mesh.vertices_array()))
+        self.assertEqual([0], flat(mesh.faces_arrays()[0]))
+        self.assertEqual([], flat(mesh.edges_array()))
+
+
+class FakeArray(list):
+    # stands for numpy.ndarray, just enough for the array accessors
+    def reshape(self, *shape):
+        result = FakeArray(self)
+        result.shape = shape
+        return result
+
+    def tolist(self):
+        return list(self)
+
+
+def fake_numpy():
+    numpy = types.ModuleType(str('numpy'))
+    numpy.ndarray = FakeArray
+    numpy.dtype = lambda typecode: typecode
+    numpy.frombuffer = lambda values, dtype: FakeArray(values)
+    numpy.zeros = lambda size, dtype: FakeArray([0] * size)
+    return numpy
+
+
+class TestMeshNumPyArrays(unittest.TestCase):
+    def setUp(self):
+        self.mesh = Mesh(ClassifiedTags.from_text(MESH), DWG)
+        self.numpy_module = mesh_module._numpy_module
+        self.sys_numpy = sys.modules.get('numpy')
+        mesh_module._numpy_module = False  # NumPy not imported yet
+        sys.modules['numpy'] = fake_numpy()
+
+    def tearDown(self):
+        mesh_module._numpy_module = self.numpy_module
+        if self.sys_numpy is None:
+            del sys.modules['numpy']
+        else:
+            sys.modules['numpy'] = self.sys_numpy
+
+    def test_numpy_imported_at_first_use(self):
+        vertices = self.mesh.vertices_array()
+        self.assertIs(sys.modules['numpy'], mesh_module._numpy_module)
+        self.assertIsInstance(vertices, FakeArray)
+        self.assertEqual((-1, 3), vertices.shape)
+
+    def test_set_numpy_arrays(self):
+        mesh = self.mesh
+        data = mesh.get_data()
+        mesh.set_arrays(mesh.vertices_array(), mesh.faces_arrays(), mesh.edges_array(), mesh.edge_crease_values_array())
+        self.assertEqual(data.vertices, mesh.get_vertices())
+        self.assertEqual(data.faces, mesh.get_faces())
+        self.assertEqual(data.edges, mesh.get_edges())
+        self.assertEqual(data.edge_crease_values, mesh.get_edge_crease_values())
+
+
+class TestMeshDataOptimize(unittest.TestCase):
+    def setUp(self):
+        self.mesh = DWG.modelspace().add_mesh()
+
+    def test_add_face_and_edge(self):
+        with self.mesh.edit_data() as data:
+            data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+            data.add_edge([(0, 0, 0), (1, 0, 0)])
+            with self.assertRaises(ValueError):
+                data.add_edge([(0, 0, 0)])
+        self.assertEqual(5, len(self.mesh.get_vertices()))
+        self.assertEqual([(0, 1, 2)], self.mesh.get_faces())
+        self.assertEqual([(3, 4)], self.mesh.get_edges())
+        self.assertEqual([0.], self.mesh.get_edge_crease_values())
+
+    def test_weld_vertices(self):
+        data = self.mesh.get_data()
+        data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+        data.add_face([(1.0000001, 0, 0), (2, 0, 0), (2, 1, 0), (1, 0.9999999, 0)])
+        report = data.optimize()
+        self.assertEqual(2, report.merged_vertices)
+        self.assertEqual(6, len(data.vertices))
+        self.assertEqual([(0, 1, 2, 3), (1, 4, 5, 2)], data.faces)
+
+    def test_list_vertices(self):
+        data = self.mesh.get_data()
+        data.add_face([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+        data.add_edge([[0, 0, 0], [1, 0, 0]])
+        data.vertices.append([1, 1, 0])  # list vertex assigned by the user
+        report = data.optimize()
+        self.assertEqual(3, report.merged_vertices)
+        self.assertEqual([(0, 0, 0), (1, 0, 0), (1, 1, 0)], data.vertices)
+        self.assertEqual([(0, 1)], data.edges)
+
+    def test_precision(self):
+        data = self.mesh.get_data()
+        data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        data.add_face([(0, 0, 0), (1.0001, 0, 0), (1, 1, 0)])
+        self.assertEqual(0, data.optimize(precision=6).duplicate_faces)  # (1.0001, 0, 0) not merged
+        self.assertEqual(4, len(data.vertices))
+        self.assertEqual(1, data.optimize(precision=3).duplicate_faces)
+        self.assertEqual(3, len(data.vertices))
+
+    def test_remove_degenerate_and_duplicate_faces(self):
+        data = self.mesh.get_data()
+        data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+        data.add_face([(1, 1, 0), (0, 1, 0), (0, 0, 0), (1, 0, 0)])  # rotated
+        data.add_face([(0, 1, 0), (1, 1, 0), (1, 0, 0), (0, 0, 0)])  # reversed
+        data.add_face([(0, 0, 0), (1, 0, 0), (1e-9, 0, 0)])  # degenerated
+        data.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0), (1, 1, 1e-9)])  # becomes a triangle
+        report = data.optimize()
+        self.assertEqual(2, report.duplicate_faces)
+        self.assertEqual(1, report.degenerate_faces)
+        self.assertEqual([(0, 1, 2, 3), (0, 1, 2)], data.faces)
+
+    def test_remove_unused_vertices(self):
+        data = self.mesh.get_data()
+        data.vertices = [(9, 9, 9), (0, 0, 0), (8, 8, 8), (1, 0, 0), (1, 1, 0)]
+        data.faces = [(1, 3, 4)]
+        report = data.optimize()
+        self.assertEqual(2, report.unused_vertices)
+        self.assertEqual([(0, 0, 0), (1, 0, 0), (1, 1, 0)], data.vertices)
+        self.assertEqual([(0, 1, 2)], data.faces)
+
+    def test_remap_edges_and_crease_values(self):
+        data = self.mesh.get_data()
+        data.vertices = [(0, 0, 0), (1, 0, 0), (0, 0, 0), (1, 0, 0), (2, 0, 0)]
+        data.edges = [(0, 1), (3, 2), (0, 2), (3, 4)]
+        data.edge_crease_values = [1., 2., 3., 4.]
+        report = data.optimize()
+        self.assertEqual(1, report.duplicate_edges)
+        self.assertEqual(1, report.degenerate_edges)
+        self.assertEqual([(0, 0, 0), (1, 0, 0), (2, 0, 0)], data.vertices)
+        self.assertEqual([(0, 1), (1, 2)], data.edges)
+        self.assertEqual([1., 4.], data.edge_crease_values)
+
+    def test_weld_across_cell_borders(self):
+        data = self.mesh.get_data()
+        # 1e-6 tolerance, spatial hash cell size 16e-6, cell centered at origin: vertices in adjacent cells
+        data.add_edge([(8e-6 - 1e-7, 0, 0), (8e-6 + 1e-7, 0, 0)])
+        data.add_edge([(-8e-6 - 5e-7, 8e-6 - 5e-7, 0), (-8e-6 + 4e-7, 8e-6 + 4e-7, 0)])
+        data.add_edge([(-1e-7, -1e-7, -1e-7), (1e-7, 1e-7, 1e-7)])
+        report = data.optimize()
+        self.assertEqual(3, report.merged_vertices)
+        self.assertEqual(3, report.degenerate_edges)
+        self.assertEqual([], data.vertices)
+
+
 MESH = """  0
 MESH
   5
@@ -0,0 +1,155 @@
+# Purpose: test ArrayTags()
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+from io import StringIO
+from copy import deepcopy
+
+import ezdxf
+from ezdxf.options import options
+from ezdxf.arraytags import ArrayTags
+from ezdxf.tags import Tags, CompressedTags
+from ezdxf.dxftag import DXFTag
+from ezdxf.classifiedtags import ClassifiedTags
+
+TEST_TAGS = """  0
+LINE
+  5
+FF
+  8
+LAYER
+ 10
+1.0
+ 20
+2.0
+ 30
+3.0
+ 62
+7
+"""
+
+
+class TestArrayTags(unittest.TestCase):
+    def setUp(self):
+        self.tags = ArrayTags.from_text(TEST_TAGS)
+
+    def test_same_tags_as_tags(self):
+        self.assertEqual(list(Tags.from_text(TEST_TAGS)), list(self.tags))
+        self.assertEqual(Tags.from_text(TEST_TAGS), self.tags)
+
+    def test_point_value(self):
+        self.assertEqual((1., 2., 3.), self.tags[3].value)
+        self.assertEqual((1., 2., 3.), self.tags.get_value(10))
+        self.assertTrue(isinstance(self.tags.get_value(10), tuple))
+
+    def test_write(self):
+        stream = StringIO()
+        self.tags.write(stream)
+        self.assertEqual(TEST_TAGS, stream.getvalue())
+
+    def test_handle(self):
+        self.assertEqual('FF', self.tags.get_handle())
+        self.tags.replace_handle('AA')
+        self.assertEqual('AA', self.tags.get_handle())
+
+    def test_dxftype(self):
+        self.assertEqual('LINE', self.tags.dxftype())
+
+    def test_find_first(self):
+        self.assertEqual('LAYER', self.tags.find_first(8))
+        self.assertEqual(None, self.tags.find_first(999, default=None))
+        with self.assertRaises(ValueError):
+            self.tags.find_first(999)
+
+    def test_tag_index(self):
+        self.assertEqual(2, self.tags.tag_index(8))
+        self.assertEqual(2, self.tags.tag_index(8, start=1, end=4))
+        with self.assertRaises(ValueError):
+            self.tags.tag_index(8, start=3)
+        with self.assertRaises(ValueError):
+            self.tags.tag_index(8, end=2)
+
+    def test_has_tag(self):
+        self.assertTrue(self.tags.has_tag(62))
+        self.assertFalse(self.tags.has_tag(63))
+
+    def test_set_first(self):
+        self.tags.set_first(62, 1)
+        self.assertEqual(1, self.tags.get_value(62))
+        self.tags.set_first(6, 'DASHED')
+        self.assertEqual((6, 'DASHED'), self.tags[-1])
+
+    def test_remove_tags(self):
+        self.tags.remove_tags(codes=(5, 8))
+        self.assertEqual([(0, 'LINE'), (10, (1., 2., 3.)), (62, 7)], list(self.tags))
+
+    def test_list_interface(self):
+        tags = self.tags
+        tags.insert(1, DXFTag(100, 'AcDbEntity'))
+        self.assertEqual((100, 'AcDbEntity'), tags[1])
+        self.assertTrue((100, 'AcDbEntity') in tags)
+        self.assertEqual(1, tags.index((100, 'AcDbEntity')))
+        self.assertEqual((62, 7), tags.pop())
+        del tags[1]
+        self.assertEqual(4, len(tags))
+        tags[1:3] = [DXFTag(8, 'X'), DXFTag(8, 'Y'), DXFTag(8, 'Z')]
+        self.assertEqual(['X', 'Y', 'Z'], [tag.value for tag in tags.find_all(8)])
+        self.assertEqual(3, len(tags[1:4]))
+        self.assertTrue(isinstance(tags[1:4], ArrayTags))
+
+    def test_foreign_objects(self):
+        compressed = CompressedTags(310, [DXFTag(310, 'FFFF')])
+        self.tags.append(compressed)
+        self.tags[0] = None
+        self.assertTrue(self.tags[-1] is compressed)
+        self.assertTrue(self.tags[0] is None)
+
+    def test_clone_is_independent(self):
+        clone = self.tags.clone()
+        self.assertEqual(self.tags, clone)
+        clone.update(10, (7., 8., 9.))
+        self.assertEqual((1., 2., 3.), self.tags.get_value(10))
+
+    def test_deepcopy(self):
+        self.assertEqual(self.tags, deepcopy(self.tags))
+
+    def test_collect_consecutive_tags(self):
+        collected = self.tags.collect_consecutive_tags([5, 8], start=1)
+        self.assertEqual([(5, 'FF'), (8, 'LAYER')], list(collected))
+
+
+class TestClassifiedArrayTags(unittest.TestCase):
+    def setUp(self):
+        options.use_array_tags = True
+
+    def tearDown(self):
+        options.use_array_tags = False
+
+    def test_classified_tags(self):
+        tags = ClassifiedTags.from_text(TEST_TAGS)
+        self.assertTrue(isinstance(tags.noclass, ArrayTags))
+
+    def test_read_write_drawing(self):
+        dwg = ezdxf.new('AC1015')
+        msp = dwg.modelspace()
+        msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+        msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+        stream = StringIO()
+        dwg.write(stream)
+        stream.seek(0)
+
+        dwg = ezdxf.read(stream)
+        msp = dwg.modelspace()
+        self.assertEqual([(0, 0), (1, 0), (1, 1)], [p[:2] for p in msp.query('LWPOLYLINE')[0].get_points()])
+        line = msp.query('LINE')[0]
+        self.assertTrue(isinstance(line.tags.subclasses[2], ArrayTags))
+        self.assertEqual('LINES', line.dxf.layer)
+        line.dxf.end = (2, 2, 0)
+        self.assertEqual((2, 2, 0), line.dxf.end)
+
+
+if __name__ == '__main__':
+    unittest.main()
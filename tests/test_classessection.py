@@ -27,6 +27,10 @@ class TestClassesSection(unittest.TestCase):
         stream.close()
         self.assertEqual(normlines(TESTCLASSES), normlines(result))
 
+    def test_query(self):
+        self.assertEqual(3, len(self.section.query('*')))
+        self.assertEqual(3, len(self.section.query('CLASS')))
+
     def test_empty_section(self):
         section = ClassesSection(Tags.from_text(EMPTYSEC), self.dwg)
         stream = StringIO()
@@ -8,10 +8,14 @@
 from __future__ import unicode_literals
 
 import unittest
+import pickle
 
 from io import StringIO
-from ezdxf.tags import Tags
+from ezdxf.tags import Tags, TagGroups, BufferedTagIterator
 from ezdxf.classifiedtags import ClassifiedTags
+from ezdxf.dxftag import DXFTag
+from ezdxf.options import options
+from ezdxf.database import EntityDB
 
 
 class TestClassifiedTags(unittest.TestCase):
@@ -92,6 +96,13 @@ class TestClassifiedTags(unittest.TestCase):
         self.xtags.replace_handle('AA')
         self.assertEqual('AA', self.xtags.get_handle())
 
+    def test_pickle(self):
+        self.xtags.link = 'FF'
+        xtags = pickle.loads(pickle.dumps(self.xtags, 2))
+        self.assertEqual(list(self.xtags), list(xtags))
+        self.assertEqual(3, len(xtags.subclasses))
+        self.assertEqual('FF', xtags.link)
+
 
 XTAGS1 = """  0
 LAYER
@@ -269,5 +280,105 @@ AcDbText
 2
 """
 
+VERBATIM_LINE = """  0
+LINE
+  5
+FF
+100
+AcDbEntity
+  8
+0
+100
+AcDbLine
+ 10
+1.000000
+ 20
+2.000000
+ 30
+0
+ 11
+   4
+ 21
+5.5
+ 31
+0
+"""
+
+
+class TestVerbatimPassthrough(unittest.TestCase):
+    def setUp(self):
+        options.verbatim_passthrough = True
+        options.lazy_cast = True
+        self.tags = ClassifiedTags(BufferedTagIterator(StringIO(VERBATIM_LINE)))
+
+    def tearDown(self):
+        options.verbatim_passthrough = False
+        options.lazy_cast = False
+
+    def write(self):
+        stream = StringIO()
+        self.tags.write(stream)
+        return stream.getvalue()
+
+    def test_write_unmodified_verbatim(self):
+        self.assertFalse(self.tags.is_modified())
+        self.assertEqual(VERBATIM_LINE, self.write())
+
+    def test_reading_values_does_not_modify(self):
+        self.tags.get_subclass('AcDbLine').find_all(10)
+        self.assertFalse(self.tags.is_modified())
+
+    def test_write_modified(self):
+        self.tags.get_subclass('AcDbEntity').set_first(8, 'LAYER')
+        self.assertTrue(self.tags.is_modified())
+        result = self.write()
+        self.assertTrue('  8\nLAYER\n' in result)
+
+    def test_new_subclass_is_modification(self):
+        self.tags.xdata.append(Tags([DXFTag(1001, 'EZDXF')]))
+        self.assertTrue(self.tags.is_modified())
+
+    def test_clone_is_modified(self):
+        self.assertTrue(self.tags.clone().is_modified())
+
+    def test_new_entity_is_modified(self):
+        self.assertTrue(ClassifiedTags.from_text(VERBATIM_LINE).is_modified())
+
+    def test_keeps_source_text(self):
+        text = VERBATIM_LINE.replace('  8\n0\n', '  8\n0\n999\ncomment\n')
+        tags = ClassifiedTags(BufferedTagIterator(StringIO(text)))
+        self.assertEqual(text, tags._raw[0])
+
+    def test_source_text_of_tag_groups(self):
+        text = VERBATIM_LINE + VERBATIM_LINE.replace('FF', 'AA') + "  0\nEOF"
+        groups = TagGroups(BufferedTagIterator(StringIO(text, newline='')))
+        first, second = [ClassifiedTags(group) for group in groups[:2]]
+        self.assertEqual(VERBATIM_LINE, first._raw[0])
+        self.assertEqual(VERBATIM_LINE.replace('FF', 'AA'), second._raw[0])
+        self.assertEqual(DXFTag, type(first.noclass[0]))
+
+    def test_replaced_subclass_is_modification(self):
+        self.tags.subclasses[2] = self.tags.subclasses[2].clone()
+        self.assertTrue(self.tags.is_modified())
+
+    def test_array_tags(self):
+        options.use_array_tags = True
+        try:
+            tags = ClassifiedTags(BufferedTagIterator(StringIO(VERBATIM_LINE)))
+        finally:
+            options.use_array_tags = False
+        self.assertFalse(tags.is_modified())
+        tags.get_subclass('AcDbEntity').set_first(8, 'LAYER')
+        self.assertTrue(tags.is_modified())
+
+    def test_entitydb_modified_handles(self):
+        db = EntityDB()
+        db.add_tags(self.tags)
+        new_tags = ClassifiedTags.from_text(VERBATIM_LINE)
+        new_tags.noclass.update(5, 'AA')
+        db.add_tags(new_tags)
+        self.assertEqual(['AA'], list(db.modified_handles()))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -30,6 +30,21 @@ class testEntityDB(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.db[0]
 
+    def test_hex_and_integer_keys(self):
+        self.db['FF'] = 'HEX'
+        self.assertEqual('HEX', self.db[255])
+        self.assertTrue(255 in self.db)
+        self.assertEqual(['0', 'FF'], sorted(self.db.keys()))  # handles are returned as hex strings
+        self.assertEqual([('0', 'TEST'), ('FF', 'HEX')], sorted(self.db.items()))
+        self.db.delete_handle(255)
+        self.assertFalse('FF' in self.db)
+
+    def test_invalid_handle(self):
+        self.assertFalse('XYZ' in self.db)
+        self.assertIsNone(self.db.get('XYZ'))
+        with self.assertRaises(KeyError):
+            self.db['XYZ']
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,106 @@
+# Purpose: test decoding of binary DXF streams
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+from io import BytesIO
+
+from ezdxf.decoding import binary_dxf_info, DecodingStream
+from ezdxf.tags import BufferedTagIterator
+
+
+def header(version='AC1015', codepage='ANSI_1252'):
+    return "  0\nSECTION\n  2\nHEADER\n  9\n$ACADVER\n  1\n{}\n  9\n$DWGCODEPAGE\n  3\n{}\n  0\nENDSEC\n".format(
+        version, codepage).encode('ascii')
+
+
+TEXT = "  0\nSECTION\n  2\nENTITIES\n  0\nTEXT\n  1\n{}\n  0\nENDSEC\n  0\nEOF\n"
+
+
+class TestBinaryDXFInfo(unittest.TestCase):
+    def test_header(self):
+        is_dxf, info = binary_dxf_info(header('AC1018', 'ANSI_1251'))
+        self.assertTrue(is_dxf)
+        self.assertEqual('AC1018', info.version)
+        self.assertEqual('cp1251', info.encoding)
+
+    def test_skip_comments(self):
+        is_dxf, info = binary_dxf_info(b'999\ncomment\n' + header())
+        self.assertTrue(is_dxf)
+        self.assertEqual('AC1015', info.version)
+
+    def test_not_a_dxf_file(self):
+        is_dxf, info = binary_dxf_info(b'no DXF file\n')
+        self.assertFalse(is_dxf)
+
+    def test_crlf_line_endings(self):
+        is_dxf, info = binary_dxf_info(header('AC1024').replace(b'\n', b'\r\n'))
+        self.assertTrue(is_dxf)
+        self.assertEqual('AC1024', info.version)
+
+    def test_cr_line_endings(self):
+        is_dxf, info = binary_dxf_info(header('AC1024').replace(b'\n', b'\r'))
+        self.assertTrue(is_dxf)
+        self.assertEqual('AC1024', info.version)
+
+
+class TestDecodingStream(unittest.TestCase):
+    def test_code_page_encoding(self):
+        data = header('AC1015', 'ANSI_1251') + TEXT.format('Ж').encode('cp1251')
+        stream = DecodingStream(BytesIO(data))
+        self.assertEqual('cp1251', stream.encoding)
+        tags = list(BufferedTagIterator(stream))
+        self.assertTrue((1, 'Ж') in tags)
+
+    def test_utf8_since_AC1021(self):
+        data = header('AC1021') + TEXT.format('Ж').encode('utf-8')
+        stream = DecodingStream(BytesIO(data))
+        self.assertEqual('utf-8', stream.encoding)
+        self.assertTrue((1, 'Ж') in list(BufferedTagIterator(stream)))
+
+    def test_fallback_for_invalid_lines(self):
+        # 0x81 is not defined in cp1252, this line is decoded as utf-8 and invalid bytes are ignored
+        data = header() + TEXT.format('VALUE').encode('ascii').replace(b'VALUE', b'\xc3\x84\x81')
+        stream = DecodingStream(BytesIO(data))
+        tags = list(BufferedTagIterator(stream))
+        self.assertTrue((1, '\xc4') in tags)
+        self.assertEqual(1, stream.fallback_lines)
+
+    def test_crlf_line_endings(self):
+        data = (header() + TEXT.format('VALUE').encode('ascii')).replace(b'\n', b'\r\n')
+        tags = list(BufferedTagIterator(DecodingStream(BytesIO(data))))
+        self.assertTrue((1, 'VALUE') in tags)
+        self.assertEqual((0, 'EOF'), tags[-1])
+
+    def test_small_blocks(self):
+        data = (header() + TEXT.format('VALUE').encode('ascii')).replace(b'\n', b'\r\n')
+        expected = list(BufferedTagIterator(DecodingStream(BytesIO(data))))
+        stream = DecodingStream(BytesIO(data), blocksize=7)
+        self.assertEqual(expected, list(BufferedTagIterator(stream, blocksize=5)))
+
+    def test_cr_line_endings(self):
+        data = (header() + TEXT.format('VALUE').encode('ascii')).replace(b'\n', b'\r')
+        stream = DecodingStream(BytesIO(data))
+        self.assertTrue(stream.is_dxf)
+        tags = list(BufferedTagIterator(stream))
+        self.assertTrue((1, 'VALUE') in tags)
+        self.assertEqual((0, 'EOF'), tags[-1])
+
+    def test_small_blocks_with_cr_line_endings(self):
+        data = header() + TEXT.format('VALUE').encode('ascii')
+        expected = list(BufferedTagIterator(DecodingStream(BytesIO(data))))
+        for line_ending in (b'\r', b'\r\n'):
+            for blocksize in range(1, 12):
+                stream = DecodingStream(BytesIO(data.replace(b'\n', line_ending)), blocksize=blocksize)
+                self.assertEqual(expected, list(BufferedTagIterator(stream, blocksize=5)))
+
+    def test_read_complete_lines(self):
+        stream = DecodingStream(BytesIO(header()), blocksize=5)
+        text = stream.read(3)
+        self.assertTrue(text.endswith('\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
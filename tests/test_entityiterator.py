@@ -0,0 +1,70 @@
+# Purpose: test iter_entities()
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+from io import StringIO
+
+import ezdxf
+from ezdxf.entityiterator import iter_entities
+
+
+def dxf_stream(dxfversion):
+    dwg = ezdxf.new(dxfversion)
+    dwg.blocks.new('TESTBLOCK')
+    msp = dwg.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.add_polyline3d([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
+    msp.add_blockref('TESTBLOCK', (0, 0)).add_attrib('TAG1', 'value1', (0, 0))
+    msp.add_text('TEXT', dxfattribs={'layer': 'TEXTLAYER'})
+    stream = StringIO()
+    dwg.write(stream)
+    stream.seek(0)
+    return stream
+
+
+class TestIterEntitiesAC1009(unittest.TestCase):
+    DXFVERSION = 'AC1009'
+
+    def setUp(self):
+        self.stream = dxf_stream(self.DXFVERSION)
+
+    def test_all_entities(self):
+        types = [entity.dxftype() for entity in iter_entities(self.stream)]
+        self.assertEqual(['LINE', 'POLYLINE', 'INSERT', 'TEXT'], types)
+
+    def test_filter_types(self):
+        entities = list(iter_entities(self.stream, types=['TEXT']))
+        self.assertEqual(1, len(entities))
+        self.assertEqual('TEXTLAYER', entities[0].dxf.layer)
+
+    def test_polyline_vertices(self):
+        for polyline in iter_entities(self.stream, types=['POLYLINE']):
+            points = [vertex.dxf.location for vertex in polyline.vertices()]
+            self.assertEqual([(0, 0, 0), (1, 0, 0), (1, 1, 1)], points)
+
+    def test_insert_attribs(self):
+        for insert in iter_entities(self.stream, types=['INSERT']):
+            attribs = list(insert.attribs())
+            self.assertEqual(1, len(attribs))
+            self.assertEqual('value1', attribs[0].dxf.text)
+
+    def test_entity_database_holds_only_current_entity(self):
+        for entity in iter_entities(self.stream):
+            handles = list(entity.drawing.entitydb.keys())
+            self.assertTrue(entity.dxf.handle in handles)
+            self.assertTrue(len(handles) <= 5)  # POLYLINE + 3x VERTEX + SEQEND
+
+
+class TestIterEntitiesAC1015(TestIterEntitiesAC1009):
+    DXFVERSION = 'AC1015'
+
+    def test_dxfversion(self):
+        entity = next(iter_entities(self.stream))
+        self.assertEqual('AC1015', entity.drawing.dxfversion)
+
+
+if __name__ == '__main__':
+    unittest.main()
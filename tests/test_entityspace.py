@@ -9,6 +9,8 @@ from __future__ import unicode_literals
 
 import unittest
 
+import ezdxf
+
 from ezdxf.testtools import DrawingProxy, TagGroups
 from ezdxf.entityspace import EntitySpace
 
@@ -23,6 +25,135 @@ class TestEntitySpace(unittest.TestCase):
             self.space.store_tags(group)
         self.assertEqual(4, len(self.space))
 
+    def test_type_index(self):
+        for group in TagGroups.from_text(TESTENTITIES):
+            self.space.store_tags(group)
+        self.assertEqual({'POLYLINE': 1, 'VERTEX': 2, 'SEQEND': 1}, self.space.type_histogram())
+        self.assertEqual(2, self.space.count_type('VERTEX'))
+        self.assertEqual([0x403, 0x404], list(self.space.handles_of_types(['VERTEX'])))  # integer keys
+        self.assertEqual([], list(self.space.handles_of_types(['LINE'])))
+        self.assertEqual(list(self.space), list(self.space.handles_of_types(None)))
+
+    def test_remove_handle_updates_type_index(self):
+        for group in TagGroups.from_text(TESTENTITIES):
+            self.space.store_tags(group)
+        self.space.remove_handle('403')
+        self.assertEqual(1, self.space.count_type('VERTEX'))
+        self.space.remove_handle('239')
+        self.assertFalse('POLYLINE' in self.space.type_histogram())
+        self.space.delete_all_entities()
+        self.assertEqual({}, self.space.type_histogram())
+
+
+    def test_remove_keeps_order(self):
+        for group in TagGroups.from_text(TESTENTITIES):
+            self.space.store_tags(group)
+        self.space.remove_handle('403')
+        self.assertEqual([0x239, 0x404, 0x405], list(self.space))
+        self.assertFalse('403' in self.space)
+        self.assertEqual(0x239, self.space[0])
+        self.assertEqual(0x405, self.space[-1])
+        with self.assertRaises(ValueError):
+            self.space.remove_handle('403')
+
+    def test_remove_handles(self):
+        for group in TagGroups.from_text(TESTENTITIES):
+            self.space.store_tags(group)
+        self.assertEqual(2, self.space.remove_handles(['403', '405', 'FFFF']))
+        self.assertEqual([0x239, 0x404], list(self.space))
+        self.assertEqual({'POLYLINE': 1, 'VERTEX': 1}, self.space.type_histogram())
+
+
+class TestLayoutTypeIndex(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+        for x in range(10):
+            self.msp.add_line((x, 0), (x, 1))
+        self.circle = self.msp.add_circle((0, 0), 1)
+        self.msp.add_text('TEXT')
+
+    def test_type_histogram(self):
+        self.assertEqual({'LINE': 10, 'CIRCLE': 1, 'TEXT': 1}, self.msp.type_histogram())
+        self.msp.delete_entity(self.circle)
+        self.assertEqual({'LINE': 10, 'TEXT': 1}, self.msp.type_histogram())
+        self.assertEqual({'LINE': 10, 'TEXT': 1}, self.dwg.entities.type_histogram())
+
+    def test_query_does_not_wrap_other_types(self):
+        factory = self.dwg.dxffactory
+        wrapped = []
+        wrap_handle = factory.wrap_handle
+
+        def counting_wrap_handle(handle):
+            wrapped.append(handle)
+            return wrap_handle(handle)
+        factory.wrap_handle = counting_wrap_handle
+        result = self.msp.query('CIRCLE TEXT')
+        self.assertEqual(['CIRCLE', 'TEXT'], [entity.dxftype() for entity in result])
+        self.assertEqual(2, len(wrapped))
+
+    def test_entity_section_query(self):
+        self.assertEqual(10, len(self.dwg.entities.query('LINE[layer=="0"]')))
+
+
+class TestDeleteEntities(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+        for x in range(10):
+            self.msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'ODD' if x % 2 else 'EVEN'})
+
+    def test_delete_by_query(self):
+        lines = list(self.msp.query('LINE[layer=="ODD"]'))
+        self.assertEqual(5, self.msp.delete_entities('LINE[layer=="ODD"]'))
+        self.assertEqual(5, len(self.msp))
+        self.assertEqual(0, len(self.msp.query('*[layer=="ODD"]')))
+        self.assertFalse(lines[0].dxf.handle in self.dwg.entitydb)
+
+    def test_delete_entities_of_other_layouts_are_ignored(self):
+        block = self.dwg.blocks.new('TEST')
+        block_line = block.add_line((0, 0), (1, 0))
+        entities = list(self.msp.query('LINE')[:2]) + [block_line]
+        self.assertEqual(2, self.msp.delete_entities(entities))
+        self.assertTrue(block_line.dxf.handle in self.dwg.entitydb)
+        self.assertEqual(8, len(self.msp))
+
+    def test_delete_all_entities(self):
+        self.msp.delete_all_entities()
+        self.assertEqual(0, len(self.msp))
+        self.assertEqual({}, self.msp.type_histogram())
+
+    def test_delete_duplicate_entities(self):
+        line = self.msp.query('LINE')[0]
+        self.assertEqual(1, self.msp.delete_entities([line, line]))
+        self.assertEqual(9, len(list(self.msp)))
+
+
+class TestIntegerKeys(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+
+    def test_layout_space_keys(self):
+        line = self.msp.add_line((0, 0), (1, 0))
+        layout_key = self.msp.layout_key
+        space = self.dwg.entities.get_layout_space(layout_key)
+        self.assertIs(space, self.dwg.entities.get_layout_space(int(layout_key, 16)))
+        self.assertTrue(line.dxf.handle in space)
+        self.assertEqual(int(line.dxf.handle, 16), space[-1])
+
+    def test_link_chain(self):
+        polyline = self.msp.add_polyline2d([(0, 0), (1, 0)])
+        db = self.dwg.entitydb
+        links = []
+        tags = polyline.tags
+        while tags.link is not None:
+            links.append(tags.link)
+            tags = db[tags.link]
+        self.assertEqual(['VERTEX', 'VERTEX', 'SEQEND'], [db[key].dxftype() for key in links])
+        self.assertTrue(all(isinstance(key, int) for key in links))
+        self.assertEqual([int(vertex.dxf.handle, 16) for vertex in polyline.vertices()], links[:2])
+
 
 TESTENTITIES = """  0
 POLYLINE
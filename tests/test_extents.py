@@ -0,0 +1,218 @@
+# Purpose: test drawing extents calculated from raw entity tags
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+
+import ezdxf
+from ezdxf.extents import ExtentsEngine, PointCollector
+from ezdxf.classifiedtags import ClassifiedTags
+
+
+def assert_bbox(testcase, expected, box, places=6):
+    testcase.assertEqual(6, len(box))
+    for e, v in zip(expected, box):
+        testcase.assertAlmostEqual(e, v, places=places)
+
+
+class TestPointCollector(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(PointCollector().bbox())
+
+    def test_bbox(self):
+        points = PointCollector()
+        points.extend([(1, 2), (-1, 5, 3)], z=1)
+        self.assertEqual((-1, 2, 1, 1, 5, 3), points.bbox())
+
+
+class TestExtentsEngine(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+
+    def extents(self):
+        return ExtentsEngine(self.dwg).layout_extents(self.msp)
+
+    def test_empty_layout(self):
+        self.assertIsNone(self.extents())
+
+    def test_line(self):
+        self.msp.add_line((1, 2, 3), (-4, 5, 6))
+        assert_bbox(self, (-4, 2, 3, 1, 5, 6), self.extents())
+
+    def test_circle(self):
+        self.msp.add_circle((1, 1), radius=2)
+        assert_bbox(self, (-1, -1, 0, 3, 3, 0), self.extents())
+
+    def test_arc(self):
+        self.msp.add_arc((0, 0), radius=1, start_angle=0, end_angle=90)
+        assert_bbox(self, (0, 0, 0, 1, 1, 0), self.extents())
+
+    def test_lwpolyline_bulge(self):
+        # half circle from (0, 0) to (2, 0) through (1, -1)
+        self.msp.add_lwpolyline([(0, 0, 0, 0, 1), (2, 0)])
+        assert_bbox(self, (0, -1, 0, 2, 0, 0), self.extents())
+
+    def test_insert(self):
+        block = self.dwg.blocks.new('TEST')
+        block.add_line((0, 0), (1, 1))
+        self.msp.add_blockref('TEST', (10, 10), dxfattribs={'xscale': 2, 'yscale': 3})
+        assert_bbox(self, (10, 10, 0, 12, 13, 0), self.extents())
+
+    def test_text_ignores_unused_alignment_point(self):
+        self.msp.add_line((100, 100), (110, 110))
+        self.msp.add_text('HELLO', dxfattribs={'insert': (100, 100)})
+        assert_bbox(self, (100, 100, 0, 110, 110, 0), self.extents())
+
+    def test_aligned_text(self):
+        text = self.msp.add_text('HELLO', dxfattribs={'insert': (100, 100)})
+        text.set_pos((120, 100), (130, 100), align='ALIGNED')
+        assert_bbox(self, (120, 100, 0, 130, 100, 0), self.extents())
+
+    def test_attrib_ignores_unused_alignment_point(self):
+        block = self.dwg.blocks.new('TEST')
+        block.add_line((0, 0), (1, 1))
+        insert = self.msp.add_blockref('TEST', (10, 10))
+        insert.add_attrib('TAG', 'VALUE', (11, 11))
+        assert_bbox(self, (10, 10, 0, 11, 11, 0), self.extents())
+
+    def test_mline_ignores_direction_vectors(self):
+        tags = ClassifiedTags.from_text(MLINE)
+        points = PointCollector()
+        ExtentsEngine(self.dwg).collect(tags, points)
+        self.assertEqual((10, 10, 0, 20, 10, 0), points.bbox())
+
+    def test_ignored_types(self):
+        self.msp.add_point((1, 1))
+        self.msp.add_ray((0, 0, 0), (1, 0, 0))
+        assert_bbox(self, (1, 1, 0, 1, 1, 0), self.extents())
+
+    def test_polyface_ignores_face_records(self):
+        polyface = self.msp.add_polyface()
+        polyface.append_face([(0, 0, 0), (1, 0, 0), (1, 1, 2)])
+        assert_bbox(self, (0, 0, 0, 1, 1, 2), self.extents())
+
+    def test_hatch_polyline_path(self):
+        hatch = self.msp.add_hatch()
+        with hatch.edit_boundary() as boundary:
+            boundary.add_polyline_path([(10, 10), (12, 10), (12, 11)])
+        assert_bbox(self, (10, 10, 0, 12, 11, 0), self.extents())
+
+    def test_hatch_polyline_path_bulge(self):
+        hatch = self.msp.add_hatch()
+        with hatch.edit_boundary() as boundary:
+            boundary.add_polyline_path([(10, 10, 1), (12, 10, 1)])  # closed circle
+        assert_bbox(self, (10, 9, 0, 12, 11, 0), self.extents())
+
+    def test_hatch_ellipse_edge(self):
+        hatch = self.msp.add_hatch()
+        with hatch.edit_boundary() as boundary:
+            path = boundary.add_edge_path()
+            path.add_ellipse((100, 100), major_axis_vector=(5, 0), minor_axis_length=.4)
+        assert_bbox(self, (95, 98, 0, 105, 102, 0), self.extents())
+
+    def test_hatch_arc_edge(self):
+        hatch = self.msp.add_hatch()
+        with hatch.edit_boundary() as boundary:
+            path = boundary.add_edge_path()
+            path.add_arc((10, 10), radius=2, start_angle=0, end_angle=90, is_counter_clockwise=1)
+            path.add_line((10, 12), (10, 10))
+            path.add_line((10, 10), (12, 10))
+        assert_bbox(self, (10, 10, 0, 12, 12, 0), self.extents())
+
+    def test_hatch_ignores_seed_points(self):
+        hatch = self.msp.add_hatch()
+        with hatch.edit_boundary() as boundary:
+            boundary.add_polyline_path([(10, 10), (12, 10), (12, 11)])
+        hatch.set_seed_points([(50, 50)])
+        assert_bbox(self, (10, 10, 0, 12, 11, 0), self.extents())
+
+
+class TestUpdateExtents(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1009')
+        self.msp = self.dwg.modelspace()
+
+    def tearDown(self):
+        ezdxf.options.update_extents_on_save = False
+
+    def test_update_header(self):
+        self.msp.add_line((-1, -2), (3, 4))
+        extents = self.dwg.update_extents()
+        self.assertEqual((-1, -2, 0, 3, 4, 0), extents)
+        self.assertEqual((-1, -2, 0), tuple(self.dwg.header['$EXTMIN']))
+        self.assertEqual((3, 4, 0), tuple(self.dwg.header['$EXTMAX']))
+
+    def test_empty_modelspace(self):
+        extmin = self.dwg.header['$EXTMIN']
+        self.assertIsNone(self.dwg.update_extents())
+        self.assertEqual(extmin, self.dwg.header['$EXTMIN'])
+
+    def test_update_on_save(self):
+        from io import StringIO
+        self.msp.add_circle((0, 0), radius=5)
+        ezdxf.options.update_extents_on_save = True
+        self.dwg.write(StringIO())
+        self.assertEqual((5, 5, 0), tuple(self.dwg.header['$EXTMAX']))
+
+
+MLINE = """  0
+MLINE
+  5
+100
+100
+AcDbEntity
+  8
+0
+100
+AcDbMline
+  2
+STANDARD
+ 10
+10.0
+ 20
+10.0
+ 30
+0.0
+ 11
+10.0
+ 21
+10.0
+ 31
+0.0
+ 12
+1.0
+ 22
+0.0
+ 32
+0.0
+ 13
+0.0
+ 23
+1.0
+ 33
+0.0
+ 11
+20.0
+ 21
+10.0
+ 31
+0.0
+ 12
+-1.0
+ 22
+0.0
+ 32
+0.0
+ 13
+0.0
+ 23
+-1.0
+ 33
+0.0
+"""
+
+if __name__ == '__main__':
+    unittest.main()
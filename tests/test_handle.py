@@ -9,7 +9,7 @@ from __future__ import unicode_literals
 
 import unittest
 
-from ezdxf.handle import HandleGenerator
+from ezdxf.handle import HandleGenerator, handle_key, hex_handle
 
 
 class TestHandleGenerator(unittest.TestCase):
@@ -32,5 +32,21 @@ class TestHandleGenerator(unittest.TestCase):
         self.assertEqual('300', str(handles))
 
 
+class TestHandleKey(unittest.TestCase):
+    def test_handle_key(self):
+        self.assertEqual(0x1FF, handle_key('1FF'))
+        self.assertEqual(0x1FF, handle_key('1ff'))
+        self.assertEqual(0x1FF, handle_key(0x1FF))
+
+    def test_invalid_handle(self):
+        with self.assertRaises(KeyError):
+            handle_key('XYZ')
+        with self.assertRaises(KeyError):
+            handle_key(None)
+
+    def test_hex_handle(self):
+        self.assertEqual('1FF', hex_handle(handle_key('1FF')))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
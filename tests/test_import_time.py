@@ -0,0 +1,85 @@
+# Purpose: test import time budget of ezdxf
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+import sys
+import os
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# generous budget for 'import ezdxf' in a new interpreter without cached bytecode, see tools/bench_import_time.py
+IMPORT_TIME_BUDGET = 0.5  # seconds
+LAZY_MODULES = ('pyparsing', 'ezdxf.queryparser', 'ezdxf.std', 'multiprocessing', 'numpy')
+
+SCRIPT = """
+import sys, time
+start = time.time()
+import ezdxf
+seconds = time.time() - start
+print(seconds)
+print(' '.join(name for name in {} if name in sys.modules))
+""".format(repr(LAZY_MODULES))
+
+
+def run(script):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return output.decode('ascii').splitlines()
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_time_budget(self):
+        seconds = min(float(run(SCRIPT)[0]) for _ in range(3))
+        self.assertLess(seconds, IMPORT_TIME_BUDGET)
+
+    def test_lazy_modules_not_imported(self):
+        lines = run(SCRIPT)
+        self.assertEqual('', lines[1] if len(lines) > 1 else '')
+
+    def test_lazy_imports_at_first_usage(self):
+        lines = run("import sys, ezdxf\n"
+                    "ezdxf.new('AC1015').modelspace().query('LINE[layer==\"0\"]')\n"
+                    "print('ANSI31' in ezdxf.PATTERN)\n"
+                    "print('pyparsing' in sys.modules, 'ezdxf.std' in sys.modules)\n")
+        self.assertEqual(['True', 'True True'], lines)
+
+
+class TestLazyTemplate(unittest.TestCase):
+    def test_parse_at_first_access(self):
+        from ezdxf.classifiedtags import LazyTemplate
+
+        class Entity(object):
+            TEMPLATE = LazyTemplate("  0\nLINE\n  5\n0\n")
+
+        descriptor = Entity.__dict__['TEMPLATE']
+        self.assertIsNone(descriptor.tags)
+        self.assertEqual('LINE', Entity.TEMPLATE.dxftype())
+        self.assertIs(Entity.TEMPLATE, Entity().TEMPLATE)
+
+
+class TestLazyMapping(unittest.TestCase):
+    def test_modify_pattern(self):
+        import ezdxf
+        from ezdxf.std import PATTERN
+        ezdxf.PATTERN['MY_PATTERN'] = [[45., (0., 0.), (0., 1.), []]]
+        try:
+            self.assertTrue('MY_PATTERN' in PATTERN)  # modifications are delegated to the module mapping
+            self.assertEqual(len(PATTERN), len(ezdxf.PATTERN))
+        finally:
+            del ezdxf.PATTERN['MY_PATTERN']
+        self.assertFalse('MY_PATTERN' in PATTERN)
+
+    def test_mutable_mapping_interface(self):
+        from ezdxf.lazy import LazyMapping
+        mapping = LazyMapping('ezdxf.const', 'dxfversion')
+        mapping.setdefault('AC9999', 'R9999')
+        self.assertEqual('R9999', mapping.pop('AC9999'))
+        self.assertFalse('AC9999' in mapping)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+# Purpose: test lazy loading of DXF entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+import os
+import tempfile
+from io import StringIO
+
+import ezdxf
+from ezdxf.database import LazyEntityDB
+from ezdxf.lazyloader import EntityIndex, _parse_entities
+
+
+def dxf_text(dwg):
+    """ Returns the DXF text of *dwg* without the value of $TDUPDATE, which is set to the current time by write(). """
+    stream = StringIO()
+    dwg.write(stream)
+    lines = stream.getvalue().split('\n')
+    index = lines.index('$TDUPDATE')
+    del lines[index + 2]
+    return '\n'.join(lines)
+
+
+class TestLazyLoader(unittest.TestCase):
+    DXFVERSION = 'AC1009'
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.dxf')
+        os.close(fd)
+        dwg = ezdxf.new(self.DXFVERSION)
+        dwg.blocks.new('BLK')
+        msp = dwg.modelspace()
+        for x in range(5):
+            msp.add_line((x, 0), (x, 1))
+        msp.add_polyline3d([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
+        msp.add_blockref('BLK', (0, 0)).add_attrib('TAG', 'VALUE', (0, 0))
+        msp.add_text('MODELSPACE')
+        dwg.layout().add_text('PAPERSPACE')
+        dwg.saveas(self.filename)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_entity_index(self):
+        index = EntityIndex(self.filename)
+        try:
+            dxftypes = index.dxftypes
+            self.assertEqual(['LINE'] * 5, dxftypes[:5])
+            self.assertEqual(['POLYLINE', 'VERTEX', 'VERTEX', 'VERTEX', 'SEQEND'], dxftypes[5:10])
+            self.assertEqual(len(dxftypes), len(index))
+        finally:
+            index.close()
+
+    def test_entities_are_not_loaded(self):
+        dwg = ezdxf.readfile(self.filename, lazy=True)
+        db = dwg.entitydb
+        self.assertTrue(isinstance(db, LazyEntityDB))
+        unloaded = [handle for handle in db.keys() if not db.is_loaded(handle)]
+        self.assertEqual(15, len(unloaded))  # 5 LINE, POLYLINE + 4 linked, INSERT + 2 linked, 2 TEXT
+        line = dwg.modelspace().query('LINE')[0]
+        self.assertTrue(db.is_loaded(line.dxf.handle))
+        self.assertFalse(db.is_loaded(unloaded[-1]))
+        self.assertEqual((0, 1), line.dxf.end)
+
+    def test_layouts(self):
+        dwg = ezdxf.readfile(self.filename, lazy=True)
+        msp_types = [entity.dxftype() for entity in dwg.modelspace()]
+        self.assertEqual(['LINE'] * 5 + ['POLYLINE', 'INSERT', 'TEXT'], msp_types)
+        psp_types = [entity.dxftype() for entity in dwg.layout()]
+        self.assertEqual(['TEXT'], psp_types)
+        self.assertEqual('PAPERSPACE', dwg.layout().query('TEXT')[0].dxf.text)
+
+    def test_same_decoding_as_readfile(self):
+        with open(self.filename, 'rb') as fp:
+            data = fp.read()
+        with open(self.filename, 'wb') as fp:  # utf-8 text in a cp1252 file, 0x81 is not defined in cp1252
+            fp.write(data.replace(b'MODELSPACE', '\u0401\u043b\u043a\u0430'.encode('utf-8')))
+        for dwg in (ezdxf.readfile(self.filename), ezdxf.readfile(self.filename, lazy=True),
+                    ezdxf.readfile(self.filename, workers=2)):
+            self.assertEqual('\u0401\u043b\u043a\u0430', dwg.modelspace().query('TEXT')[0].dxf.text)
+
+    def test_linked_entities(self):
+        dwg = ezdxf.readfile(self.filename, lazy=True)
+        msp = dwg.modelspace()
+        polyline = msp.query('POLYLINE')[0]
+        self.assertEqual([(0, 0, 0), (1, 0, 0), (1, 1, 1)], list(polyline.points()))
+        insert = msp.query('INSERT')[0]
+        self.assertEqual('VALUE', insert.get_attrib('TAG').dxf.text)
+
+    def test_write_lazy_drawing(self):
+        dwg = ezdxf.readfile(self.filename)
+        lazy_dwg = ezdxf.readfile(self.filename, lazy=True)
+        self.assertEqual(dxf_text(dwg), dxf_text(lazy_dwg))
+
+    def test_load_all(self):
+        dwg = ezdxf.readfile(self.filename, lazy=True)
+        db = dwg.entitydb
+        db.load_all(workers=2)
+        self.assertTrue(all(db.is_loaded(handle) for handle in db.keys()))
+        self.assertEqual('VALUE', dwg.modelspace().query('INSERT')[0].get_attrib('TAG').dxf.text)
+
+    def test_load_all_closes_file(self):
+        dwg = ezdxf.readfile(self.filename, lazy=True)
+        index = dwg.entitydb.entity_index
+        dwg.entitydb.load_all()
+        self.assertTrue(index._file.closed)
+        self.assertIsNone(dwg.entitydb.entity_index)
+
+    def test_save_to_source_file(self):
+        expected = dxf_text(ezdxf.readfile(self.filename))
+        lazy_dwg = ezdxf.readfile(self.filename, lazy=True)
+        lazy_dwg.save()  # overwrites the memory mapped file
+        self.assertEqual(8, len(ezdxf.readfile(self.filename).modelspace()))
+        self.assertEqual(expected, dxf_text(lazy_dwg))
+
+    def test_parse_entities_worker(self):
+        index = EntityIndex(self.filename)
+        try:
+            ranges = [(index.starts[0], index.starts[1])]
+            tags = _parse_entities((self.filename, index.encoding, (False, False, False), ranges))
+            self.assertEqual(1, len(tags))
+            self.assertEqual('LINE', tags[0].dxftype())
+        finally:
+            index.close()
+
+    def test_read_by_workers(self):
+        dwg = ezdxf.readfile(self.filename)
+        parallel_dwg = ezdxf.readfile(self.filename, workers=2)
+        self.assertEqual(dxf_text(dwg), dxf_text(parallel_dwg))
+
+
+class TestLazyLoaderAC1015(TestLazyLoader):
+    DXFVERSION = 'AC1015'
+
+    def test_entity_index(self):
+        index = EntityIndex(self.filename)
+        try:
+            msp_owner = index.owners[0]
+            self.assertNotEqual(0, msp_owner)
+            self.assertEqual(msp_owner, index.owners[5])  # POLYLINE
+            self.assertNotEqual(msp_owner, index.owners[-1])  # paper space TEXT
+        finally:
+            index.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,11 @@ class TestObjectsSection(unittest.TestCase):
         stream.close()
         self.assertEqual(normlines(TESTOBJECTS), normlines(result))
 
+    def test_query(self):
+        self.assertEqual(6, len(self.section.query('*')))
+        self.assertEqual(6, len(self.section.query('DICTIONARY')))
+        self.assertEqual(0, len(self.section.query('XRECORD')))
+
     def test_empty_section(self):
         section = ObjectsSection(Tags.from_text(EMPTYSEC), self.dwg)
         stream = StringIO()
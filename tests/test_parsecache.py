@@ -0,0 +1,132 @@
+# Purpose: test on-disk cache of tokenized DXF files
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import os
+import io
+import shutil
+import tempfile
+import unittest
+
+import ezdxf
+from ezdxf.parsecache import ParseCache
+from ezdxf.options import options
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+        self.filename = self.new_dxf_file('test.dxf')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def new_dxf_file(self, name, count=1):
+        dwg = ezdxf.new('AC1015')
+        msp = dwg.modelspace()
+        for x in range(count):
+            msp.add_line((x, 0), (x, 1))
+        filename = os.path.join(self.tmp_dir, name)
+        dwg.saveas(filename)
+        return filename
+
+    def test_hit_and_miss(self):
+        cache = ParseCache(self.cache_dir)
+        tags = cache.read_tags(self.filename)
+        self.assertEqual(1, len(cache.cache_files()))
+        self.assertEqual(tags, cache.read_tags(self.filename))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_readfile(self):
+        dwg = ezdxf.readfile(self.filename, cache_dir=self.cache_dir)
+        dwg = ezdxf.readfile(self.filename, cache_dir=self.cache_dir)
+        self.assertEqual(self.filename, dwg.filename)
+        self.assertEqual('AC1015', dwg.dxfversion)
+        line = dwg.modelspace().query('LINE')[0]
+        self.assertEqual((0, 1), line.dxf.end)
+
+    def test_readfile_verbatim_passthrough(self):
+        def write(dwg):
+            stream = io.StringIO()
+            dwg.write(stream)
+            text = stream.getvalue()
+            return text[text.index('CLASSES'):]  # without the HEADER section, $TDUPDATE changes
+
+        options.verbatim_passthrough = True
+        options.lazy_cast = True
+        try:
+            miss = write(ezdxf.readfile(self.filename, cache_dir=self.cache_dir))
+            hit = write(ezdxf.readfile(self.filename, cache_dir=self.cache_dir))
+        finally:
+            options.verbatim_passthrough = False
+            options.lazy_cast = False
+        self.assertEqual(1, len(ParseCache(self.cache_dir).cache_files()))
+        self.assertEqual(miss, hit)
+
+    def test_cache_key_of_verbatim_passthrough(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_tags(self.filename)
+        options.verbatim_passthrough = True
+        try:
+            cache.read_tags(self.filename)  # tags cached without source text are not reused
+        finally:
+            options.verbatim_passthrough = False
+        self.assertEqual((0, 2), (cache.hits, cache.misses))
+
+    def test_changed_file(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_tags(self.filename)
+        dwg = ezdxf.readfile(self.filename)
+        dwg.modelspace().add_circle((0, 0), 1)
+        dwg.save()
+        tags = cache.read_tags(self.filename)
+        self.assertEqual(2, cache.misses)
+        self.assertTrue((0, 'CIRCLE') in tags)
+
+    def test_corrupt_cache_file(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_tags(self.filename)
+        cache_file = cache.cache_file(self.filename)
+        with io.open(cache_file, mode='r+b') as fp:
+            fp.seek(-10, os.SEEK_END)
+            fp.write(b'0123456789')
+        tags = cache.read_tags(self.filename)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(tags, cache.read_tags(self.filename))
+        self.assertEqual(1, cache.hits)
+
+    def test_invalid_signature(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_tags(self.filename)
+        with io.open(cache.cache_file(self.filename), mode='wb') as fp:
+            fp.write(b'garbage')
+        cache.read_tags(self.filename)
+        self.assertEqual(2, cache.misses)
+
+    def test_lru_eviction(self):
+        cache = ParseCache(self.cache_dir)
+        file1 = self.filename
+        file2 = self.new_dxf_file('test2.dxf', count=2)
+        cache.read_tags(file1)
+        cache.read_tags(file2)
+        size = cache.size()
+        file1_cache = cache.cache_file(file1)
+        os.utime(file1_cache, (1, 1))  # least recently used
+        cache.read_tags(file2)  # file2 was used last
+        cache.max_size = size - 1
+        cache.evict()
+        self.assertFalse(os.path.exists(file1_cache))
+        self.assertTrue(os.path.exists(cache.cache_file(file2)))
+
+    def test_clear(self):
+        cache = ParseCache(self.cache_dir)
+        cache.read_tags(self.filename)
+        cache.clear()
+        self.assertEqual(0, cache.size())
+
+
+if __name__ == '__main__':
+    unittest.main()
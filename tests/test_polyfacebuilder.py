@@ -0,0 +1,120 @@
+# Purpose: test incremental polyface builder
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+
+import ezdxf
+
+
+def square(x, y):
+    return [(x, y, 0), (x + 1, y, 0), (x + 1, y + 1, 0), (x, y + 1, 0)]
+
+
+class TestIncrementalPolyfaceBuilderAC1009(unittest.TestCase):
+    DXFVERSION = 'AC1009'
+
+    def setUp(self):
+        self.dwg = ezdxf.new(self.DXFVERSION)
+        self.polyface = self.dwg.modelspace().add_polyface()
+
+    def test_merge_vertices(self):
+        builder = self.polyface.get_face_builder()
+        builder.add_faces([square(0, 0), square(1, 0)])
+        builder.add_face([(0, 0, 0), (1, 0, 0), (0.5, -1.0000001, 0)])
+        self.assertEqual(7, builder.nvertices)
+        self.assertEqual(3, builder.nfaces)
+        self.assertEqual(0, len(self.polyface))  # nothing created before commit()
+        builder.commit()
+        self.assertEqual(7, self.polyface.dxf.m_count)
+        self.assertEqual(3, self.polyface.dxf.n_count)
+        self.assertEqual(10, len(self.polyface))
+
+    def test_precision(self):
+        builder = self.polyface.get_face_builder(precision=3)
+        self.assertEqual(0, builder.add_vertex((1, 1, 1)))
+        self.assertEqual(0, builder.add_vertex((1.0001, 1, 1)))
+        self.assertEqual(1, builder.add_vertex((1.001, 1, 1)))
+
+    def test_face_indices(self):
+        builder = self.polyface.get_face_builder()
+        builder.add_faces([square(0, 0), square(1, 0)], dxfattribs={'color': 3})
+        builder.commit()
+        faces = list(self.polyface.faces())
+        face_record = faces[0][-1]
+        self.assertEqual((1, 2, 3, 4), (face_record.dxf.vtx0, face_record.dxf.vtx1,
+                                        face_record.dxf.vtx2, face_record.dxf.vtx3))
+        self.assertEqual([(1., 0., 0.), (2., 0., 0.), (2., 1., 0.), (1., 1., 0.)],
+                         [vertex.dxf.location for vertex in faces[1][:-1]])
+        face_record = faces[1][-1]
+        self.assertEqual((2, 5, 6, 3), (face_record.dxf.vtx0, face_record.dxf.vtx1,
+                                        face_record.dxf.vtx2, face_record.dxf.vtx3))
+        self.assertEqual(3, face_record.dxf.color)
+
+    def test_append_to_existing_faces(self):
+        self.polyface.append_faces([square(0, 0)])
+        builder = self.polyface.get_face_builder()
+        builder.add_faces([square(1, 0), square(2, 0)])
+        builder.commit()
+        builder.add_face(square(3, 0))  # builder is still usable after commit()
+        builder.commit()
+        self.assertEqual(10, self.polyface.dxf.m_count)
+        self.assertEqual(4, self.polyface.dxf.n_count)
+        vertices = list(self.polyface.vertices())
+        # mesh vertices first, followed by the face records
+        self.assertTrue(all(vertex.is_poly_face_mesh_vertex for vertex in vertices[:10]))
+        self.assertTrue(all(vertex.is_face_record for vertex in vertices[10:]))
+        self.assertEqual(4, len(list(self.polyface.faces())))
+
+    def test_polyface_changed_before_commit(self):
+        self.polyface.append_faces([square(5, 5)])
+        builder = self.polyface.get_face_builder()
+        builder.add_vertex((9, 9, 9))  # vertex without face is preserved
+        builder.add_face([(1, 1, 0), (2, 1, 0), (5, 5, 0)])
+        self.polyface.append_faces([[(0, 0, 0), (1, 0, 0), (1, 1, 0)]])
+        builder.commit()
+        self.assertEqual(9, self.polyface.dxf.m_count)
+        self.assertEqual(3, self.polyface.dxf.n_count)
+        self.assertEqual(12, len(self.polyface))
+        faces = list(self.polyface.faces())
+        self.assertEqual(3, len(faces))
+        self.assertEqual([(1., 1., 0.), (2., 1., 0.), (5., 5., 0.)], [vertex.dxf.location for vertex in faces[2][:-1]])
+
+    def test_commit_does_not_scan_unchanged_polyface(self):
+        self.polyface.append_faces([square(0, 0), square(1, 0)])
+        builder = self.polyface.get_face_builder()
+        scans = []
+        scan = builder._scan
+        builder._scan = lambda grid=None: scans.append(grid) or scan(grid)
+        for x in range(2, 5):
+            builder.add_face(square(x, 0))
+            builder.commit()
+        self.assertEqual([], scans)
+        self.assertEqual(12, self.polyface.dxf.m_count)
+        self.assertEqual(5, self.polyface.dxf.n_count)
+
+    def test_last_face_record_deleted_before_commit(self):
+        self.polyface.append_faces([square(0, 0), square(1, 0)])
+        builder = self.polyface.get_face_builder()
+        builder.add_face(square(2, 0))
+        self.polyface.delete_vertices(len(self.polyface) - 1)  # last face record
+        builder.commit()
+        self.assertEqual(8, self.polyface.dxf.m_count)
+        self.assertEqual(2, self.polyface.dxf.n_count)  # reloaded: 1 existing face + 1 new face
+        self.assertEqual(10, len(self.polyface))
+
+    def test_invalid_face(self):
+        builder = self.polyface.get_face_builder()
+        with self.assertRaises(ValueError):
+            builder.add_face([(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)])
+        self.assertEqual(0, builder.nvertices)  # invalid face is not added
+
+
+class TestIncrementalPolyfaceBuilderAC1015(TestIncrementalPolyfaceBuilderAC1009):
+    DXFVERSION = 'AC1015'
+
+
+if __name__ == '__main__':
+    unittest.main()
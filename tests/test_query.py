@@ -6,7 +6,9 @@ import unittest
 
 import ezdxf
 
-from ezdxf.query import EntityQuery, name_query
+from ezdxf.query import EntityQuery, name_query, MatcherCache, entity_matcher, compile_entity_matcher
+from ezdxf.query import BoolExpression, _compile_tokens
+from ezdxf.queryparser import EntityQueryParser
 
 
 def make_test_drawing(version):
@@ -141,5 +143,56 @@ class TestNameQuery(unittest.TestCase):
         self.assertEqual("ONE_2", result[1])
         self.assertEqual(2, len(result))
 
+
+class TestMatcherCache(unittest.TestCase):
+    def test_same_matcher(self):
+        self.assertIs(entity_matcher('LINE[color==7]'), entity_matcher('LINE[color==7]'))
+
+    def test_hits_and_misses(self):
+        cache = MatcherCache()
+        cache.get('LINE')
+        cache.get('LINE')
+        cache.get('TEXT')
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+
+    def test_lru_eviction(self):
+        cache = MatcherCache(maxsize=2)
+        cache.get('LINE')
+        cache.get('TEXT')
+        cache.get('LINE')  # TEXT is least recently used
+        cache.get('CIRCLE')
+        self.assertEqual(2, len(cache))
+        cache.get('LINE')
+        self.assertEqual(2, cache.hits)
+
+    def test_invalid_query_is_not_cached(self):
+        cache = MatcherCache()
+        with self.assertRaises(Exception):
+            cache.get('LINE[')
+        self.assertEqual(0, len(cache))
+
+
+class TestCompiledBoolExpression(unittest.TestCase):
+    # timing benchmark: tools/bench_query_matcher.py
+    QUERY = '*[!(layer=="construction" & color<7) | layer ? "lay_.*"]'
+
+    def setUp(self):
+        self.entities = make_test_drawing('AC1015').modelspace().query('*')
+
+    def test_compiled_expression_matches_evaluate(self):
+        query_args = EntityQueryParser.parseString(self.QUERY, parseAll=True)
+        expr = BoolExpression(_compile_tokens(query_args.AttribQuery, False))
+        compiled = expr.compile()
+        for entity in self.entities:
+            self.assertEqual(expr.evaluate(entity), compiled(entity))
+
+    def test_cached_matcher_matches_compiled_matcher(self):
+        cached = entity_matcher(self.QUERY)
+        compiled = compile_entity_matcher(self.QUERY)
+        self.assertEqual([cached(entity) for entity in self.entities],
+                         [compiled(entity) for entity in self.entities])
+
+
 if __name__ == '__main__':
     unittest.main()
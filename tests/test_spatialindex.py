@@ -0,0 +1,133 @@
+# Purpose: test bounding boxes and spatial index of layout entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+
+import ezdxf
+from ezdxf.spatialindex import OCS, BoundingBoxCalculator, SpatialIndex
+
+
+def is_close_box(box1, box2, places=6):
+    return all(round(a - b, places) == 0 for a, b in zip(box1, box2))
+
+
+class TestOCS(unittest.TestCase):
+    def test_default_extrusion(self):
+        self.assertEqual((1, 2, 3), OCS().to_wcs((1, 2, 3)))
+
+    def test_mirrored_extrusion(self):
+        x, y, z = OCS((0, 0, -1)).to_wcs((1, 2, 3))
+        self.assertAlmostEqual(-1, x)
+        self.assertAlmostEqual(2, y)
+        self.assertAlmostEqual(-3, z)
+
+
+class TestBoundingBoxCalculator(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+        self.calc = BoundingBoxCalculator(self.dwg)
+
+    def bbox(self, entity):
+        return self.calc.bbox(entity)
+
+    def test_line(self):
+        line = self.msp.add_line((1, 2, 3), (0, 5))
+        self.assertEqual((0, 2, 0, 1, 5, 3), self.bbox(line))
+
+    def test_circle(self):
+        circle = self.msp.add_circle((10, 10), 2)
+        self.assertEqual((8, 8, 0, 12, 12, 0), self.bbox(circle))
+
+    def test_arc_quadrants(self):
+        arc = self.msp.add_arc((0, 0), 1, 45, 135)
+        self.assertTrue(is_close_box((-0.707107, 0.707107, 0, 0.707107, 1, 0), self.bbox(arc)))
+
+    def test_lwpolyline_bulge(self):
+        polyline = self.msp.add_lwpolyline([(0, 0, 0, 0, 1), (2, 0)])
+        self.assertTrue(is_close_box((0, -1, 0, 2, 0, 0), self.bbox(polyline)))
+
+    def test_polyface_ignores_face_records(self):
+        polyface = self.msp.add_polyface()
+        polyface.append_face([(10, 10, 1), (11, 10, 1), (11, 11, 1)])
+        self.assertEqual((10, 10, 1, 11, 11, 1), self.bbox(polyface))
+
+    def test_insert(self):
+        block = self.dwg.blocks.new('TEST', base_point=(1, 1))
+        block.add_line((1, 1), (3, 2))
+        insert = self.msp.add_blockref('TEST', (100, 0), dxfattribs={'rotation': 90, 'xscale': 2})
+        self.assertTrue(is_close_box((99, 0, 0, 100, 4, 0), self.bbox(insert)))
+
+    def test_unsupported_type(self):
+        self.assertIsNone(self.bbox(self.msp.add_ray((0, 0, 0), (1, 0, 0))))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+        self.lines = [self.msp.add_line((x, 0), (x + 1, 1)) for x in range(0, 100, 10)]
+        self.circle = self.msp.add_circle((50, 50), 5)
+
+    def test_query_bbox(self):
+        result = self.msp.query_bbox((15, -1), (31, 2))
+        self.assertEqual([(20, 0), (30, 0)], [entity.dxf.start[:2] for entity in result])
+
+    def test_query_bbox_with_entity_query(self):
+        self.assertEqual(0, len(self.msp.query_bbox((0, 0), (100, 100), 'ARC')))
+        self.assertEqual(1, len(self.msp.query_bbox((0, 0), (100, 100), 'CIRCLE')))
+
+    def test_query_bbox_3d(self):
+        self.assertEqual(0, len(self.msp.query_bbox((0, 0, 1), (100, 100, 2))))
+
+    def test_nearest_entity(self):
+        self.assertEqual((40, 0), self.msp.nearest_entity((41, 3)).dxf.start[:2])
+        self.assertEqual('CIRCLE', self.msp.nearest_entity((0, 0), 'CIRCLE').dxftype())
+        self.assertIsNone(self.msp.nearest_entity((0, 0), 'ARC'))
+
+    def test_nearest_entity_far_outside(self):
+        # rings between the query point and the used grid cells are skipped
+        self.assertEqual('CIRCLE', self.msp.nearest_entity((1e5, 1e5)).dxftype())
+        self.assertEqual((0, 0), self.msp.nearest_entity((-1e5, -1e5)).dxf.start[:2])
+
+    def test_incremental_update(self):
+        index = self.msp.spatial_index
+        circle = self.msp.add_circle((500, 500), 1)
+        self.assertTrue(circle.dxf.handle in index)
+        self.assertEqual('CIRCLE', self.msp.nearest_entity((510, 510)).dxftype())
+        self.msp.delete_entity(circle)
+        self.assertFalse(circle.dxf.handle in index)
+        self.assertEqual(0, len(self.msp.query_bbox((490, 490), (510, 510))))
+
+    def test_bbox_calculated_at_next_query(self):
+        self.msp.spatial_index
+        polyline = self.msp.add_polyline2d([])
+        polyline.append_vertices([(200, 200), (201, 201)])  # vertices added after adding the POLYLINE
+        self.assertEqual([polyline.dxf.handle], [e.dxf.handle for e in self.msp.query_bbox((199, 199), (202, 202))])
+
+    def test_update_modified_entity(self):
+        index = self.msp.spatial_index
+        line = self.lines[0]
+        line.dxf.end = (300, 300)
+        index.update(line)
+        self.assertEqual((0, 0, 0, 300, 300, 0), index.bbox(line.dxf.handle))
+
+    def test_large_entities(self):
+        index = SpatialIndex(self.msp, cell_size=1.)
+        self.assertTrue(self.circle.dxf.handle in index._large)
+        self.assertEqual(1, len(self.msp.query_bbox((45, 45), (46, 46))))
+
+    def test_extents(self):
+        self.assertEqual((0, 0, 0, 91, 55, 0), self.msp.spatial_index.extents())
+
+    def test_block_layout(self):
+        block = self.dwg.blocks.new('TEST')
+        block.add_circle((0, 0), 1)
+        self.assertEqual(1, len(block.query_bbox((0, 0), (1, 1))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# Purpose: test DXFStreamWriter()
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+import os
+import tempfile
+
+import ezdxf
+
+
+class TestStreamWriter(unittest.TestCase):
+    DXFVERSION = 'AC1009'
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.dxf')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_write_entities(self):
+        writer = ezdxf.streamwriter(self.filename, self.DXFVERSION)
+        writer.drawing.layers.create('STREAM')
+        with writer as msp:
+            for x in range(10):
+                msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'STREAM'})
+            msp.add_polyline3d([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
+            msp.add_3Dface([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+            msp.add_text('TEXT')
+        self.assertEqual(13, writer.count)
+
+        dwg = ezdxf.readfile(self.filename)
+        msp = dwg.modelspace()
+        types = [entity.dxftype() for entity in msp]
+        self.assertEqual(['LINE'] * 10 + ['POLYLINE', '3DFACE', 'TEXT'], types)
+        self.assertEqual('STREAM', msp.query('LINE')[0].dxf.layer)
+        polyline = msp.query('POLYLINE')[0]
+        self.assertEqual(3, len(polyline))
+        self.assertEqual((1, 1), msp.query('3DFACE')[0][2][:2])
+
+    def test_entities_not_stored(self):
+        writer = ezdxf.streamwriter(self.filename, self.DXFVERSION)
+        db_size = len(writer.drawing.entitydb)
+        with writer as msp:
+            for x in range(10):
+                msp.add_line((x, 0), (x, 1))
+            self.assertEqual(db_size + 1, len(writer.drawing.entitydb))  # just the pending entity
+        self.assertEqual(db_size, len(writer.drawing.entitydb))
+
+    def test_handseed(self):
+        writer = ezdxf.streamwriter(self.filename, self.DXFVERSION)
+        with writer as msp:
+            for x in range(100):
+                msp.add_point((x, 0))
+        dwg = ezdxf.readfile(self.filename)
+        handseed = int(dwg.header['$HANDSEED'], 16)
+        max_handle = max(int(point.dxf.handle, 16) for point in dwg.modelspace())
+        self.assertTrue(handseed > max_handle)
+
+    def test_delete_pending_entities(self):
+        writer = ezdxf.streamwriter(self.filename, self.DXFVERSION)
+        db_size = len(writer.drawing.entitydb)
+        with writer as msp:
+            msp.add_line((0, 0), (1, 1))
+            msp.add_circle((0, 0), 1)  # writes the LINE entity
+            msp.delete_all_entities()  # deletes just the pending CIRCLE entity
+            self.assertEqual(db_size, len(writer.drawing.entitydb))
+            msp.add_point((0, 0))
+        self.assertEqual(2, writer.count)
+        dwg = ezdxf.readfile(self.filename)
+        self.assertEqual(['LINE', 'POINT'], [entity.dxftype() for entity in dwg.modelspace()])
+
+    def test_type_histogram(self):
+        writer = ezdxf.streamwriter(self.filename, self.DXFVERSION)
+        with writer as msp:
+            for x in range(3):
+                msp.add_line((x, 0), (x, 1))
+            msp.add_circle((0, 0), 1)  # pending entity
+            self.assertEqual({'LINE': 3, 'CIRCLE': 1}, msp.type_histogram())
+
+
+class TestStreamWriterAC1015(TestStreamWriter):
+    DXFVERSION = 'AC1015'
+
+
+if __name__ == '__main__':
+    unittest.main()
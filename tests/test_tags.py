@@ -9,9 +9,10 @@ from __future__ import unicode_literals
 import unittest
 from io import StringIO
 
-from ezdxf.c23 import ustr
-from ezdxf.tags import StringIterator, Tags, dxf_info
-from ezdxf.dxftag import tag_type, point_tuple, strtag
+from ezdxf.c23 import ustr, PY3
+from ezdxf.tags import StringIterator, BufferedTagIterator, Tags, dxf_info
+from ezdxf.dxftag import tag_type, point_tuple, strtag, DXFTag, RawTag, handle_string, raw_tag
+from ezdxf.options import options
 
 TEST_TAGREADER = """  0
 SECTION
@@ -189,6 +190,77 @@ class TestTagReader(unittest.TestCase):
         self.assertEqual(int, type(tags[0].value))
 
 
+class TestBufferedTagReader(unittest.TestCase):
+    def setUp(self):
+        self.reader = BufferedTagIterator(StringIO(TEST_TAGREADER))
+
+    def test_next(self):
+        self.assertEqual((0, 'SECTION'), next(self.reader))
+
+    def test_undo_last(self):
+        next(self.reader)
+        self.reader.undotag()
+        self.assertEqual((0, 'SECTION'), next(self.reader))
+
+    def test_error_on_multiple_undo_last(self):
+        next(self.reader)
+        self.reader.undotag()
+        with self.assertRaises(ValueError):
+            self.reader.undotag()
+
+    def test_error_undo_last_before_first_read(self):
+        with self.assertRaises(ValueError):
+            self.reader.undotag()
+
+    def test_lineno_with_undo_next(self):
+        next(self.reader)
+        self.assertEqual(2, self.reader.lineno)
+        self.reader.undotag()
+        self.assertEqual(0, self.reader.lineno)
+        next(self.reader)
+        self.assertEqual(2, self.reader.lineno)
+
+    def test_undo_eof(self):
+        for tag in self.reader:
+            if tag == (0, 'EOF'):
+                self.reader.undotag()
+                break
+        self.assertEqual((0, 'EOF'), next(self.reader))
+        with self.assertRaises(StopIteration):
+            next(self.reader)
+
+    def test_same_tags_as_tag_iterator(self):
+        for text in (TEST_TAGREADER, TEST_NO_EOF, TEST_TAGREADER_COMMENTS, POINT_TAGS, POINT_2D_TAGS,
+                     FLOAT_FOR_INT_TAGS):
+            expected = list(StringIterator(text))
+            for blocksize in (1, 3, 7, 1024):  # block boundaries everywhere
+                tags = list(BufferedTagIterator(StringIO(text), blocksize=blocksize))
+                self.assertEqual(expected, tags)
+
+    def test_skip_comments(self):
+        tags = list(BufferedTagIterator(StringIO(TEST_TAGREADER_COMMENTS)))
+        self.assertEqual(list(StringIterator(TEST_TAGREADER)), tags)
+
+    def test_read_2D_points(self):
+        tags = list(BufferedTagIterator(StringIO(POINT_2D_TAGS)))
+        self.assertEqual((100, 200), tags[0].value)
+        self.assertEqual('check mark 1', tags[1].value)
+        self.assertEqual((100, 200, 300), tags[2].value)
+        self.assertEqual('check mark 2', tags[3].value)
+
+    def test_last_line_without_line_ending(self):
+        tags = list(BufferedTagIterator(StringIO(TEST_TAGREADER.rstrip('\n'))))
+        self.assertEqual((0, 'EOF'), tags[-1])
+
+    def test_readline_only_stream(self):
+        class ReadlineStream(object):
+            def __init__(self, text):
+                self.readline = StringIO(text).readline
+
+        tags = list(BufferedTagIterator(ReadlineStream(POINT_2D_TAGS)))
+        self.assertEqual(list(StringIterator(POINT_2D_TAGS)), tags)
+
+
 class TestGetDXFInfo(unittest.TestCase):
     def test_dxfinfo(self):
         info = dxf_info(StringIO(TEST_TAGREADER))
@@ -341,6 +413,89 @@ TEST2
 """
 
 
+class TestDXFTag(unittest.TestCase):
+    def test_attributes(self):
+        tag = DXFTag(1, 'text')
+        self.assertEqual(1, tag.code)
+        self.assertEqual('text', tag.value)
+
+    def test_equal_to_tuple(self):
+        self.assertEqual((0, 'LINE'), DXFTag(0, 'LINE'))
+        self.assertEqual(DXFTag(0, 'LINE'), (0, 'LINE'))
+        self.assertNotEqual(DXFTag(0, 'LINE'), (0, 'ARC'))
+
+    def test_unpacking(self):
+        code, value = DXFTag(10, (1., 2., 3.))
+        self.assertEqual(10, code)
+        self.assertEqual((1., 2., 3.), value)
+
+    def test_index(self):
+        tag = DXFTag(8, 'LAYER')
+        self.assertEqual(8, tag[0])
+        self.assertEqual('LAYER', tag[1])
+        self.assertEqual(2, len(tag))
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(DXFTag(0, 'LINE'), '__dict__'))
+
+    def test_str_point(self):
+        self.assertEqual(' 10\n1.0\n 20\n2.0\n', str(DXFTag(10, (1., 2.))))
+
+
+VERBATIM_TAGS = """  0
+LINE
+  8
+0
+ 10
+1.000000
+ 20
+2.000000
+ 30
+0
+ 62
+    7
+"""
+
+
+class TestLazyCast(unittest.TestCase):
+    def setUp(self):
+        options.lazy_cast = True
+        self.tags = Tags.from_text(VERBATIM_TAGS)
+
+    def tearDown(self):
+        options.lazy_cast = False
+
+    def test_raw_tags(self):
+        self.assertEqual(RawTag, type(self.tags[2]))
+        self.assertEqual('    7', self.tags[3].raw_value)
+        self.assertEqual(DXFTag, type(self.tags[0]))  # strings need no casting
+
+    def test_cast_at_access(self):
+        self.assertEqual(7, self.tags[3].value)
+        self.assertEqual((1., 2., 0.), self.tags[2].value)
+        self.assertEqual((62, 7), self.tags[3])
+        code, value = self.tags[3]
+        self.assertEqual(7, value)
+
+    def test_tags_replaces_raw_tag_at_first_access(self):
+        self.assertEqual(7, self.tags.get_value(62))
+        self.assertEqual(DXFTag, type(self.tags[3]))
+        self.assertEqual((1., 2., 0.), self.tags.find_first(10))
+        self.assertEqual(DXFTag, type(self.tags[2]))
+
+    def test_write_verbatim(self):
+        stream = StringIO()
+        self.tags.write(stream)
+        self.assertEqual(VERBATIM_TAGS, stream.getvalue())
+
+    def test_write_accessed_tags(self):
+        self.tags.get_value(62)
+        stream = StringIO()
+        self.tags.write(stream)
+        self.assertTrue(' 62\n7\n' in stream.getvalue())
+        self.assertTrue(' 10\n1.000000\n' in stream.getvalue())
+
+
 class TestTagType(unittest.TestCase):
     def test_int(self):
         self.assertEqual(int, tag_type(60))
@@ -355,12 +510,32 @@ class TestTagType(unittest.TestCase):
         with self.assertRaises(ValueError):
             tag_type(3000)
 
+    def test_handle(self):
+        self.assertEqual(handle_string, tag_type(330))
+        self.assertEqual(ustr, tag_type(5))  # entity handles are unique and not interned
+
     def test_point_tuple_2d(self):
         self.assertEqual((1, 2), point_tuple(('1', '2')))
 
     def test_point_tuple_3d(self):
         self.assertEqual((1, 2, 3), point_tuple(('1', '2', '3')))
 
+
+class TestHandleReferences(unittest.TestCase):
+    TEXT = "  0\nLINE\n  5\nFF\n330\n1F\n  0\nLINE\n  5\n100\n330\n1F\n"
+
+    @unittest.skipUnless(PY3, "Python 2.7 can not intern unicode strings")
+    def test_shared_references(self):
+        tags = Tags.from_text(self.TEXT)
+        self.assertEqual('1F', tags[2].value)
+        self.assertIs(tags[2].value, tags[5].value)
+
+    def test_raw_tag_is_not_delayed(self):
+        tag = raw_tag((330, '1F'))
+        self.assertEqual(DXFTag, type(tag))
+        self.assertEqual('1F', tag.value)
+
+
 COLLECT_1 = """  0
 ZERO
   1
@@ -414,3 +589,69 @@ class TestTagsCollect(unittest.TestCase):
         tags = Tags()
         collected_tags = tags.collect_consecutive_tags([0, 1, 2, 3, 4])
         self.assertEqual(0, len(collected_tags))
+
+
+class TestTagsCodeIndex(unittest.TestCase):
+    def setUp(self):
+        self.tags = Tags(DXFTag(code, str(code)) for code in (0, 5, 8, 10, 40, 40, 50, 62, 70, 71))
+
+    def test_index_of_first_tag(self):
+        self.assertEqual(4, self.tags.tag_index(40))
+        self.assertEqual('40', self.tags.find_first(40))
+        self.assertTrue(self.tags.has_tag(71))
+        self.assertFalse(self.tags.has_tag(72))
+
+    def test_append(self):
+        self.tags.tag_index(0)  # build code index
+        self.tags.append(DXFTag(72, 'X'))
+        self.tags.append(DXFTag(40, 'X'))
+        self.assertEqual(10, self.tags.tag_index(72))
+        self.assertEqual(4, self.tags.tag_index(40))
+
+    def test_insert(self):
+        self.tags.tag_index(0)
+        self.tags.insert(1, DXFTag(40, 'X'))
+        self.assertEqual(1, self.tags.tag_index(40))
+        self.assertEqual(2, self.tags.tag_index(5))
+
+    def test_delete(self):
+        self.tags.tag_index(0)
+        del self.tags[4]
+        self.assertEqual(4, self.tags.tag_index(40))
+        self.assertEqual('40', self.tags[4].value)
+        del self.tags[4]
+        self.assertFalse(self.tags.has_tag(40))
+
+    def test_replace_by_other_code(self):
+        self.tags.tag_index(0)
+        self.tags[1] = DXFTag(40, 'X')
+        self.assertEqual(1, self.tags.tag_index(40))
+        self.assertFalse(self.tags.has_tag(5))
+
+    def test_update(self):
+        self.tags.update(40, 'X')
+        self.assertEqual('X', self.tags.find_first(40))
+        self.assertEqual(4, self.tags.tag_index(40))
+
+    def test_remove_tags(self):
+        self.tags.tag_index(0)
+        self.tags.remove_tags([40, 50])
+        self.assertEqual(7, len(self.tags))
+        self.assertFalse(self.tags.has_tag(40))
+        self.assertEqual(4, self.tags.tag_index(62))
+
+    def test_remove_tags_by_generator(self):
+        self.tags.remove_tags(code for code in (40, 50))
+        self.assertFalse(self.tags.has_tag(40))
+        self.assertFalse(self.tags.has_tag(50))
+
+    def test_slice_assignment(self):
+        self.tags.tag_index(0)
+        self.tags[:] = [DXFTag(1, 'X')]
+        self.assertEqual(0, self.tags.tag_index(1))
+        self.assertFalse(self.tags.has_tag(0))
+
+    def test_range_search(self):
+        self.assertEqual(5, self.tags.tag_index(40, start=5))
+        with self.assertRaises(ValueError):
+            self.tags.tag_index(40, end=4)
@@ -0,0 +1,65 @@
+# Purpose: test in-process cache of tokenized template files
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import ezdxf
+from ezdxf.templatecache import TemplateCache
+from ezdxf.templatefinder import TemplateFinder
+
+
+class TestTemplateCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = TemplateCache()
+        tags = cache.get('AC1009')
+        self.assertIs(tags, cache.get('AC1009'))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertEqual((0, 'SECTION'), tags[0])
+
+    def test_custom_template_dir(self):
+        template_dir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(template_dir, 'AC1009.dxf')
+            shutil.copy(TemplateFinder().filepath('AC1009'), filepath)
+            cache = TemplateCache()
+            tags = cache.get('AC1009', template_dir)
+            self.assertIs(tags, cache.get('AC1009', template_dir))
+            with open(filepath, 'a') as fp:  # changed file size
+                fp.write('\n')
+            self.assertIsNot(tags, cache.get('AC1009', template_dir))
+            self.assertEqual(2, cache.misses)
+        finally:
+            shutil.rmtree(template_dir)
+
+
+class TestNewDrawing(unittest.TestCase):
+    def tearDown(self):
+        ezdxf.options.cache_templates = True
+
+    def test_independent_drawings(self):
+        dwg1 = ezdxf.new('AC1015')
+        dwg2 = ezdxf.new('AC1015')
+        dwg1.modelspace().add_line((0, 0), (1, 0))
+        dwg1.layers.create('TEST')
+        dwg1.blocks.new('TEST')
+        self.assertEqual(0, len(dwg2.modelspace()))
+        self.assertFalse('TEST' in dwg2.layers)
+        self.assertFalse('TEST' in dwg2.blocks)
+        self.assertNotEqual(str(dwg1._handles), str(dwg2._handles))
+
+    def test_same_content_without_cache(self):
+        cached = ezdxf.new('AC1015')
+        ezdxf.options.cache_templates = False
+        uncached = ezdxf.new('AC1015')
+        self.assertEqual(str(cached._handles), str(uncached._handles))
+        self.assertEqual(sorted(cached.entitydb.keys()), sorted(uncached.entitydb.keys()))
+
+
+if __name__ == '__main__':
+    unittest.main()
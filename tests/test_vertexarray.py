@@ -0,0 +1,131 @@
+# Purpose: test array based vertex storage for POLYLINE entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+from io import StringIO
+
+import ezdxf
+from ezdxf.const import VTX_3D_POLYLINE_VERTEX
+
+
+class TestVertexArrayAC1009(unittest.TestCase):
+    DXFVERSION = 'AC1009'
+
+    def setUp(self):
+        self.dwg = ezdxf.new(self.DXFVERSION)
+        self.polyline = self.dwg.modelspace().add_polyline3d([(0, 0, 0), (1, 1, 1), (2, 2, 2)])
+
+    def locations(self):
+        return [tuple(vertex.dxf.location) for vertex in self.polyline.vertices()]
+
+    def test_load(self):
+        vertices = self.polyline.vertex_array()
+        self.assertEqual(3, len(vertices))
+        self.assertEqual((1., 1., 1.), vertices[1])
+        self.assertEqual((2., 2., 2.), vertices[-1])
+        self.assertEqual([0., 0., 0., 1., 1., 1., 2., 2., 2.], list(vertices.points_array()))
+        self.assertEqual(VTX_3D_POLYLINE_VERTEX, vertices.get_attrib(0, 'flags'))
+        with self.assertRaises(IndexError):
+            vertices[3]
+
+    def test_append(self):
+        vertices = self.polyline.vertex_array()
+        vertices.append([(3, 3, 3), (4, 4)])
+        self.assertEqual(5, len(vertices))
+        self.assertEqual((4., 4., 0.), vertices[4])
+        self.assertEqual(5, len(self.polyline))  # flushes pending changes
+        self.assertEqual((3., 3., 3.), self.locations()[3])
+        self.assertEqual(VTX_3D_POLYLINE_VERTEX, self.polyline[4].dxf.flags)
+
+    def test_append_with_array_attribs(self):
+        vertices = self.polyline.vertex_array()
+        vertices.append([(3, 3, 3)], dxfattribs={'bulge': .5, 'start_width': 1.5})
+        self.assertEqual(.5, vertices.get_attrib(3, 'bulge'))
+        vertices.flush()
+        vertex = self.polyline[3]
+        self.assertEqual(.5, vertex.dxf.bulge)
+        self.assertEqual(1.5, vertex.dxf.start_width)
+        self.assertEqual(0., vertex.dxf.end_width)
+
+    def test_get_attrib_loads_vertices(self):
+        vertices = self.polyline.vertex_array()
+        self.assertEqual(VTX_3D_POLYLINE_VERTEX, vertices.get_attrib(0, 'flags'))  # not loaded
+        vertices.set_attrib(0, 'bulge', .25)
+        vertices.flush()
+        self.assertEqual(.25, vertices.get_attrib(0, 'bulge'))  # reloaded
+
+    def test_insert_and_delete(self):
+        vertices = self.polyline.vertex_array()
+        vertices.insert(1, [(7, 7, 7), (8, 8, 8)])
+        vertices.delete(3)
+        self.assertEqual([(0., 0., 0.), (7., 7., 7.), (8., 8., 8.), (2., 2., 2.)], list(vertices))
+        self.assertEqual([(0., 0., 0.), (7., 7., 7.), (8., 8., 8.), (2., 2., 2.)], self.locations())
+
+    def test_delete_removes_vertices_from_database(self):
+        handle = self.polyline[1].dxf.handle
+        vertices = self.polyline.vertex_array()
+        vertices.delete(1)
+        vertices.flush()
+        self.assertFalse(handle in self.dwg.entitydb)
+        self.assertEqual(2, len(self.polyline))
+        with self.assertRaises(ValueError):
+            vertices.delete(0, 3)
+
+    def test_modify_existing_vertex(self):
+        handle = self.polyline[1].dxf.handle
+        vertices = self.polyline.vertex_array()
+        vertices[1] = (5, 6, 7)
+        vertices.set_attrib(1, 'bulge', 0.5)
+        vertices.flush()
+        vertex = self.polyline[1]
+        self.assertEqual(handle, vertex.dxf.handle)
+        self.assertEqual((5., 6., 7.), vertex.dxf.location)
+        self.assertEqual(0.5, vertex.dxf.bulge)
+        with self.assertRaises(ValueError):
+            vertices.set_attrib(1, 'layer', 'X')
+
+    def test_flush_on_write(self):
+        vertices = self.polyline.vertex_array()
+        vertices.append([(3, 3, 3)])
+        self.assertTrue(vertices is self.polyline.vertex_array())  # registered pending changes
+        self.dwg.write(StringIO())
+        self.assertEqual(0, len(self.dwg.vertex_arrays))
+        self.assertEqual(4, len(self.locations()))
+        self.assertEqual(4, len(vertices))  # reloaded
+
+    def test_reload_after_polyline_changes(self):
+        vertices = self.polyline.vertex_array()
+        self.assertEqual(3, len(vertices))  # loaded but unmodified
+        self.polyline.append_vertices([(3, 3, 3), (4, 4, 4)])
+        vertices[0] = (9, 9, 9)
+        self.assertEqual(5, len(vertices))
+        self.assertEqual(5, len(self.polyline))
+        self.assertEqual([(9., 9., 9.), (1., 1., 1.), (2., 2., 2.), (3., 3., 3.), (4., 4., 4.)], self.locations())
+
+    def test_one_loaded_vertex_array_per_polyline(self):
+        vertices1 = self.polyline.vertex_array()
+        vertices2 = self.polyline.vertex_array()
+        vertices1.append([(3, 3, 3)])
+        self.assertEqual(4, len(vertices2))  # flushes the changes of vertices1
+        vertices2.append([(4, 4, 4)])
+        self.assertEqual(5, len(vertices1))
+        self.assertEqual(5, len(self.locations()))
+
+
+class TestVertexArrayAC1015(TestVertexArrayAC1009):
+    DXFVERSION = 'AC1015'
+
+    def test_new_vertex_subclass(self):
+        vertices = self.polyline.vertex_array()
+        vertices.append([(3, 3, 3)], dxfattribs={'layer': 'VERTICES'})
+        vertex = self.polyline[3]
+        self.assertEqual('AcDb3dPolylineVertex', vertex.tags.subclasses[3][0].value)
+        self.assertEqual('VERTICES', vertex.dxf.layer)
+        self.assertEqual(self.polyline.dxf.owner, vertex.dxf.owner)
+
+
+if __name__ == '__main__':
+    unittest.main()
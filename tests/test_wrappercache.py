@@ -0,0 +1,87 @@
+# Purpose: test identity map of wrapped DXF entities
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+from __future__ import unicode_literals
+
+import unittest
+import gc
+
+import ezdxf
+from ezdxf.wrappercache import WrapperCache
+
+
+class Wrapper(object):
+    def __init__(self, tags):
+        self.tags = tags
+
+
+class TestWrapperCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = WrapperCache()
+        tags = object()
+        self.assertIsNone(cache.get('FF', tags))
+        entity = Wrapper(tags)
+        cache.put('FF', entity)
+        self.assertIs(entity, cache.get('FF', tags))
+        self.assertEqual((1, 1, 1), tuple(cache.info()))
+
+    def test_replaced_tags(self):
+        cache = WrapperCache()
+        wrapper = Wrapper(object())
+        cache.put('FF', wrapper)
+        self.assertIsNone(cache.get('FF', object()))
+
+    def test_unused_wrappers_are_released(self):
+        cache = WrapperCache()
+        wrappers = [Wrapper(object()) for _ in range(3)]
+        for handle, wrapper in zip('ABC', wrappers):
+            cache.put(handle, wrapper)
+        del wrappers[1]
+        gc.collect()  # not required by CPython
+        self.assertTrue('A' in cache)
+        self.assertFalse('B' in cache)
+        self.assertEqual(2, len(cache))
+
+    def test_disabled(self):
+        cache = WrapperCache(enabled=False)
+        wrapper = Wrapper(object())
+        cache.put('A', wrapper)
+        self.assertEqual(0, len(cache))
+
+
+class TestFactoryWrapperCache(unittest.TestCase):
+    def setUp(self):
+        self.dwg = ezdxf.new('AC1015')
+        self.msp = self.dwg.modelspace()
+
+    def test_same_wrapper(self):
+        handle = self.msp.add_line((0, 0), (1, 0)).dxf.handle
+        factory = self.dwg.dxffactory
+        self.assertIs(factory.wrap_handle(handle), factory.wrap_handle(handle))
+        self.assertIs(factory.wrap_handle(handle), self.msp.query('LINE')[0])
+        self.assertTrue(factory.wrapper_cache.hits > 0)
+
+    def test_delete_handle_invalidates_cache(self):
+        handle = self.msp.add_line((0, 0), (1, 0)).dxf.handle
+        factory = self.dwg.dxffactory
+        line = factory.wrap_handle(handle)
+        self.assertTrue(handle in factory.wrapper_cache)
+        self.dwg.entitydb.delete_handle(handle)
+        self.assertFalse(handle in factory.wrapper_cache)
+
+    def test_polyline_cast_invalidates_cache(self):
+        polyface = self.msp.add_polyface()
+        handle = polyface.dxf.handle
+        factory = self.dwg.dxffactory
+        wrapper = factory.wrapper_cache
+        wrapper.put(handle, factory.ENTITY_WRAPPERS['POLYLINE'](polyface.tags, self.dwg))
+        entity = wrapper.get(handle, polyface.tags)
+        entity.cast()
+        self.assertFalse(handle in wrapper)
+        self.assertEqual('AcDbPolyFaceMesh', factory.wrap_handle(handle).get_mode())
+        self.assertTrue(hasattr(factory.wrap_handle(handle), 'append_face'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Author:  mozman -- <mozman@gmx.at>
+# Purpose: memory benchmark for hex string handles against integer handles
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+#
+# usage: python bench_handle_memory.py [handle count, default=10000000]
+#
+# Builds the handle related structures of a drawing with *count* entities: the handle tag (code 5) of each entity,
+# the entity database (handle -> tags), the entity space (ordered set of handles with DXF type index) and the link
+# chain, and measures the memory usage and the lookup time for three handle representations:
+#
+#   - hex strings: all structures share the str object of the handle tag
+#   - integers: handle tags store int objects, hex strings only at the DXF read/write boundary
+#   - integer keys: the current implementation, handle tags store hex strings, the database, entity space and link
+#     chain store int objects
+#
+# Each representation is measured in a new process by the resident set size (Linux only).
+from __future__ import print_function
+
+import sys
+import os
+import time
+from multiprocessing import Pool
+
+from ezdxf.tags import DXFTag
+from ezdxf.c23 import ordered_dict
+
+FIRST_HANDLE = 0x100
+
+
+def hex_handles(count):
+    return ['%X' % handle for handle in range(FIRST_HANDLE, FIRST_HANDLE + count)]
+
+
+def int_handles(count):
+    return [handle for handle in range(FIRST_HANDLE, FIRST_HANDLE + count)]
+
+
+def build(handles, tag_values):
+    database = {}
+    entity_space = ordered_dict()
+    type_index = set()
+    links = []  # stands for the ClassifiedTags.link slots, each entity links the following entity
+    for handle, tag_value in zip(handles, tag_values):
+        database[handle] = DXFTag(5, tag_value)  # handle tag stands for the entity tags
+        entity_space[handle] = 'LINE'
+        type_index.add(handle)
+        links.append(handle)
+    return database, entity_space, type_index, links
+
+
+def rss():
+    with open('/proc/self/statm') as fp:
+        return int(fp.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def measure(args):
+    name, count = args
+    start_rss = rss()
+    if name == 'hex strings':
+        handles = hex_handles(count)
+        tag_values = handles
+    elif name == 'integers':
+        handles = int_handles(count)
+        tag_values = handles
+    else:  # integer keys
+        handles = int_handles(count)
+        tag_values = hex_handles(count)
+    structures = build(handles, tag_values)
+    del handles, tag_values  # only references of the structures remain
+    memory = rss() - start_rss
+
+    database = structures[0]
+    keys = list(database.keys())
+    t0 = time.time()
+    for handle in keys:
+        database[handle]
+    lookup_time = time.time() - t0
+    return memory, lookup_time
+
+
+def main(count):
+    names = ('hex strings', 'integers', 'integer keys')
+    print("{} handles, last handle: {:X}".format(count, FIRST_HANDLE + count - 1))
+    pool = Pool(1, maxtasksperchild=1)  # new process for each measurement
+    try:
+        results = pool.map(measure, [(name, count) for name in names], chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    base_memory = results[0][0]
+    for name, (memory, lookup_time) in zip(names, results):
+        print("{}: {:.0f} MB, {:.1f} bytes per handle ({:+.1f}), {:.2f}s for {} lookups".format(
+            name, memory / 1e6, float(memory) / count, float(memory - base_memory) / count, lookup_time, count))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000000)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Author:  mozman -- <mozman@gmx.at>
+# Purpose: benchmark for the import time of ezdxf
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+#
+# usage: python bench_import_time.py [runs, default=10] [count of listed modules, default=15]
+#
+# Imports ezdxf in new interpreter processes with 'python -X importtime' (Python 3.7+) and reports the fastest
+# cumulative import time of ezdxf and the modules with the largest self import time of the fastest run.
+# The import time budget enforced by the test suite is defined in tests/test_import_time.py.
+from __future__ import print_function
+
+import sys
+import os
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module='ezdxf'):
+    """ Returns the cumulative import time of *module* in seconds and a list of (self time, module name) tuples.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.check_output([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                                     stderr=subprocess.STDOUT, env=env).decode('utf-8')
+    modules = []
+    cumulative = 0.
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative_time, name = line[len('import time:'):].split('|')
+        modules.append((int(self_time) / 1e6, name.strip()))
+        if name.strip() == module:
+            cumulative = int(cumulative_time) / 1e6
+    return cumulative, modules
+
+
+def main(runs, count):
+    if sys.version_info[:2] < (3, 7):
+        print("'python -X importtime' requires Python 3.7 or later.")
+        return
+    results = sorted(import_time() for _ in range(runs))
+    seconds, modules = results[0]
+    print("import ezdxf: {:.1f}ms (fastest of {} runs)".format(seconds * 1000., runs))
+    for self_time, name in sorted(modules, reverse=True)[:count]:
+        print("{:8.2f}ms  {}".format(self_time * 1000., name))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 15)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Author:  mozman -- <mozman@gmx.at>
+# Purpose: benchmark for loading DXF files by a pool of worker processes
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+#
+# usage: python bench_parallel_load.py [entity count, default=200000] [max workers, default=cpu count]
+#
+# Writes a synthetic DXF file with LINE entities and measures the load time of ezdxf.readfile() for an increasing
+# count of worker processes.
+from __future__ import print_function
+
+import sys
+import os
+import time
+import tempfile
+import multiprocessing
+
+import ezdxf
+
+
+def create_dxf_file(filename, count):
+    writer = ezdxf.streamwriter(filename, 'AC1015')
+    with writer as msp:
+        for x in range(count):
+            msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+
+
+def measure(filename, workers):
+    start = time.time()
+    dwg = ezdxf.readfile(filename, workers=workers)
+    seconds = time.time() - start
+    return seconds, len(dwg.entitydb)
+
+
+def main(count, max_workers):
+    fd, filename = tempfile.mkstemp(suffix='.dxf')
+    os.close(fd)
+    try:
+        create_dxf_file(filename, count)
+        print("synthetic DXF file: {} LINE entities, {:.1f} MB".format(count, os.path.getsize(filename) / 1e6))
+        base, size = measure(filename, 1)
+        print("workers= 1: {:.2f}s, {} database entries".format(base, size))
+        workers = 2
+        while workers <= max_workers:
+            seconds, size = measure(filename, workers)
+            print("workers={:2d}: {:.2f}s, speedup {:.2f}x".format(workers, seconds, base / seconds))
+            workers *= 2
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count())
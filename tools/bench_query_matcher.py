@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Author:  mozman -- <mozman@gmx.at>
+# Purpose: benchmark for cached and compiled entity query matchers
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+#
+# usage: python bench_query_matcher.py [query]
+#
+# Compares parsing a query against the cached matcher of ezdxf.query.entity_matcher(), and the evaluation of a
+# bool expression by BoolExpression.evaluate() against the compiled function of BoolExpression.compile().
+from __future__ import print_function
+
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ezdxf
+from ezdxf.query import entity_matcher, compile_entity_matcher, BoolExpression, _compile_tokens
+from ezdxf.queryparser import EntityQueryParser
+
+QUERY = '*[!(layer=="construction" & color<7) | layer ? "lay_.*"]'
+
+
+def best_time(func, number):
+    """ Returns the best time of one call of *func* in seconds. """
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main(query):
+    dwg = ezdxf.new('AC1015')
+    entity = dwg.modelspace().add_line((0, 0), (10, 0), {'layer': 'lay_lines', 'color': 7})
+
+    entity_matcher(query)
+    parse = best_time(lambda: compile_entity_matcher(query), number=20)
+    cached = best_time(lambda: entity_matcher(query), number=1000)
+    print("query: {}".format(query))
+    print("parse and compile matcher: {:10.2f}us".format(parse * 1e6))
+    print("cached matcher:            {:10.2f}us ({:.0f}x faster)".format(cached * 1e6, parse / cached))
+
+    query_args = EntityQueryParser.parseString(query, parseAll=True)
+    expr = BoolExpression(_compile_tokens(query_args.AttribQuery, False))
+    compiled = expr.compile()
+    evaluate_time = best_time(lambda: expr.evaluate(entity), number=1000)
+    compiled_time = best_time(lambda: compiled(entity), number=1000)
+    print("BoolExpression.evaluate(): {:10.2f}us".format(evaluate_time * 1e6))
+    print("compiled expression:       {:10.2f}us ({:.1f}x faster)".format(
+        compiled_time * 1e6, evaluate_time / compiled_time))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else QUERY)
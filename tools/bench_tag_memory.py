@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#coding:utf-8
+# Author:  mozman -- <mozman@gmx.at>
+# Purpose: memory benchmark for DXFTag()
+# Created: 18.10.2026
+# Copyright (C) 2026, Manfred Moitzi
+# License: MIT License
+#
+# usage: python bench_tag_memory.py [entity count, default=1000000]
+#
+# Reads a synthetic DXF file with LINE entities and compares the memory used by DXFTag() objects against the
+# former DXFTag() class with a per-instance __dict__.
+from __future__ import print_function
+
+import sys
+import gc
+import tracemalloc
+from io import StringIO
+
+from ezdxf.tags import BufferedTagIterator
+from ezdxf import dxftag
+
+LINE = """  0
+LINE
+  5
+{handle:X}
+  8
+0
+ 10
+{x}.0
+ 20
+0.0
+ 30
+0.0
+ 11
+{x}.0
+ 21
+1.0
+ 31
+0.0
+"""
+
+
+class DictDXFTag(object):
+    """ DXFTag() implementation until v0.7.0 """
+    def __init__(self, code, value):
+        self.code = code
+        self.value = value
+
+    def __getitem__(self, item):
+        return (self.code, self.value)[item]
+
+
+def synthetic_dxf(count):
+    lines = ["  0\nSECTION\n  2\nENTITIES\n"]
+    lines.extend(LINE.format(handle=handle, x=handle) for handle in range(256, 256 + count))
+    lines.append("  0\nENDSEC\n  0\nEOF\n")
+    return "".join(lines)
+
+
+def measure(text, tag_class):
+    def cast_tag(tag, types=dxftag.TYPE_TABLE):
+        return tag_class(tag[0], types.get(tag[0], dxftag.ustr)(tag[1]))
+
+    original_cast_tag = dxftag.cast_tag
+    import ezdxf.tags
+    ezdxf.tags.cast_tag = cast_tag
+    try:
+        gc.collect()
+        tracemalloc.start()
+        tags = list(BufferedTagIterator(StringIO(text)))
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    finally:
+        ezdxf.tags.cast_tag = original_cast_tag
+    return len(tags), memory
+
+
+def main(count):
+    text = synthetic_dxf(count)
+    print("synthetic DXF file: {} LINE entities, {} chars".format(count, len(text)))
+    results = []
+    for name, tag_class in (('DXFTag() with __dict__', DictDXFTag), ('DXFTag() tuple', dxftag.DXFTag)):
+        tag_count, memory = measure(text, tag_class)
+        results.append(memory)
+        print("{}: {} tags, {:.1f} MB, {:.1f} bytes per tag".format(name, tag_count, memory / 1e6,
+                                                                    float(memory) / tag_count))
+    print("saving: {:.1f} bytes per tag, {:.0f}%".format(
+        float(results[0] - results[1]) / tag_count, 100. * (results[0] - results[1]) / results[0]))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)